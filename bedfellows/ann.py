@@ -0,0 +1,376 @@
+"""
+Approximate nearest-neighbour index for pair similarity.
+
+An exact pair query scores every pair in final_scores. The inverted-file
+(IVF) index here clusters the unit-length pair vectors with spherical
+k-means and keeps one list of pairs per centroid; a query only scores the
+pairs in the lists of its few nearest centroids.
+
+The index holds everything a query needs (committee ids, pair vectors and
+lists) and is saved as a ``.npz`` file next to the database, so
+``bedfellows similar pair --approx`` answers without reading final_scores.
+It records the state of final_scores it was built from and is rebuilt when
+that no longer matches.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+from peewee import Database
+
+from bedfellows.similarity import SCORE_COLUMNS, normalize_rows, top_k
+
+logger = logging.getLogger(__name__)
+
+# Rows per chunk when assigning pairs to lists or reading final_scores
+CHUNK_ROWS = 100000
+
+
+def ann_index_path(config: Any) -> Path:
+    """
+    Where the pair index for a configured database is saved.
+
+    Args:
+        config: Config
+
+    Returns:
+        ``<sqlite file>.ann.npz`` beside a SQLite database, otherwise
+        ``<database name>.ann.npz`` in the data directory
+    """
+    db_config = config.get_database_config()
+    if db_config["type"] == "sqlite":
+        return Path(db_config["database"]).with_suffix(".ann.npz")
+    return Path(config["data_dir"]) / f"{db_config['database']}.ann.npz"
+
+
+def final_scores_state(db: Database, table: str = "final_scores") -> np.ndarray:
+    """Row count and highest id of a final scores table."""
+    count, max_id = db.execute_sql(f"SELECT COUNT(*), MAX(id) FROM {table}").fetchone()
+    return np.array([count, max_id or 0], dtype=np.int64)
+
+
+def spherical_kmeans(
+    vectors: np.ndarray, n_lists: int, iterations: int = 10, seed: int = 0
+) -> np.ndarray:
+    """
+    Unit-length centroids that maximize cosine similarity to their members.
+
+    Args:
+        vectors: Unit-length rows to cluster
+        n_lists: Number of centroids
+        iterations: Assignment/update rounds
+        seed: Random seed for the starting centroids
+
+    Returns:
+        n_lists x dimensions array of centroids
+    """
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.column_stack([
+            np.bincount(assign, vectors[:, column], minlength=n_lists)
+            for column in range(vectors.shape[1])
+        ])
+        # Lists that lost every member keep their old centroid
+        filled = np.bincount(assign, minlength=n_lists) > 0
+        centroids[filled] = normalize_rows(sums[filled])
+    return centroids
+
+
+class PairAnnIndex:
+    """IVF index over unit-length pair score vectors."""
+
+    def __init__(
+        self,
+        committees: np.ndarray,
+        pair_keys: np.ndarray,
+        vectors: np.ndarray,
+        centroids: np.ndarray,
+        order: np.ndarray,
+        offsets: np.ndarray,
+        state: Optional[np.ndarray] = None,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            committees: Sorted FEC ids; pairs refer to them by position
+            pair_keys: Sorted contributor position * len(committees) +
+                recipient position, one per pair
+            vectors: Unit-length score vector of each pair
+            centroids: Unit-length centroid of each list
+            order: Pair positions grouped by list
+            offsets: Start of each list in ``order``, plus the end
+            state: final_scores (count, max id) the index was built from
+        """
+        self.committees = committees
+        self.pair_keys = pair_keys
+        self.vectors = vectors
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+        self.state = state
+
+    def __len__(self) -> int:
+        return len(self.pair_keys)
+
+    @classmethod
+    def build(
+        cls,
+        contributor_ids: np.ndarray,
+        recipient_ids: np.ndarray,
+        vectors: np.ndarray,
+        n_lists: Optional[int] = None,
+        sample: int = 100000,
+        seed: int = 0,
+        state: Optional[np.ndarray] = None,
+    ) -> "PairAnnIndex":
+        """
+        Cluster pair vectors into lists.
+
+        Args:
+            contributor_ids: Contributor FEC id of each pair
+            recipient_ids: Recipient FEC id of each pair
+            vectors: Score vector of each pair (normalized here)
+            n_lists: Number of lists (default: square root of the pair count)
+            sample: Pairs k-means is trained on
+            seed: Random seed
+            state: final_scores (count, max id) being indexed
+
+        Returns:
+            The index
+        """
+        committees, codes = np.unique(
+            np.concatenate([contributor_ids, recipient_ids]).astype(str), return_inverse=True
+        )
+        n_pairs = len(contributor_ids)
+        keys = codes[:n_pairs].astype(np.int64) * len(committees) + codes[n_pairs:]
+        by_key = np.argsort(keys, kind="stable")
+        keys = keys[by_key]
+        vectors = normalize_rows(np.asarray(vectors, dtype=np.float64)[by_key]).astype(np.float32)
+
+        n_lists = max(1, min(n_lists or int(np.sqrt(n_pairs)), n_pairs))
+        rng = np.random.default_rng(seed)
+        training = vectors[rng.choice(n_pairs, min(n_pairs, sample), replace=False)]
+        centroids = spherical_kmeans(training, min(n_lists, len(training)), seed=seed)
+
+        lists = np.empty(n_pairs, dtype=np.int64)
+        for start in range(0, n_pairs, CHUNK_ROWS):
+            chunk = vectors[start:start + CHUNK_ROWS]
+            lists[start:start + CHUNK_ROWS] = np.argmax(chunk @ centroids.T, axis=1)
+        order = np.argsort(lists, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(lists, minlength=len(centroids)))])
+        logger.info(f"  Indexed {n_pairs:,} pairs in {len(centroids):,} lists")
+        return cls(committees, keys, vectors, centroids, order, offsets, state)
+
+    @classmethod
+    def from_database(
+        cls, db: Database, table: str = "final_scores", **options: Any
+    ) -> "PairAnnIndex":
+        """
+        Build the index from a final scores table.
+
+        Like the exact pair index, a pair filed under more than one name
+        keeps the highest of each score.
+
+        Args:
+            db: Database holding the table
+            table: final_scores, or another table with the same columns
+            **options: Passed to ``build``
+
+        Returns:
+            The index
+        """
+        state = final_scores_state(db, table)
+        columns = ", ".join(f"MAX({column})" for column in SCORE_COLUMNS)
+        cursor = db.execute_sql(f"""
+            SELECT fec_committee_id, other_id, {columns}
+            FROM {table}
+            GROUP BY fec_committee_id, other_id
+        """)
+        contributors: List[str] = []
+        recipients: List[str] = []
+        chunks = []
+        while True:
+            rows = cursor.fetchmany(CHUNK_ROWS)
+            if not rows:
+                break
+            contributor_ids, recipient_ids, *scores = zip(*rows, strict=True)
+            contributors.extend(contributor_ids)
+            recipients.extend(recipient_ids)
+            chunks.append(np.array(scores, dtype=np.float64).T)
+        if not chunks:
+            raise ValueError(f"No scores in {table}")
+        return cls.build(
+            np.array(contributors), np.array(recipients), np.vstack(chunks), state=state, **options
+        )
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Write the index to a ``.npz`` file.
+
+        Args:
+            path: File to write
+
+        Returns:
+            The path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                committees=self.committees,
+                pair_keys=self.pair_keys,
+                vectors=self.vectors,
+                centroids=self.centroids,
+                order=self.order,
+                offsets=self.offsets,
+                state=self.state if self.state is not None else np.zeros(2, dtype=np.int64),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PairAnnIndex":
+        """
+        Read an index written by ``save``.
+
+        Args:
+            path: File to read
+
+        Returns:
+            The index
+        """
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+    def is_current(self, db: Database, table: str = "final_scores") -> bool:
+        """Whether the table still has the row count and max id the index was built from."""
+        return self.state is not None and bool(
+            np.array_equal(self.state, final_scores_state(db, table))
+        )
+
+    def position(self, contributor_id: str, recipient_id: str) -> int:
+        """
+        Row of a pair.
+
+        Raises:
+            ValueError: If the pair has no scores
+        """
+        codes = np.searchsorted(self.committees, [contributor_id, recipient_id])
+        if all(
+            code < len(self.committees) and self.committees[code] == fecid
+            for code, fecid in zip(codes, (contributor_id, recipient_id), strict=True)
+        ):
+            key = codes[0] * len(self.committees) + codes[1]
+            position = int(np.searchsorted(self.pair_keys, key))
+            if position < len(self.pair_keys) and self.pair_keys[position] == key:
+                return position
+        raise ValueError(f"No scores for ({contributor_id!r}, {recipient_id!r})")
+
+    def pair(self, position: int) -> Tuple[str, str]:
+        """(contributor id, recipient id) of a row."""
+        contributor, recipient = divmod(int(self.pair_keys[position]), len(self.committees))
+        return str(self.committees[contributor]), str(self.committees[recipient])
+
+    def search(
+        self, contributor_id: str, recipient_id: str, k: int = 10, n_probe: int = 8
+    ) -> List[Tuple[Tuple[str, str], float]]:
+        """
+        Approximate k most similar pairs, from the lists of the nearest centroids.
+
+        Args:
+            contributor_id: Contributor FEC id of the query pair
+            recipient_id: Recipient FEC id of the query pair
+            k: Number of results
+            n_probe: Lists to search
+
+        Returns:
+            ((contributor id, recipient id), similarity) tuples, most similar first
+        """
+        position = self.position(contributor_id, recipient_id)
+        query = self.vectors[position]
+        probe = top_k(self.centroids @ query, n_probe)
+        candidates = np.concatenate(
+            [self.order[self.offsets[i]:self.offsets[i + 1]] for i in probe]
+        )
+        scores = self.vectors[candidates] @ query
+        self_match = np.flatnonzero(candidates == position)
+        best = top_k(scores, k, exclude=self_match[0] if len(self_match) else None)
+        return [(self.pair(candidates[i]), float(scores[i])) for i in best]
+
+    def exact(
+        self, contributor_id: str, recipient_id: str, k: int = 10
+    ) -> List[Tuple[Tuple[str, str], float]]:
+        """
+        Exact k most similar pairs, scoring every pair in the index.
+
+        Args:
+            contributor_id: Contributor FEC id of the query pair
+            recipient_id: Recipient FEC id of the query pair
+            k: Number of results
+
+        Returns:
+            ((contributor id, recipient id), similarity) tuples, most similar first
+        """
+        position = self.position(contributor_id, recipient_id)
+        scores = self.vectors @ self.vectors[position]
+        best = top_k(scores, k, exclude=position)
+        return [(self.pair(i), float(scores[i])) for i in best]
+
+
+def pair_names(
+    db: Database, pairs: List[Tuple[str, str]], table: str = "final_scores"
+) -> List[str]:
+    """
+    Display names of pairs, read from the final scores table.
+
+    Args:
+        db: Database holding the table
+        pairs: (contributor id, recipient id) tuples
+        table: final_scores, or another table with the same columns
+
+    Returns:
+        "contributor → recipient" name of each pair
+    """
+    if not pairs:
+        return []
+    unique = list(dict.fromkeys(pairs))
+    param = db.param
+    matches = " OR ".join(
+        [f"(fec_committee_id = {param} AND other_id = {param})"] * len(unique)
+    )
+    cursor = db.execute_sql(
+        f"""
+        SELECT fec_committee_id, other_id, MAX(contributor_name), MAX(recipient_name)
+        FROM {table}
+        WHERE {matches}
+        GROUP BY fec_committee_id, other_id
+        """,
+        [fecid for pair in unique for fecid in pair],
+    )
+    found = {(row[0], row[1]): (row[2], row[3]) for row in cursor.fetchall()}
+    names = []
+    for pair in pairs:
+        contributor_name, recipient_name = found.get(pair, (None, None))
+        names.append(f"{contributor_name or ''} → {recipient_name or ''}")
+    return names
+
+
+def recall(approximate: List[Tuple[Any, float]], exact: List[Tuple[Any, float]]) -> float:
+    """
+    Share of the exact results the approximate search also found.
+
+    Ties at the exact results' lowest similarity count as found, since
+    either pair is a correct answer.
+    """
+    if not exact:
+        return 1.0
+    # Scores are float32 dot products, which differ in the last bits between paths
+    cutoff = exact[-1][1] - 1e-6
+    exact_keys = {key for key, _ in exact}
+    found = sum(1 for key, score in approximate if key in exact_keys or score >= cutoff)
+    return min(found, len(exact)) / len(exact)
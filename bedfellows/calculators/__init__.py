@@ -5,6 +5,8 @@ Computes relationship scores between PAC donors and recipients.
 """
 
 from bedfellows.calculators.base import BaseCalculator
+from bedfellows.calculators.by_cycle import ByCycleCalculator
+from bedfellows.calculators.numpy_engine import NumpyCalculator
 from bedfellows.calculators.overall import OverallCalculator
 
-__all__ = ["BaseCalculator", "OverallCalculator"]
+__all__ = ["BaseCalculator", "ByCycleCalculator", "NumpyCalculator", "OverallCalculator"]
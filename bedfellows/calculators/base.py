@@ -1,16 +1,79 @@
 """Base calculator class for score computation."""
 
+import hashlib
+import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from pathlib import Path
 
-from peewee import Database
-from tqdm import tqdm
+from peewee import Database, MySQLDatabase, SqliteDatabase
+
+from bedfellows.calculators.dialect import get_dialect
+from bedfellows.models import StageFingerprints
 
 logger = logging.getLogger(__name__)
 
 
+class Step:
+    """A calculator step and the tables it reads and writes."""
+
+    def __init__(
+        self,
+        name: str,
+        func,
+        message: Optional[str] = None,
+        inputs: Iterable[str] = (),
+        outputs: Iterable[str] = (),
+        files: Iterable[Path] = (),
+        params: Optional[Dict[str, Any]] = None,
+        cacheable: bool = False,
+    ):
+        """
+        Initialize step.
+
+        Args:
+            name: Step name, used for timings
+            func: Callable that runs the step
+            message: Progress message (None if the step logs its own)
+            inputs: Tables the step reads
+            outputs: Tables the step (re)creates or writes
+            files: Reference files the step reads (part of its fingerprint)
+            params: Settings the step's results depend on (part of its fingerprint)
+            cacheable: Skip the step when its fingerprint matches the last run
+        """
+        self.name = name
+        self.func = func
+        self.message = message
+        self.inputs = set(inputs)
+        self.outputs = set(outputs)
+        self.files = [Path(path) for path in files]
+        self.params = params or {}
+        self.cacheable = cacheable
+
+    def depends_on(self, other: "Step") -> bool:
+        """
+        Check whether this step has to wait for an earlier step.
+
+        It does if the earlier step writes a table this one reads or writes,
+        or reads a table this one writes.
+
+        Args:
+            other: Step declared before this one
+
+        Returns:
+            True if the steps can't run at the same time
+        """
+        return bool(other.outputs & (self.inputs | self.outputs) or other.inputs & self.outputs)
+
+    def __repr__(self) -> str:
+        return f"<Step {self.name}>"
+
+
 class BaseCalculator(ABC):
     """Base class for score calculators."""
 
@@ -24,6 +87,20 @@ class BaseCalculator(ABC):
         """
         self.db = database
         self.config = config or {}
+        self.dialect = get_dialect(database)
+        self.dialect.register_functions(database)
+        # Reference CSVs (report_types.csv, limits.csv, score_weights.csv)
+        self.csv_dir = Path(self.config.get("csv_dir", "data/csv"))
+        # Seconds spent in each step of the last run, in run order
+        self.step_timings: Dict[str, float] = {}
+        # (seconds, step names) of the longest dependency chain of the last run
+        self.critical_path: Optional[Tuple[float, List[str]]] = None
+        # Rebuild cacheable steps even when their inputs haven't changed
+        self.force = self.config.get("force", False)
+        # Cacheable steps skipped in the last run because they were up to date
+        self.skipped_steps: List[str] = []
+        self._ran_steps: set = set()
+        self._dependencies: Dict[str, List[str]] = {}
         self.weights = self.config.get("weights", {
             "exclusivity": 1.0,
             "report_type": 1.0,
@@ -67,6 +144,253 @@ class BaseCalculator(ABC):
         logger.info(f"[{step}/{total}] {message}")
         print(f"[{step}/{total}] {message}")
 
+    @contextmanager
+    def timed_step(self, name: str) -> Iterator[None]:
+        """
+        Time a computation step and record it in ``step_timings``.
+
+        Args:
+            name: Step name
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.step_timings[name] = elapsed
+            logger.info(f"  {name} took {elapsed:.2f}s")
+
+    def run_steps(self, steps: List[Step], workers: Optional[int] = None) -> None:
+        """
+        Run steps in dependency order, independent ones concurrently.
+
+        A step waits for every earlier step it depends on (see
+        ``Step.depends_on``). With more than one worker, steps run in threads;
+        Peewee gives each thread its own connection, closed when the step
+        ends. SQLite allows a single writer and every step writes, so SQLite
+        databases always run the steps one at a time, in declared order.
+
+        Cacheable steps are skipped when their fingerprint matches the one
+        stored after their last run, none of the cacheable steps they depend
+        on ran, and their output tables exist (see ``is_up_to_date``).
+
+        Args:
+            steps: Steps in declared order
+            workers: Steps run at once (default: ``step_workers`` from config)
+        """
+        workers = workers or self.config.get("step_workers", 1)
+        dependencies = {
+            step.name: [earlier.name for earlier in steps[:index] if step.depends_on(earlier)]
+            for index, step in enumerate(steps)
+        }
+        if workers > 1 and isinstance(self.db, SqliteDatabase):
+            logger.info("SQLite has a single writer; running steps one at a time")
+            workers = 1
+
+        self._dependencies = dependencies
+        self._ran_steps = set()
+        self.skipped_steps = []
+        if any(step.cacheable for step in steps):
+            self.db.create_tables([StageFingerprints])
+
+        numbers = {step.name: number for number, step in enumerate(steps, 1)}
+        if workers <= 1:
+            for step in steps:
+                self._run_step(step, numbers[step.name], len(steps))
+        else:
+            pending = list(steps)
+            running = {}
+            done = set()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                while pending or running:
+                    for step in [s for s in pending if set(dependencies[s.name]) <= done]:
+                        pending.remove(step)
+                        future = pool.submit(
+                            self._run_step_in_thread, step, numbers[step.name], len(steps)
+                        )
+                        running[future] = step
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+                        done.add(running.pop(future).name)
+
+            # Report in declared order rather than completion order
+            self.step_timings = {
+                step.name: self.step_timings[step.name]
+                for step in steps
+                if step.name in self.step_timings
+            }
+
+        self.critical_path = self._critical_path(steps, dependencies)
+
+    def _run_step(self, step: Step, number: int, total: int) -> None:
+        fingerprint = self.fingerprint(step) if step.cacheable else None
+        if fingerprint and self.is_up_to_date(step, fingerprint):
+            self.log_progress(f"{step.message or step.name}: up to date", number, total)
+            self.skipped_steps.append(step.name)
+            return
+
+        if step.message:
+            self.log_progress(step.message, number, total)
+        with self.timed_step(step.name):
+            step.func()
+
+        if fingerprint:
+            self._ran_steps.add(step.name)
+            self.save_fingerprint(step.name, fingerprint)
+
+    def _run_step_in_thread(self, step: Step, number: int, total: int) -> None:
+        try:
+            self._run_step(step, number, total)
+        finally:
+            self.db.close()
+
+    def table_state(self, table: str) -> Optional[List[Any]]:
+        """
+        Row count and highest primary key of a table.
+
+        Args:
+            table: Table name
+
+        Returns:
+            [count, max primary key], or None if the table doesn't exist
+        """
+        if not self.db.table_exists(table):
+            return None
+        keys = self.db.get_primary_keys(table)
+        max_key = f"MAX({keys[0]})" if len(keys) == 1 else "NULL"
+        count, max_id = self.db.execute_sql(f"SELECT COUNT(*), {max_key} FROM {table}").fetchone()
+        return [count, max_id]
+
+    def analyze_tables(self, tables: Iterable[str]) -> None:
+        """
+        Refresh planner statistics for tables this run just filled.
+
+        Without them SQLite can't tell a two-column pair index from a
+        covering index that only matches on the contributor, and joins
+        against the score tables degrade to per-contributor scans.
+
+        Args:
+            tables: Table names
+        """
+        for table in tables:
+            if isinstance(self.db, MySQLDatabase):
+                self.db.execute_sql(f"ANALYZE TABLE {table}").fetchall()
+            else:
+                self.db.execute_sql(f"ANALYZE {table}")
+
+    def fingerprint(self, step: Step) -> str:
+        """
+        Fingerprint a step's inputs: input table states, file hashes and params.
+
+        Args:
+            step: Step to fingerprint
+
+        Returns:
+            SHA-256 hex digest
+        """
+        files = {}
+        for path in step.files:
+            files[path.name] = (
+                hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+            )
+        state = {
+            "inputs": {table: self.table_state(table) for table in sorted(step.inputs)},
+            "files": files,
+            "params": step.params,
+        }
+        return hashlib.sha256(
+            json.dumps(state, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def is_up_to_date(self, step: Step, fingerprint: str) -> bool:
+        """
+        Check whether a cacheable step's outputs already reflect its inputs.
+
+        Args:
+            step: Step to check
+            fingerprint: The step's current fingerprint
+
+        Returns:
+            True if the step can be skipped
+        """
+        if self.force:
+            return False
+        if self._ran_steps.intersection(self._dependencies.get(step.name, [])):
+            return False
+        if not all(self.db.table_exists(table) for table in step.outputs):
+            return False
+        stored = StageFingerprints.get_or_none(StageFingerprints.stage == step.name)
+        return stored is not None and stored.fingerprint == fingerprint
+
+    def save_fingerprint(self, stage: str, fingerprint: str) -> None:
+        """
+        Record the fingerprint a stage's outputs were computed from.
+
+        Args:
+            stage: Step name
+            fingerprint: Fingerprint from ``fingerprint``
+        """
+        with self.db.atomic():
+            StageFingerprints.delete().where(StageFingerprints.stage == stage).execute()
+            StageFingerprints.create(
+                stage=stage, fingerprint=fingerprint, computed_at=datetime.now()
+            )
+
+    def clear_fingerprints(self, stages: Optional[List[str]] = None) -> None:
+        """
+        Forget stored fingerprints so the stages rebuild on their next run.
+
+        Args:
+            stages: Step names (None = all)
+        """
+        self.db.create_tables([StageFingerprints])
+        query = StageFingerprints.delete()
+        if stages is not None:
+            query = query.where(StageFingerprints.stage.in_(stages))
+        query.execute()
+
+    def _critical_path(
+        self, steps: List[Step], dependencies: Dict[str, List[str]]
+    ) -> Tuple[float, List[str]]:
+        """Longest chain of dependent steps, weighted by their timings."""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for step in steps:
+            before = max(dependencies[step.name], key=finish.get, default=None)
+            previous[step.name] = before
+            finish[step.name] = self.step_timings.get(step.name, 0.0) + (
+                finish[before] if before else 0.0
+            )
+
+        name = max(finish, key=finish.get, default=None)
+        path = []
+        while name:
+            path.append(name)
+            name = previous[name]
+        return (finish[path[0]] if path else 0.0), path[::-1]
+
+    def log_step_timings(self) -> None:
+        """Log and print the time spent in each step and its share of the total."""
+        total = sum(self.step_timings.values()) or 1.0
+
+        print("\n⏱  Step timings:")
+        for name, elapsed in self.step_timings.items():
+            line = f"{name:<20s} {elapsed:8.2f}s {elapsed / total:6.1%}"
+            logger.info(line)
+            print(f"   {line}")
+
+        if self.skipped_steps:
+            line = f"{'up to date':<20s} {', '.join(self.skipped_steps)}"
+            logger.info(line)
+            print(f"   {line}")
+
+        if self.critical_path:
+            elapsed, path = self.critical_path
+            line = f"{'critical path':<20s} {elapsed:8.2f}s ({' → '.join(path)})"
+            logger.info(line)
+            print(f"   {line}")
+
     def execute_with_progress(self, func, description: str):
         """
         Execute function with progress logging.
@@ -0,0 +1,322 @@
+"""
+By-cycle score calculator.
+
+Computes relationship scores separately for each election cycle. Cycles are
+independent, so each one runs in its own worker process: the worker opens
+its own connection to the source database, copies its cycle's slice into a
+private SQLite file, runs the overall calculation there and hands the file
+back to be merged into ``cycle_final_scores``.
+"""
+
+import logging
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from peewee import Database, SqliteDatabase
+
+from bedfellows.calculators.base import BaseCalculator
+from bedfellows.calculators.numpy_engine import NumpyCalculator
+from bedfellows.calculators.overall import OverallCalculator
+from bedfellows.loaders.base import chunked
+from bedfellows.models import (
+    CommitteeDim,
+    ComputeState,
+    CycleFinalScores,
+    FecCandidates,
+    FecCommittees,
+    FecContributions,
+    FinalScores,
+    create_all_tables,
+    init_models,
+)
+
+logger = logging.getLogger(__name__)
+
+# (database class, database name, connect params): enough to reconnect in a worker
+DatabaseSpec = Tuple[type, str, Dict[str, Any]]
+
+
+def database_spec(database: Database) -> Optional[DatabaseSpec]:
+    """
+    Describe a database so a worker process can open its own connection.
+
+    Args:
+        database: Peewee database instance
+
+    Returns:
+        Picklable connection spec, or None for in-memory SQLite databases
+    """
+    if isinstance(database, SqliteDatabase) and database.database in ("", ":memory:"):
+        return None
+    return (type(database), database.database, dict(database.connect_params))
+
+
+def _columns(model, primary_key: bool = False) -> List[str]:
+    pk = model._meta.primary_key.column_name
+    return [column for column in model._meta.columns if primary_key or column != pk]
+
+
+def _copy_rows(
+    source: Database,
+    target: Database,
+    model,
+    where: str = "",
+    params=(),
+    primary_key: bool = False,
+) -> int:
+    """Copy a model's table (or a filtered slice of it) between databases."""
+    columns = _columns(model, primary_key)
+    column_list = ", ".join(columns)
+    cursor = source.execute_sql(
+        f"SELECT {column_list} FROM {model._meta.table_name} {where}", params
+    )
+    insert = (
+        f"INSERT INTO {model._meta.table_name} ({column_list}) "
+        f"VALUES ({', '.join(['?'] * len(columns))})"
+    )
+
+    count = 0
+    with target.atomic():
+        target_cursor = target.cursor()
+        while True:
+            rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+            target_cursor.executemany(insert, rows)
+            count += len(rows)
+    return count
+
+
+def copy_cycle(source: Database, target: Database, cycle: str) -> int:
+    """
+    Copy one cycle's contributions plus the committee and candidate tables.
+
+    committee_dim is copied with its keys, which the copied rows refer to.
+    Contributions are selected on their cycle column, which setup() has
+    filled for every dated row.
+
+    Args:
+        source: Database holding fec_contributions
+        target: Empty per-cycle database with all tables created
+        cycle: Cycle to copy, e.g. '2024'
+
+    Returns:
+        Number of contributions copied
+    """
+    _copy_rows(source, target, FecCommittees)
+    _copy_rows(source, target, FecCandidates)
+    _copy_rows(source, target, CommitteeDim, primary_key=True)
+
+    return _copy_rows(
+        source, target, FecContributions, f"WHERE cycle = {source.param}", (cycle,)
+    )
+
+
+def compute_cycle(
+    source: Any, cycle: str, work_dir: str, calc_config: Dict[str, Any]
+) -> Tuple[str, str, float]:
+    """
+    Compute all scores for one cycle in a private SQLite database.
+
+    Runs in a worker process, or in-process when ``source`` is a database.
+
+    Args:
+        source: Source database, or a spec from ``database_spec`` to reconnect
+        cycle: Cycle to compute
+        work_dir: Directory for the per-cycle database file
+        calc_config: Calculator configuration; ``engine`` "numpy" selects NumpyCalculator
+
+    Returns:
+        (cycle, path to the per-cycle database, seconds taken)
+    """
+    started = time.perf_counter()
+    if isinstance(source, tuple):
+        database_class, name, params = source
+        source = database_class(name, **params)
+
+    path = Path(work_dir) / f"cycle_{cycle}.db"
+    path.unlink(missing_ok=True)
+    target = SqliteDatabase(str(path), pragmas={"journal_mode": "off", "synchronous": 0})
+    init_models(target)
+    create_all_tables()
+
+    count = copy_cycle(source, target, cycle)
+    logger.info(f"Cycle {cycle}: computing scores for {count} contributions")
+    calculator_class = NumpyCalculator if calc_config.get("engine") == "numpy" else OverallCalculator
+    calculator_class(target, calc_config).compute_scores()
+    target.close()
+
+    return cycle, str(path), time.perf_counter() - started
+
+
+class ByCycleCalculator(BaseCalculator):
+    """Calculate relationship scores for each election cycle separately."""
+
+    def __init__(self, database, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize by-cycle calculator.
+
+        Args:
+            database: Peewee database instance
+            config: Optional configuration dictionary. Besides the overall
+                calculator options it accepts ``workers`` (processes, one
+                cycle each), ``cycles`` (subset to compute), ``work_dir``
+                (where per-cycle databases are written) and ``engine``
+                ("sql" or "numpy", the calculator run for each cycle)
+        """
+        super().__init__(database, config)
+        self.workers = self.config.get("workers", 1)
+
+    def setup(self) -> None:
+        """Make sure the filtered FecContributions table is populated and up to date."""
+        if FecContributions.select().count() == 0:
+            logger.info("FecContributions table is empty, loading from committee contributions...")
+            count = FecContributions.load_from_committee_contributions(
+                filters=self.config.get("filters")
+            )
+            logger.info(f"Loaded {count} filtered contributions")
+        else:
+            changed, added, rebuilt = FecContributions.sync_from_committee_contributions(
+                self.config.get("filters")
+            )
+            if changed or added or rebuilt:
+                # Overall scores no longer match fec_contributions, and the
+                # changes an incremental overall run would rescore are gone
+                self.clear_fingerprints()
+                self.db.create_tables([ComputeState])
+                ComputeState.delete().execute()
+            FecContributions.fill_derived_columns()
+
+    def get_cycles(self) -> List[str]:
+        """
+        List the cycles present in fec_contributions.
+
+        Returns:
+            Sorted cycle strings
+        """
+        cursor = self.db.execute_sql(
+            "SELECT DISTINCT cycle FROM fec_contributions WHERE cycle IS NOT NULL"
+        )
+        cycles = sorted(str(row[0]).strip() for row in cursor.fetchall())
+
+        wanted = self.config.get("cycles")
+        if wanted:
+            cycles = [c for c in cycles if c in {str(w) for w in wanted}]
+        return cycles
+
+    def compute_scores(self) -> None:
+        """Compute scores for every cycle and merge them into cycle_final_scores."""
+        self.step_timings = {}
+        with self.timed_step("setup"):
+            self.setup()
+            cycles = self.get_cycles()
+
+        self.db.drop_tables([CycleFinalScores], safe=True)
+        self.db.create_tables([CycleFinalScores])
+        if not cycles:
+            logger.warning("No cycles found in fec_contributions")
+            return
+
+        calc_config = {
+            "weights": self.weights,
+            "csv_dir": self.csv_dir,
+            "engine": self.config.get("engine", "sql"),
+        }
+        spec = database_spec(self.db)
+        workers = min(self.workers, len(cycles))
+        if workers > 1 and spec is None:
+            logger.warning("In-memory databases can't be shared with worker processes")
+            workers = 1
+
+        work_dir = self.config.get("work_dir")
+        with tempfile.TemporaryDirectory() as scratch:
+            work_dir = str(work_dir or scratch)
+            logger.info(f"Computing {len(cycles)} cycles with {workers} worker(s) in {work_dir}")
+
+            if workers > 1:
+                results = self._run_pool(spec, cycles, work_dir, calc_config, workers)
+            else:
+                results = self._run_serial(cycles, work_dir, calc_config)
+
+            with self.timed_step("merge"):
+                for cycle, path, _ in sorted(results):
+                    self.merge_cycle(cycle, path)
+
+        for cycle, _, elapsed in sorted(results):
+            self.step_timings[f"cycle {cycle}"] = elapsed
+
+        total = CycleFinalScores.select().count()
+        logger.info(f"Computed {total} scores across {len(cycles)} cycles")
+        print(f"\n✓ Computed scores for {len(cycles)} cycles")
+        self.log_step_timings()
+
+    def _run_pool(self, spec, cycles, work_dir, calc_config, workers) -> List[Tuple]:
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(compute_cycle, spec, cycle, work_dir, calc_config)
+                for cycle in cycles
+            ]
+            for step, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                self.log_progress(f"Computed cycle {result[0]}", step, len(cycles))
+                results.append(result)
+        return results
+
+    def _run_serial(self, cycles, work_dir, calc_config) -> List[Tuple]:
+        results = []
+        try:
+            for step, cycle in enumerate(cycles, 1):
+                self.log_progress(f"Computing cycle {cycle}", step, len(cycles))
+                results.append(compute_cycle(self.db, cycle, work_dir, calc_config))
+        finally:
+            # compute_cycle binds the models to the per-cycle database
+            init_models(self.db)
+        return results
+
+    def merge_cycle(self, cycle: str, path: str) -> int:
+        """
+        Copy one cycle's final scores into cycle_final_scores.
+
+        Args:
+            cycle: Cycle the scores belong to
+            path: Per-cycle database file
+
+        Returns:
+            Number of scores merged
+        """
+        columns = _columns(FinalScores)
+        fields = [CycleFinalScores._meta.columns[c] for c in columns] + [CycleFinalScores.cycle]
+        cycle_db = SqliteDatabase(path)
+        cursor = cycle_db.execute_sql(f"SELECT {', '.join(columns)} FROM final_scores")
+        rows = (tuple(row) + (cycle,) for row in cursor)
+
+        count = 0
+        with self.db.atomic():
+            for batch in chunked(rows, 500):
+                CycleFinalScores.insert_many(batch, fields=fields).execute()
+                count += len(batch)
+        cycle_db.close()
+        return count
+
+    def get_results(self, limit: Optional[int] = None):
+        """
+        Get by-cycle scores.
+
+        Args:
+            limit: Maximum number of results
+
+        Returns:
+            Query of cycle final scores, best first
+        """
+        query = CycleFinalScores.select().order_by(
+            CycleFinalScores.cycle, CycleFinalScores.final_score.desc()
+        )
+
+        if limit:
+            query = query.limit(limit)
+
+        return query
@@ -0,0 +1,105 @@
+"""
+SQL dialect helpers for score calculations.
+
+The scoring queries are plain SQL so they run inside the database. The few
+date and math functions they need differ between backends, so each backend
+supplies its own expression for them here.
+"""
+
+import math
+from typing import Optional
+
+from peewee import Database, MySQLDatabase, PostgresqlDatabase
+
+
+def _sqrt(value: Optional[float]) -> Optional[float]:
+    return math.sqrt(value) if value is not None else None
+
+
+class SqlDialect:
+    """SQL expressions shared by all backends (ANSI defaults)."""
+
+    def register_functions(self, database: Database) -> None:
+        """Install any SQL functions the backend lacks."""
+
+    def year(self, column: str) -> str:
+        """Integer calendar year of a date/datetime column."""
+        return f"CAST(EXTRACT(YEAR FROM {column}) AS INTEGER)"
+
+    def year_parity(self, column: str) -> str:
+        """'even' or 'odd' depending on the year of a date column."""
+        return f"CASE WHEN {self.year(column)} % 2 = 0 THEN 'even' ELSE 'odd' END"
+
+    def day_of_year(self, column: str) -> str:
+        """Integer day of the year (1-366) of a date column."""
+        return f"CAST(EXTRACT(DOY FROM {column}) AS INTEGER)"
+
+    def cycle(self, column: str) -> str:
+        """Two-year election cycle (as text, e.g. '2024') containing a date."""
+        year = self.year(column)
+        return f"CAST({year} + {year} % 2 AS CHAR(4))"
+
+    def days_between(self, later: str, earlier: str) -> str:
+        """Whole days from one date column to another, ignoring the time of day."""
+        return f"(CAST({later} AS DATE) - CAST({earlier} AS DATE))"
+
+    def same(self, left: str, right: str) -> str:
+        """Equality that also matches two NULLs (for joining on nullable names)."""
+        return f"{left} IS NOT DISTINCT FROM {right}"
+
+
+class SqliteDialect(SqlDialect):
+    """SQLite stores datetimes as ISO text, so dates go through strftime()."""
+
+    def register_functions(self, database: Database) -> None:
+        # SQRT is only built in when SQLite is compiled with math functions
+        database.register_function(_sqrt, "sqrt", 1)
+
+    def year(self, column: str) -> str:
+        return f"CAST(strftime('%Y', {column}) AS INTEGER)"
+
+    def day_of_year(self, column: str) -> str:
+        return f"CAST(strftime('%j', {column}) AS INTEGER)"
+
+    def days_between(self, later: str, earlier: str) -> str:
+        return f"CAST(julianday(date({later})) - julianday(date({earlier})) AS INTEGER)"
+
+    def same(self, left: str, right: str) -> str:
+        return f"{left} IS {right}"
+
+
+class MySQLDialect(SqlDialect):
+    """MySQL date functions."""
+
+    def year(self, column: str) -> str:
+        return f"YEAR({column})"
+
+    def day_of_year(self, column: str) -> str:
+        return f"DAYOFYEAR({column})"
+
+    def days_between(self, later: str, earlier: str) -> str:
+        return f"DATEDIFF({later}, {earlier})"
+
+    def same(self, left: str, right: str) -> str:
+        return f"{left} <=> {right}"
+
+
+class PostgresDialect(SqlDialect):
+    """PostgreSQL uses the ANSI EXTRACT forms."""
+
+
+def get_dialect(database: Database) -> SqlDialect:
+    """
+    Get the SQL dialect helper for a database.
+
+    Args:
+        database: Peewee database instance
+
+    Returns:
+        Dialect helper for the database's backend
+    """
+    if isinstance(database, MySQLDatabase):
+        return MySQLDialect()
+    if isinstance(database, PostgresqlDatabase):
+        return PostgresDialect()
+    return SqliteDialect()
@@ -0,0 +1,533 @@
+"""
+In-memory overall score calculator.
+
+Reads fec_contributions once into typed columns (integer-coded committee ids
+and names, day-precision datetime64 dates, float amounts) and computes the
+six component scores with grouped NumPy reductions instead of SQL
+round-trips. Only final_scores is written, in a single bulk load; the
+intermediate score tables the SQL calculator leaves behind are not.
+"""
+
+import csv
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from peewee import MySQLDatabase
+
+from bedfellows.calculators.base import Step
+from bedfellows.calculators.overall import NATIONAL_PARTY_IDS, OverallCalculator
+from bedfellows.loaders.base import chunked
+from bedfellows.loaders.bulk import bulk_loader_for
+from bedfellows.models import FinalScores
+
+logger = logging.getLogger(__name__)
+
+CONTRIBUTION_COLUMNS = [
+    "fec_committee_id",
+    "contributor_name",
+    "other_id",
+    "recipient_name",
+    "report_type",
+    "date",
+    "amount_cents",
+    "cycle",
+]
+
+CONTRIBUTOR_TYPES = ["national_party", "other_party", "multi_pac", "non_multi_pac"]
+RECIPIENT_TYPES = ["candidate", "national_party", "other_party", "pac"]
+
+
+def dense_ids(*keys: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Number each distinct combination of non-negative integer keys.
+
+    Args:
+        *keys: Equal-length integer arrays
+
+    Returns:
+        (group id per row, counting from 0, number of groups)
+    """
+    _, ids = np.unique(keys[0], return_inverse=True)
+    for key in keys[1:]:
+        combined = ids.astype(np.int64) * (int(key.max(initial=0)) + 1) + key
+        _, ids = np.unique(combined, return_inverse=True)
+    return ids, int(ids.max(initial=-1)) + 1
+
+
+def normalize(scores: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """
+    Divide scores by the highest present score (0 everywhere if it isn't positive).
+
+    Args:
+        scores: Unnormalized score per group
+        present: Groups that have a score at all
+
+    Returns:
+        Normalized scores, 0 for groups without one
+    """
+    top = scores[present].max(initial=0)
+    if top <= 0:
+        return np.zeros_like(scores)
+    return np.where(present, scores / top, 0.0)
+
+
+def committee_type(committee_type: Optional[str], fecid: str, recipient: bool) -> Optional[str]:
+    """
+    Classify a committee the way the SQL maxed-out step does.
+
+    Args:
+        committee_type: FEC committee type code
+        fecid: Committee FEC ID
+        recipient: Classify as a recipient instead of a contributor
+
+    Returns:
+        Contributor or recipient type, or None if the committee is excluded
+    """
+    if recipient and committee_type in ("H", "S", "P", "A", "B"):
+        return "candidate"
+    if committee_type in ("X", "Y"):
+        return "national_party" if fecid in NATIONAL_PARTY_IDS else "other_party"
+    if recipient:
+        return "pac" if committee_type in ("N", "Q", "F", "G") else None
+    if committee_type == "Q":
+        return "multi_pac"
+    return "non_multi_pac" if committee_type in ("N", "F") else None
+
+
+class NumpyCalculator(OverallCalculator):
+    """Calculate relationship scores across all election cycles in memory."""
+
+    def __init__(self, database, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize NumPy calculator.
+
+        Args:
+            database: Peewee database instance
+            config: Optional configuration dictionary
+        """
+        super().__init__(database, config)
+        self.total_steps = 9  # Setup + load + 6 score types + final
+        # Component scores per final_scores row, filled in by each step
+        self.scores: Dict[str, np.ndarray] = {}
+
+    def steps(self) -> List[Step]:
+        """
+        Calculation steps with the arrays each reads and writes.
+
+        Returns:
+            Steps in run order
+        """
+        components = [
+            ("exclusivity", self.compute_exclusivity_scores),
+            ("report_type", self.compute_report_type_scores),
+            ("periodicity", self.compute_periodicity_scores),
+            ("maxed_out", self.compute_maxed_out_scores),
+            ("length", self.compute_length_scores),
+            ("race_focus", self.compute_race_focus_scores),
+        ]
+        return [
+            Step("setup", self.setup, outputs=["fec_contributions"]),
+            Step(
+                "load",
+                self.load_contributions,
+                "Reading contributions",
+                inputs=["fec_contributions"],
+                outputs=["contributions"],
+            ),
+            *[
+                Step(
+                    name,
+                    func,
+                    f"Computing {name.replace('_', ' ')} scores",
+                    inputs=["contributions"],
+                    outputs=[name],
+                )
+                for name, func in components
+            ],
+            Step(
+                "final",
+                self.compute_final_scores,
+                "Computing final scores",
+                inputs=["contributions"] + [name for name, _ in components],
+                outputs=["final_scores"],
+            ),
+        ]
+
+    def compute_scores(self) -> None:
+        """Compute all six relationship scores and final scores."""
+        self.step_timings = {}
+        self.scores = {}
+        # The intermediate tables an incremental run builds on aren't written here,
+        # and the SQL final stage's cached fingerprint no longer describes final_scores
+        self.clear_state()
+        self.clear_fingerprints(["final"])
+
+        # The steps share arrays and mostly hold the GIL, so they run in turn
+        self.run_steps(self.steps(), workers=1)
+
+        print("\n✓ All scores computed successfully!")
+        self.log_step_timings()
+
+    def load_contributions(self) -> None:
+        """
+        Read fec_contributions into typed arrays and number pairs and groups.
+
+        A pair is a (contributor, recipient) combination; a group is a pair
+        plus the contributor and recipient names, which is what a row of
+        final_scores represents. Rows without both committee ids can't be
+        scored and are left out of both.
+        """
+        cursor = self.db.execute_sql(
+            f"SELECT {', '.join(CONTRIBUTION_COLUMNS)} FROM fec_contributions"
+        )
+        columns: List[list] = [[] for _ in CONTRIBUTION_COLUMNS]
+        while True:
+            rows = cursor.fetchmany(100000)
+            if not rows:
+                break
+            for values, column in zip(zip(*rows, strict=True), columns, strict=True):
+                column.extend(values)
+        data = dict(zip(CONTRIBUTION_COLUMNS, columns, strict=True))
+        n_rows = len(data["date"])
+
+        # Contributors and recipients share one code space; None codes as -1
+        codes, committee_ids = pd.factorize(
+            np.array(data["fec_committee_id"] + data["other_id"], dtype=object)
+        )
+        self.committee_ids = pd.Index(committee_ids)
+        self.contributor = codes[:n_rows]
+        self.recipient = codes[n_rows:]
+        self.contributor_name = np.array(data["contributor_name"], dtype=object)
+        self.recipient_name = np.array(data["recipient_name"], dtype=object)
+        self.report_type = np.array(data["report_type"], dtype=object)
+
+        dates = pd.to_datetime(pd.Series(data["date"], dtype=object), format="ISO8601")
+        self.date = dates.to_numpy(dtype="datetime64[D]")
+        self.has_date = ~np.isnat(self.date)
+        self.year = self.date.astype("datetime64[Y]").astype(np.int64) + 1970
+        cents = pd.Series(data["amount_cents"], dtype="Float64").fillna(0)
+        self.amount = cents.to_numpy(dtype=float) / 100
+
+        # Loaded cycle, or the two-year cycle the donation falls in
+        derived = (self.year + self.year % 2).astype(str).astype(object)
+        derived[~self.has_date] = None
+        loaded = np.array(data["cycle"], dtype=object)
+        cycle, cycles = pd.factorize(np.where(pd.isna(loaded), derived, loaded))
+        self.cycle, self.cycles = cycle, pd.Index(cycles)
+
+        # Pairs and final_scores groups over the scorable rows
+        self.valid = (self.contributor >= 0) & (self.recipient >= 0)
+        self.rows = np.flatnonzero(self.valid)
+        contributor_name = pd.factorize(self.contributor_name)[0] + 1
+        recipient_name = pd.factorize(self.recipient_name)[0] + 1
+
+        self.pair = np.full(n_rows, -1, dtype=np.int64)
+        self.pair[self.rows], self.n_pairs = dense_ids(
+            self.contributor[self.rows], self.recipient[self.rows]
+        )
+        self.group = np.full(n_rows, -1, dtype=np.int64)
+        self.group[self.rows], self.n_groups = dense_ids(
+            self.pair[self.rows], contributor_name[self.rows], recipient_name[self.rows]
+        )
+
+        # First row of each group, for its ids and names
+        _, first = np.unique(self.group[self.rows], return_index=True)
+        self.group_row = self.rows[first]
+        self.group_pair = self.pair[self.group_row]
+
+        logger.info(
+            f"  Read {n_rows:,} contributions: {self.n_pairs:,} pairs, {self.n_groups:,} groups"
+        )
+
+    def _pair_scores(self, name: str, pair_scores: np.ndarray) -> None:
+        self.scores[name] = pair_scores[self.group_pair]
+
+    def compute_exclusivity_scores(self) -> None:
+        """
+        Compute exclusivity scores.
+
+        Amount given to the recipient over the contributor's total, which
+        counts every donation under the contributor's id and name.
+        """
+        named = (self.contributor >= 0) & pd.notna(self.contributor_name)
+        contributor = np.where(named, self.contributor + 1, 0)
+        name = pd.factorize(self.contributor_name)[0] + 1
+        donor, n_donors = dense_ids(contributor, name)
+        totals = np.bincount(donor[named], self.amount[named], minlength=n_donors)
+
+        amounts = np.bincount(
+            self.group[self.rows], self.amount[self.rows], minlength=self.n_groups
+        )
+        group_totals = np.where(named[self.group_row], totals[donor[self.group_row]], 0.0)
+        self.scores["exclusivity"] = np.divide(
+            amounts, group_totals, out=np.zeros(self.n_groups), where=group_totals != 0
+        )
+
+    def compute_report_type_scores(self) -> None:
+        """
+        Compute report type scores.
+
+        Each donation adds its report type and year parity weight, divided by
+        the pair's number of donations; normalized by the highest score.
+        """
+        weights_path = self.csv_dir / "report_types.csv"
+        if not weights_path.exists():
+            logger.warning(f"  Report type weights file not found: {weights_path}")
+            logger.warning("  Skipping report type scores")
+            self.scores["report_type"] = np.zeros(self.n_groups)
+            return
+
+        weights = {}
+        with open(weights_path) as f:
+            for row in csv.DictReader(f):
+                key = (row.get("report_type", ""), row.get("year_parity", ""))
+                weights[key] = int(row.get("weight", 0))
+
+        report_type, report_types = pd.factorize(self.report_type)
+        report_types = pd.Index(report_types)
+        table = np.zeros((len(report_types), 2))
+        for (name, parity), weight in weights.items():
+            if name in report_types and parity in ("even", "odd"):
+                table[report_types.get_loc(name), 0 if parity == "even" else 1] = weight
+
+        rows = self.rows[(report_type[self.rows] >= 0) & self.has_date[self.rows]]
+        row_weights = table[report_type[rows], self.year[rows] % 2]
+        counts = np.bincount(self.pair[self.rows], minlength=self.n_pairs)
+        weighted = np.bincount(self.pair[rows], row_weights, minlength=self.n_pairs)
+        present = np.bincount(self.pair[rows], minlength=self.n_pairs) > 0
+
+        scores = np.divide(weighted, counts, out=np.zeros(self.n_pairs), where=counts > 0)
+        self._pair_scores("report_type", normalize(scores, present))
+
+    def compute_periodicity_scores(self) -> None:
+        """
+        Compute periodicity scores.
+
+        Inverse population standard deviation of the day of year, from the
+        count, sum and sum of squares per pair; normalized by the highest score.
+        """
+        rows = self.rows[self.has_date[self.rows]]
+        pair = self.pair[rows]
+        day = (self.date[rows] - self.date[rows].astype("datetime64[Y]")).astype(np.int64) + 1
+
+        n = np.bincount(pair, minlength=self.n_pairs)
+        s1 = np.rint(np.bincount(pair, day, minlength=self.n_pairs)).astype(np.int64)
+        s2 = np.rint(np.bincount(pair, day * day, minlength=self.n_pairs)).astype(np.int64)
+        spread = n * s2 - s1 * s1
+
+        scores = np.where(n > 1, 1.0, 0.0)
+        varied = spread > 0
+        scores[varied] = n[varied] / np.sqrt(spread[varied])
+        self._pair_scores("periodicity", normalize(scores, n > 0))
+
+    def _committee_types(self, types: List[str], recipient: bool) -> np.ndarray:
+        """Contributor or recipient type index per committee code (-1 if excluded)."""
+        committee_types = {}
+        for fecid, code in self.db.execute_sql(
+            "SELECT fecid, MAX(committee_type) FROM fec_committees GROUP BY fecid"
+        ):
+            committee_types[fecid] = code
+
+        result = np.full(len(self.committee_ids), -1, dtype=np.int64)
+        for index, fecid in enumerate(self.committee_ids):
+            if fecid in committee_types:
+                kind = committee_type(committee_types[fecid], fecid, recipient)
+                if kind is not None:
+                    result[index] = types.index(kind)
+        return result
+
+    def compute_maxed_out_scores(self) -> None:
+        """
+        Compute maxed-out scores.
+
+        Per-cycle pair totals over the limit for the pair's contributor and
+        recipient types, summed over cycles; normalized by the highest score.
+        """
+        limits_path = self.csv_dir / "limits.csv"
+        if not limits_path.exists():
+            logger.warning(f"  Contribution limits file not found: {limits_path}")
+            logger.warning("  Skipping maxed out scores")
+            self.scores["maxed_out"] = np.zeros(self.n_groups)
+            return
+
+        # limits[contributor type, recipient type, cycle code]
+        limits = np.full((len(CONTRIBUTOR_TYPES), len(RECIPIENT_TYPES), len(self.cycles)), np.nan)
+        with open(limits_path) as f:
+            for row in csv.DictReader(f):
+                cycle = row.get("cycle", "")
+                if (
+                    row.get("contributor_type") in CONTRIBUTOR_TYPES
+                    and row.get("recipient_type") in RECIPIENT_TYPES
+                    and cycle in self.cycles
+                ):
+                    limits[
+                        CONTRIBUTOR_TYPES.index(row["contributor_type"]),
+                        RECIPIENT_TYPES.index(row["recipient_type"]),
+                        self.cycles.get_loc(cycle),
+                    ] = float(row.get("contribution_limit", 0))
+
+        contributor_types = self._committee_types(CONTRIBUTOR_TYPES, recipient=False)
+        recipient_types = self._committee_types(RECIPIENT_TYPES, recipient=True)
+
+        rows = self.rows[self.has_date[self.rows]]
+        contributor_type = contributor_types[self.contributor[rows]]
+        recipient_type = recipient_types[self.recipient[rows]]
+        typed = (contributor_type >= 0) & (recipient_type >= 0)
+        rows = rows[typed]
+
+        # One total per pair and cycle, divided by that cycle's limit
+        key, n_keys = dense_ids(self.pair[rows], self.cycle[rows])
+        totals = np.bincount(key, self.amount[rows], minlength=n_keys)
+        _, first = np.unique(key, return_index=True)
+        limit = limits[contributor_type[typed][first], recipient_type[typed][first],
+                       self.cycle[rows][first]]
+        limited = limit > 0
+
+        key_pair = self.pair[rows][first]
+        scores = np.bincount(
+            key_pair[limited], totals[limited] / limit[limited], minlength=self.n_pairs
+        )
+        present = np.bincount(key_pair[limited], minlength=self.n_pairs) > 0
+        self._pair_scores("maxed_out", normalize(scores, present))
+
+    def compute_length_scores(self) -> None:
+        """
+        Compute length scores.
+
+        Days between a group's first and last donation (for groups with more
+        than one); normalized by the longest relationship.
+        """
+        rows = self.rows[self.has_date[self.rows]]
+        group = self.group[rows]
+        day = self.date[rows].astype(np.int64)
+
+        first = np.full(self.n_groups, np.iinfo(np.int64).max)
+        last = np.full(self.n_groups, np.iinfo(np.int64).min)
+        np.minimum.at(first, group, day)
+        np.maximum.at(last, group, day)
+
+        repeated = np.bincount(group, minlength=self.n_groups) > 1
+        lengths = np.where(repeated, last - first, 0).astype(float)
+        longest = lengths[repeated].max(initial=0) or 1
+        self.scores["length"] = lengths / longest
+
+    def compute_race_focus_scores(self) -> None:
+        """
+        Compute race focus scores.
+
+        1 / number of distinct (district, state, branch, cycle) races a
+        contributor gave to through candidate committees.
+        """
+        # Distinct (recipient committee, race without cycle) from candidates
+        bases: Dict[Tuple[str, str, str], int] = {}
+        candidate_races = set()
+        cursor = self.db.execute_sql("""
+            SELECT DISTINCT fec_committee_id, COALESCE(district, ''),
+                COALESCE(office_state, ''), branch
+            FROM fec_candidates
+            WHERE branch IN ('H', 'S', 'P')
+                AND fec_committee_id IS NOT NULL
+                AND fecid IS NOT NULL
+        """)
+        for committee, district, state, branch in cursor:
+            if committee in self.committee_ids:
+                base = bases.setdefault((district, state, branch), len(bases))
+                candidate_races.add((self.committee_ids.get_loc(committee), base))
+
+        candidates = np.array(sorted(candidate_races), dtype=np.int64).reshape(-1, 2)
+        per_committee = np.bincount(candidates[:, 0], minlength=len(self.committee_ids))
+        starts = np.cumsum(per_committee) - per_committee
+
+        # Each contributor, recipient and cycle once, expanded to the recipient's races
+        rows = self.rows[self.has_date[self.rows]]
+        _, first = np.unique(
+            dense_ids(self.pair[rows], self.cycle[rows])[0], return_index=True
+        )
+        contributor = self.contributor[rows][first]
+        recipient = self.recipient[rows][first]
+        cycle = self.cycle[rows][first]
+
+        matches = per_committee[recipient]
+        source = np.repeat(np.arange(len(recipient)), matches)
+        offsets = np.arange(len(source)) - np.repeat(np.cumsum(matches) - matches, matches)
+        race = candidates[starts[recipient[source]] + offsets, 1] * len(self.cycles) + cycle[source]
+
+        donor_races, _ = dense_ids(contributor[source], race)
+        _, distinct = np.unique(donor_races, return_index=True)
+        races = np.bincount(contributor[source][distinct], minlength=len(self.committee_ids))
+
+        scores = np.divide(1.0, races, out=np.zeros(len(races)), where=races > 0)
+        self.scores["race_focus"] = scores[self.contributor[self.group_row]]
+
+    def compute_final_scores(self) -> None:
+        """Combine the component scores with the score weights and write final_scores."""
+        self.db.drop_tables([FinalScores], safe=True)
+        self.db.create_tables([FinalScores])
+
+        names = {}
+        for fecid, name in self.db.execute_sql(
+            "SELECT fecid, MAX(name) FROM fec_committees GROUP BY fecid"
+        ):
+            names[fecid] = name
+
+        components = [
+            "exclusivity",
+            "report_type",
+            "periodicity",
+            "maxed_out",
+            "length",
+            "race_focus",
+        ]
+        weights = {**self.weights, **self.read_score_weights()}
+        weights = np.array([weights.get(name, 1.0) for name in components])
+        matrix = np.column_stack([self.scores[name] for name in components])
+        final = matrix @ weights / weights.sum()
+        counts = np.bincount(self.group[self.rows], minlength=self.n_groups)
+
+        rows = self.group_row
+        committee_ids = self.committee_ids.to_numpy()
+        fecids = committee_ids[self.contributor[rows]]
+        other_ids = committee_ids[self.recipient[rows]]
+
+        def records():
+            for index, row in enumerate(rows):
+                fecid = fecids[index]
+                committee_name = self.contributor_name[row]
+                yield (
+                    fecid,
+                    names.get(fecid) or committee_name or "",
+                    committee_name,
+                    other_ids[index],
+                    self.recipient_name[row] or "",
+                    int(counts[index]),
+                    *matrix[index].tolist(),
+                    float(final[index]),
+                )
+
+        fields = [
+            FinalScores.fec_committee_id,
+            FinalScores.contributor_name,
+            FinalScores.committee_name,
+            FinalScores.other_id,
+            FinalScores.recipient_name,
+            FinalScores.count,
+            FinalScores.exclusivity_score,
+            FinalScores.report_type_score,
+            FinalScores.periodicity_score,
+            FinalScores.maxed_out_score,
+            FinalScores.length_score,
+            FinalScores.race_focus_score,
+            FinalScores.final_score,
+        ]
+        if isinstance(self.db, MySQLDatabase) and not self.db.connect_params.get("local_infile"):
+            # LOAD DATA LOCAL INFILE is off, so fall back to batched inserts
+            with self.db.atomic():
+                for batch in chunked(records(), 500):
+                    FinalScores.insert_many(batch, fields=fields).execute()
+        else:
+            columns = [field.column_name for field in fields]
+            bulk_loader_for(self.db).load(FinalScores, columns, records())
+
+        logger.info(f"  Computed {self.n_groups} final scores")
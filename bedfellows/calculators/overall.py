@@ -5,19 +5,19 @@ Computes relationship scores across all election cycles.
 """
 
 import logging
-from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
-from peewee import fn, JOIN
-from tqdm import tqdm
+from peewee import fn
 
-from bedfellows.calculators.base import BaseCalculator
+from bedfellows.calculators.base import BaseCalculator, Step
 from bedfellows.models import (
     FecCommittees,
     FecCandidates,
     FecCommitteeContributions,
     FecContributions,
+    CommitteeDim,
+    PairSummary,
     TotalDonatedByContributor,
     ExclusivityScores,
     ReportTypeWeights,
@@ -35,24 +35,45 @@ from bedfellows.models import (
     ContributionLimits,
     JoinedContrRecptTypes,
     MaxedOutSubscores,
-    InboundMaxedOutSubscores,
     UnnormalizedMaxedOutScores,
     MaxMaxedOutScore,
     MaxedOutScores,
     UnnormalizedLengthScores,
     MaxLengthScore,
     LengthScores,
+    Races,
     RacesList,
     RaceFocusScores,
     ScoreWeights,
-    FiveScores,
-    FiveSum,
+    AffectedContributors,
+    AffectedPairs,
+    ComputeState,
+    ContributionChanges,
     FinalScores,
-    FinalSum,
 )
 
 logger = logging.getLogger(__name__)
 
+# ComputeState row for overall scores
+STATE_NAME = "overall"
+
+# fec_contributions rows copied from source rows an incremental load changed
+CHANGED_ROWS = "source_id IN (SELECT source_id FROM contribution_changes)"
+
+# Component scores combined into final_scores, as named in the weights
+SCORE_TYPES = ("exclusivity", "report_type", "periodicity", "maxed_out", "length", "race_focus")
+
+# National party committees; other party committees (X/Y) are state or local
+NATIONAL_PARTY_IDS = (
+    "C00003418",  # Republican National Committee
+    "C00163022",  # Republican National Committee
+    "C00027466",  # National Republican Senatorial Committee
+    "C00075820",  # National Republican Congressional Committee
+    "C00000935",  # Democratic Congressional Campaign Committee
+    "C00042366",  # Democratic Senatorial Campaign Committee
+    "C00010603",  # DNC Services Corporation / Democratic National Committee
+)
+
 
 class OverallCalculator(BaseCalculator):
     """Calculate relationship scores across all election cycles."""
@@ -66,13 +87,16 @@ class OverallCalculator(BaseCalculator):
             config: Optional configuration dictionary
         """
         super().__init__(database, config)
-        self.total_steps = 7  # Setup + 6 score types
+        self.total_steps = 9  # Setup + pair summary + 6 score types + final
+        # Factor the last incremental run rescaled existing length scores by
+        self.length_rescale = 1.0
 
     def setup(self) -> None:
         """
         Perform initial setup.
 
-        Creates filtered FecContributions table excluding Super PACs.
+        Creates filtered FecContributions table excluding Super PACs, or
+        brings an existing one up to date with its source rows.
         """
         self.log_progress("Initial setup", 1, self.total_steps)
 
@@ -82,74 +106,450 @@ class OverallCalculator(BaseCalculator):
         # Check if we need to populate FecContributions
         if FecContributions.select().count() == 0:
             logger.info("FecContributions table is empty, loading from committee contributions...")
-            count = FecContributions.load_from_committee_contributions()
+            count = FecContributions.load_from_committee_contributions(
+                filters=self.config.get("filters")
+            )
             logger.info(f"Loaded {count} filtered contributions")
+            # Every row was just copied with its current values
+            self.db.create_tables([ContributionChanges])
+            ContributionChanges.delete().execute()
         else:
             count = FecContributions.select().count()
             logger.info(f"FecContributions already populated with {count} records")
+            changed, _, rebuilt = FecContributions.sync_from_committee_contributions(
+                self.config.get("filters")
+            )
+            if changed or rebuilt:
+                # A row edited in place needn't change the table's row count
+                # or highest id, which is all the stage fingerprints see
+                self.clear_fingerprints()
+            if rebuilt:
+                # Row ids the incremental high-water marks refer to are gone
+                self.clear_state()
+            # Rows written without the loader have no amount_cents or keys yet
+            FecContributions.fill_derived_columns()
 
         logger.info("Setup complete")
 
+    def steps(self) -> List[Step]:
+        """
+        Calculation steps with the tables each reads and writes.
+
+        The pair summary scans fec_contributions once; the six component
+        scores only share it and the reference tables, so they are
+        independent of each other. The final combination reads all of them.
+        Every step but setup is cached: it is skipped while its input tables,
+        reference CSVs and weights are unchanged, so changing only the
+        weights recomputes only final scores.
+
+        Returns:
+            Steps in run order
+        """
+        def tables(*models) -> List[str]:
+            return [model._meta.table_name for model in models]
+
+        contributions = tables(FecContributions)
+        summary = tables(PairSummary)
+        return [
+            Step(
+                "setup",
+                self.setup,
+                inputs=tables(FecCommitteeContributions),
+                outputs=contributions + tables(CommitteeDim),
+            ),
+            Step(
+                "pair_summary",
+                self.compute_pair_summary,
+                "Summarizing contributions by pair",
+                inputs=contributions,
+                outputs=summary,
+                cacheable=True,
+            ),
+            Step(
+                "exclusivity",
+                self.compute_exclusivity_scores,
+                "Computing exclusivity scores",
+                inputs=summary,
+                outputs=tables(TotalDonatedByContributor, ExclusivityScores),
+                cacheable=True,
+            ),
+            Step(
+                "report_type",
+                self.compute_report_type_scores,
+                "Computing report type scores",
+                inputs=summary,
+                outputs=tables(
+                    ReportTypeWeights,
+                    ReportTypeCountByPair,
+                    PairsCount,
+                    ReportTypeFrequency,
+                    UnnormalizedReportTypeScores,
+                    MaxReportTypeScore,
+                    ReportTypeScores,
+                ),
+                files=[self.csv_dir / "report_types.csv"],
+                cacheable=True,
+            ),
+            Step(
+                "periodicity",
+                self.compute_periodicity_scores,
+                "Computing periodicity scores",
+                inputs=summary,
+                outputs=tables(
+                    UnnormalizedPeriodicityScores, CapUnnormalizedScore, PeriodicityScores
+                ),
+                cacheable=True,
+            ),
+            Step(
+                "maxed_out",
+                self.compute_maxed_out_scores,
+                "Computing maxed out scores",
+                inputs=summary + tables(CommitteeDim, FecCommittees),
+                outputs=tables(
+                    ContributionLimits,
+                    ContributorTypes,
+                    RecipientTypes,
+                    JoinedContrRecptTypes,
+                    MaxedOutSubscores,
+                    UnnormalizedMaxedOutScores,
+                    MaxMaxedOutScore,
+                    MaxedOutScores,
+                ),
+                files=[self.csv_dir / "limits.csv"],
+                cacheable=True,
+            ),
+            Step(
+                "length",
+                self.compute_length_scores,
+                "Computing length scores",
+                inputs=summary,
+                outputs=tables(UnnormalizedLengthScores, MaxLengthScore, LengthScores),
+                cacheable=True,
+            ),
+            Step(
+                "race_focus",
+                self.compute_race_focus_scores,
+                "Computing race focus scores",
+                inputs=summary + tables(CommitteeDim, FecCandidates),
+                outputs=tables(Races, RacesList, RaceFocusScores),
+                cacheable=True,
+            ),
+            Step(
+                "final",
+                self.compute_final_scores,
+                "Computing final scores",
+                inputs=summary
+                + tables(
+                    CommitteeDim,
+                    FecCommittees,
+                    ExclusivityScores,
+                    ReportTypeScores,
+                    PeriodicityScores,
+                    MaxedOutScores,
+                    LengthScores,
+                    RaceFocusScores,
+                ),
+                outputs=tables(ScoreWeights, FinalScores),
+                files=[self.csv_dir / "score_weights.csv"],
+                params={"weights": self.weights},
+                cacheable=True,
+            ),
+        ]
+
     def compute_scores(self) -> None:
-        """Compute all six relationship scores and final scores."""
+        """
+        Compute all six relationship scores and final scores.
+
+        With ``step_workers`` above 1 (PostgreSQL/MySQL only), the six
+        component scores run concurrently; final scores wait for all of them.
+        """
+        self.step_timings = {}
+        self.run_steps(self.steps())
+        self.record_state()
+
+        logger.info("All scores computed successfully!")
+        print("\n✓ All scores computed successfully!")
+        self.log_step_timings()
+
+    def compute_incremental(self) -> None:
+        """
+        Rescore only what contributions added or changed since the last run touch.
+
+        New fec_committee_contributions rows are appended to
+        fec_contributions, and the copies of rows an incremental load updated
+        or removed (contribution_changes) are replaced. The pair summary is
+        rebuilt for the pairs whose rows were added, changed or removed.
+        Exclusivity and final scores are then recomputed for those pairs'
+        contributors, and length scores for the pairs. If the longest
+        relationship changed, everyone else's length score is rescaled in
+        place instead of rebuilt. Report type, periodicity, maxed-out and
+        race focus scores keep their values from the last full run until the
+        next one. Without a previous run, or once the contribution filters
+        changed, this computes everything.
+        """
+        state = self.get_state()
+        if state is None:
+            logger.info("No previous score run recorded, computing all scores")
+            self.compute_scores()
+            return
+        if FecContributions.filters_changed(self.config.get("filters")):
+            logger.info("Contribution filters changed, computing all scores")
+            self.compute_scores()
+            return
+
+        self.step_timings = {}
+        self.length_rescale = 1.0
+        filters = self.config.get("filters")
+        with self.timed_step("setup"):
+            self.reset_affected()
+            # Pairs the old copies of changed rows belonged to lose them
+            self.mark_affected(CHANGED_ROWS)
+            changed = FecContributions.refresh_changed(
+                filters, max_source_id=state.source_max_id, clear=False
+            )
+            added = FecContributions.load_from_committee_contributions(
+                min_id=state.source_max_id, filters=filters
+            )
+            logger.info(f"Appended {added} new filtered contributions")
+            FecContributions.fill_derived_columns()
+            pairs = self.find_affected(state.max_id, state.source_max_id)
+            if changed:
+                ContributionChanges.delete().execute()
+                self.clear_fingerprints()
+
+        if not pairs:
+            self.record_state()
+            print("\n✓ No new or changed contributions since the last run")
+            return
+
+        affected = ["affected_pairs", "affected_contributors"]
+        self.run_steps([
+            Step(
+                "pair_summary",
+                lambda: self.compute_pair_summary(incremental=True),
+                "Updating the pair summary",
+                inputs=["fec_contributions", "affected_pairs"],
+                outputs=["pair_summary"],
+            ),
+            Step(
+                "exclusivity",
+                lambda: self.compute_exclusivity_scores(incremental=True),
+                "Recomputing exclusivity scores",
+                inputs=["pair_summary", "affected_contributors"],
+                outputs=["total_donated_by_contributor", "exclusivity_scores"],
+            ),
+            Step(
+                "length",
+                lambda: self.compute_length_scores(incremental=True),
+                "Recomputing length scores",
+                inputs=["pair_summary", "affected_pairs"],
+                outputs=["unnormalized_length_scores", "max_length_score", "length_scores"],
+            ),
+            Step(
+                "final",
+                lambda: self.compute_final_scores(incremental=True),
+                "Recomputing final scores",
+                inputs=["pair_summary", "committee_dim", "exclusivity_scores", "length_scores"]
+                + affected,
+                outputs=["final_scores"],
+            ),
+        ])
+        self.record_state()
+
+        contributors = AffectedContributors.select().count()
+        print(f"\n✓ Rescored {pairs:,} pairs from {contributors:,} contributors")
+        if self.length_rescale != 1:
+            print(f"  Rescaled other length scores by {self.length_rescale:.4f}")
+        self.log_step_timings()
+
+    def find_affected(self, max_id: int, source_max_id: int = 0) -> int:
+        """
+        Collect pairs and contributors with new or refreshed contributions.
 
-        # 1. Setup
-        self.setup()
+        Adds to the pairs ``reset_affected`` started. Rows are matched on
+        their source id as well as their own, since SQLite reuses the id
+        of a deleted last row.
 
-        # 2. Exclusivity scores
-        self.log_progress("Computing exclusivity scores", 2, self.total_steps)
-        self.compute_exclusivity_scores()
+        Args:
+            max_id: Highest fec_contributions id already scored
+            source_max_id: Highest fec_committee_contributions id already scored
 
-        # 3. Report type scores
-        self.log_progress("Computing report type scores", 3, self.total_steps)
-        self.compute_report_type_scores()
+        Returns:
+            Number of affected pairs
+        """
+        param = self.db.param
+        self.mark_affected(
+            f"(id > {param} OR source_id > {param} OR {CHANGED_ROWS})", (max_id, source_max_id)
+        )
 
-        # 4. Periodicity scores
-        self.log_progress("Computing periodicity scores", 4, self.total_steps)
-        self.compute_periodicity_scores()
+        count = AffectedPairs.select().count()
+        logger.info(f"  {count} pairs have new or changed contributions")
+        return count
 
-        # 5. Maxed out scores
-        self.log_progress("Computing maxed out scores", 5, self.total_steps)
-        self.compute_maxed_out_scores()
+    def reset_affected(self) -> None:
+        """Start an empty set of affected pairs and contributors."""
+        self.db.drop_tables([AffectedPairs, AffectedContributors], safe=True)
+        self.db.create_tables([AffectedPairs, AffectedContributors, ContributionChanges])
 
-        # 6. Length scores
-        self.log_progress("Computing length scores", 6, self.total_steps)
-        self.compute_length_scores()
+    def mark_affected(self, condition: str, params: Tuple = ()) -> None:
+        """
+        Add the pairs and contributors of matching fec_contributions rows.
 
-        # 7. Race focus scores (optional, can be skipped)
-        # self.log_progress("Computing race focus scores", 7, self.total_steps)
-        # self.compute_race_focus_scores()
+        Args:
+            condition: SQL condition on fec_contributions
+            params: Values for the condition's placeholders
+        """
+        self.db.execute_sql(f"""
+            INSERT INTO affected_pairs (contributor_key, recipient_key)
+            SELECT DISTINCT contributor_key, recipient_key
+            FROM fec_contributions f
+            WHERE {condition}
+                AND contributor_key IS NOT NULL
+                AND recipient_key IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM affected_pairs a
+                    WHERE a.contributor_key = f.contributor_key
+                        AND a.recipient_key = f.recipient_key
+                )
+        """, params)
+        self.db.execute_sql(f"""
+            INSERT INTO affected_contributors (contributor_key)
+            SELECT DISTINCT contributor_key
+            FROM fec_contributions f
+            WHERE {condition}
+                AND contributor_key IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM affected_contributors a
+                    WHERE a.contributor_key = f.contributor_key
+                )
+        """, params)
+
+    def get_state(self) -> Optional[ComputeState]:
+        """
+        Get the high-water marks of the last full or incremental run.
 
-        # 8. Final scores
-        self.log_progress("Computing final scores", 7, self.total_steps)
-        self.compute_final_scores()
+        Returns:
+            Recorded state, or None if scores were never computed here
+        """
+        self.db.create_tables([ComputeState])
+        return ComputeState.get_or_none(ComputeState.name == STATE_NAME)
+
+    def record_state(self) -> None:
+        """Record the contributions the current scores include."""
+        source_max_id = FecCommitteeContributions.select(
+            fn.MAX(FecCommitteeContributions.id)
+        ).scalar()
+        max_id = FecContributions.select(fn.MAX(FecContributions.id)).scalar()
+
+        self.db.create_tables([ComputeState])
+        with self.db.atomic():
+            self.clear_state()
+            ComputeState.create(
+                name=STATE_NAME,
+                source_max_id=source_max_id or 0,
+                max_id=max_id or 0,
+                computed_at=datetime.now(),
+            )
+
+    def clear_state(self) -> None:
+        """Forget the last run, so the next incremental run computes everything."""
+        self.db.create_tables([ComputeState])
+        ComputeState.delete().where(ComputeState.name == STATE_NAME).execute()
+
+    def compute_pair_summary(self, incremental: bool = False) -> None:
+        """
+        Summarize contributions per pair in one scan of fec_contributions.
 
-        logger.info("All scores computed successfully!")
-        print("\n✓ All scores computed successfully!")
+        One row per (contributor, recipient, their names, cycle, report
+        type, year parity) holds the count, amount, first and last date and
+        the day-of-year sums, minimum and maximum. Those roll up exactly to
+        every coarser grouping the score stages need.
+
+        Args:
+            incremental: Only rebuild rows of pairs in affected_pairs
+        """
+        logger.info("Summarizing contributions by pair...")
+
+        if incremental:
+            self.db.execute_sql(
+                f"DELETE FROM pair_summary WHERE {self._affected_pair('pair_summary')}"
+            )
+            where = f"WHERE {self._affected_pair('fec_contributions')}"
+        else:
+            self.db.drop_tables([PairSummary], safe=True)
+            self.db.create_tables([PairSummary])
+            where = ""
+
+        doy = self.dialect.day_of_year("date")
+        year_parity = self.dialect.year_parity("date")
+        query = f"""
+            INSERT INTO pair_summary
+            (contributor_key, contributor_name, recipient_key, recipient_name, cycle,
+             report_type, year_parity, count, dated_count, amount_cents, min_date, max_date,
+             doy_sum, doy_squares, doy_min, doy_max)
+            SELECT
+                contributor_key,
+                contributor_name,
+                recipient_key,
+                recipient_name,
+                cycle,
+                report_type,
+                {year_parity},
+                COUNT(*),
+                COUNT(date),
+                SUM(amount_cents),
+                MIN(date),
+                MAX(date),
+                SUM({doy}),
+                SUM({doy} * {doy}),
+                MIN({doy}),
+                MAX({doy})
+            FROM fec_contributions
+            {where}
+            GROUP BY contributor_key, contributor_name, recipient_key, recipient_name, cycle,
+                     report_type, {year_parity}
+        """
+        self.db.execute_sql(query)
 
-    def compute_exclusivity_scores(self) -> None:
+        count = PairSummary.select().count()
+        logger.info(f"  Summarized contributions into {count} rows")
+
+    def compute_exclusivity_scores(self, incremental: bool = False) -> None:
         """
         Compute exclusivity scores.
 
         Measures what percentage of a donor's total contributions go to each recipient.
         Score is capped at 1.0 (100%).
+
+        Args:
+            incremental: Only recompute contributors in affected_contributors,
+                whose totals (and so every pair's share) changed
         """
         logger.info("Computing exclusivity scores...")
 
+        score_tables = [TotalDonatedByContributor, ExclusivityScores]
+        if incremental:
+            contributors = "contributor_key IN (SELECT contributor_key FROM affected_contributors)"
+            for model in score_tables:
+                self.db.execute_sql(f"DELETE FROM {model._meta.table_name} WHERE {contributors}")
+            where = f"WHERE ps.{contributors}"
+        else:
+            # Drop and recreate tables
+            self.db.drop_tables(score_tables, safe=True)
+            self.db.create_tables(score_tables)
+            where = ""
+
         # Step 1: Compute total donated by each contributor
         logger.info("  Computing total donations by contributor...")
 
-        # Drop and recreate table
-        self.db.drop_tables([TotalDonatedByContributor], safe=True)
-        self.db.create_tables([TotalDonatedByContributor])
-
         # Insert totals using raw SQL for efficiency (can be done with ORM but SQL is faster)
-        query = """
+        query = f"""
             INSERT INTO total_donated_by_contributor
-            (fec_committee_id, contributor_name, total_by_PAC)
-            SELECT fec_committee_id, contributor_name, SUM(CAST(amount AS DECIMAL(10,2))) as total
-            FROM fec_contributions
-            GROUP BY fec_committee_id, contributor_name
+            (contributor_key, contributor_name, total_by_PAC)
+            SELECT contributor_key, contributor_name, SUM(amount_cents) / 100.0 as total
+            FROM pair_summary ps
+            {where}
+            GROUP BY contributor_key, contributor_name
         """
         self.db.execute_sql(query)
 
@@ -159,27 +559,25 @@ class OverallCalculator(BaseCalculator):
         # Step 2: Compute exclusivity scores
         logger.info("  Computing exclusivity scores...")
 
-        # Drop and recreate table
-        self.db.drop_tables([ExclusivityScores], safe=True)
-        self.db.create_tables([ExclusivityScores])
-
         # Compute exclusivity as amount_to_recipient / total_by_contributor
         # Using raw SQL for complex aggregation
-        query = """
+        query = f"""
             INSERT INTO exclusivity_scores
-            (fec_committee_id, contributor_name, total_by_pac, other_id, recipient_name, amount)
+            (contributor_key, contributor_name, total_by_pac, recipient_key, recipient_name, amount)
             SELECT
-                fc.fec_committee_id,
-                fc.contributor_name,
+                ps.contributor_key,
+                ps.contributor_name,
                 td.total_by_PAC,
-                fc.other_id,
-                fc.recipient_name,
-                SUM(CAST(fc.amount AS DECIMAL(10,2))) as total_amount
-            FROM fec_contributions fc
+                ps.recipient_key,
+                ps.recipient_name,
+                SUM(ps.amount_cents) / 100.0 as total_amount
+            FROM pair_summary ps
             JOIN total_donated_by_contributor td
-                ON fc.fec_committee_id = td.fec_committee_id
-                AND fc.contributor_name = td.contributor_name
-            GROUP BY fc.fec_committee_id, fc.other_id, fc.contributor_name, fc.recipient_name, td.total_by_PAC
+                ON ps.contributor_key = td.contributor_key
+                AND ps.contributor_name = td.contributor_name
+            {where}
+            GROUP BY ps.contributor_key, ps.recipient_key, ps.contributor_name, ps.recipient_name,
+                     td.total_by_PAC
         """
         self.db.execute_sql(query)
 
@@ -190,13 +588,27 @@ class OverallCalculator(BaseCalculator):
         """
         Compute report type scores.
 
-        Rewards early-cycle donations based on report type timing.
+        Rewards early-cycle donations based on report type timing. Each pair's
+        score is the sum over (report type, year parity) of the frequency of
+        that report type among the pair's donations times its weight,
+        normalized by the highest score.
         """
         logger.info("Computing report type scores...")
 
+        score_tables = [
+            ReportTypeCountByPair,
+            PairsCount,
+            ReportTypeFrequency,
+            UnnormalizedReportTypeScores,
+            MaxReportTypeScore,
+            ReportTypeScores,
+        ]
+        self.db.drop_tables(score_tables, safe=True)
+        self.db.create_tables(score_tables)
+
         # Step 1: Load report type weights from CSV
         logger.info("  Loading report type weights...")
-        weights_path = Path("data/csv/report_types.csv")
+        weights_path = self.csv_dir / "report_types.csv"
 
         if not weights_path.exists():
             logger.warning(f"  Report type weights file not found: {weights_path}")
@@ -224,44 +636,211 @@ class OverallCalculator(BaseCalculator):
 
         logger.info(f"  Loaded {len(weights_data)} report type weights")
 
-        # Step 2: Compute report type scores
-        # This is a simplified version - full implementation would involve
-        # complex aggregations based on timing and frequency
-        logger.info("  Computing report type scores (simplified)...")
+        # Step 2: Count each report type per pair, split by year parity
+        logger.info("  Counting report types by pair...")
+        query = """
+            INSERT INTO report_type_count_by_pair
+            (contributor_key, contributor_name, recipient_key, recipient_name,
+             report_type, year_parity, d_date, count)
+            SELECT
+                contributor_key,
+                COALESCE(MIN(contributor_name), ''),
+                recipient_key,
+                COALESCE(MIN(recipient_name), ''),
+                report_type,
+                year_parity,
+                MIN(min_date),
+                SUM(dated_count)
+            FROM pair_summary
+            WHERE contributor_key IS NOT NULL
+                AND recipient_key IS NOT NULL
+                AND report_type IS NOT NULL
+                AND dated_count > 0
+            GROUP BY contributor_key, recipient_key, report_type, year_parity
+        """
+        self.db.execute_sql(query)
+
+        # Step 3: Count donations per pair
+        query = """
+            INSERT INTO pairs_count (contributor_key, recipient_key, count)
+            SELECT contributor_key, recipient_key, SUM(count)
+            FROM pair_summary
+            WHERE contributor_key IS NOT NULL AND recipient_key IS NOT NULL
+            GROUP BY contributor_key, recipient_key
+        """
+        self.db.execute_sql(query)
+
+        # Step 4: Frequency of each report type within the pair's donations
+        logger.info("  Computing report type frequencies...")
+        query = """
+            INSERT INTO report_type_frequency
+            (contributor_key, contributor_name, recipient_key, recipient_name, report_type,
+             year_parity, d_date, report_type_count_by_pair, pairs_count, report_type_frequency)
+            SELECT
+                rc.contributor_key,
+                rc.contributor_name,
+                rc.recipient_key,
+                rc.recipient_name,
+                rc.report_type,
+                rc.year_parity,
+                rc.d_date,
+                rc.count,
+                pc.count,
+                1.0 * rc.count / pc.count
+            FROM report_type_count_by_pair rc
+            JOIN pairs_count pc
+                ON rc.contributor_key = pc.contributor_key
+                AND rc.recipient_key = pc.recipient_key
+        """
+        self.db.execute_sql(query)
+
+        # Step 5: Weighted sum of frequencies per pair
+        query = """
+            INSERT INTO unnormalized_report_type_scores
+            (contributor_key, contributor_name, recipient_key, recipient_name, report_type_score)
+            SELECT
+                rf.contributor_key,
+                MIN(rf.contributor_name),
+                rf.recipient_key,
+                MIN(rf.recipient_name),
+                SUM(rf.report_type_frequency * COALESCE(w.weight, 0))
+            FROM report_type_frequency rf
+            LEFT JOIN report_type_weights w
+                ON rf.report_type = w.report_type
+                AND rf.year_parity = w.year_parity
+            GROUP BY rf.contributor_key, rf.recipient_key
+        """
+        self.db.execute_sql(query)
 
-        # For now, create empty table structure
-        # Full implementation would require porting complex SQL logic
-        self.db.drop_tables([ReportTypeScores], safe=True)
-        self.db.create_tables([ReportTypeScores])
+        # Step 6: Normalize by the highest score
+        self.db.execute_sql("""
+            INSERT INTO max_report_type_score (max_report_type_score)
+            SELECT COALESCE(MAX(report_type_score), 0) FROM unnormalized_report_type_scores
+        """)
+        query = """
+            INSERT INTO report_type_scores
+            (contributor_key, contributor_name, recipient_key, recipient_name, report_type_score)
+            SELECT
+                u.contributor_key,
+                u.contributor_name,
+                u.recipient_key,
+                u.recipient_name,
+                CASE WHEN m.max_report_type_score > 0
+                    THEN u.report_type_score / m.max_report_type_score
+                    ELSE 0 END
+            FROM unnormalized_report_type_scores u
+            CROSS JOIN max_report_type_score m
+        """
+        self.db.execute_sql(query)
 
-        logger.info("  Report type scores computation completed (simplified)")
+        count = ReportTypeScores.select().count()
+        logger.info(f"  Computed {count} report type scores")
 
     def compute_periodicity_scores(self) -> None:
         """
         Compute periodicity scores.
 
-        Measures regularity of donation patterns (standard deviation of timing).
+        Scores each pair by the inverse of the population standard deviation
+        of its donations' day of the year, normalized by the highest score.
+        A zero deviation scores 0 for a one-time donation and 1 for repeated
+        donations on the same day of the year.
+
+        The deviation is computed from the count, sum and sum of squares of
+        the day of year, summed over the pair's pair_summary rows. Those are
+        integers, so the zero-variance test (n * sum(x^2) - sum(x)^2 = 0) is
+        exact.
         """
         logger.info("Computing periodicity scores...")
 
-        # For now, create empty table structure
-        # Full implementation would calculate standard deviation of donation intervals
-        self.db.drop_tables([PeriodicityScores], safe=True)
-        self.db.create_tables([PeriodicityScores])
+        score_tables = [UnnormalizedPeriodicityScores, CapUnnormalizedScore, PeriodicityScores]
+        self.db.drop_tables(score_tables, safe=True)
+        self.db.create_tables(score_tables)
 
-        logger.info("  Periodicity scores computation completed (simplified)")
+        query = """
+            INSERT INTO unnormalized_periodicity_scores
+            (contributor_key, contributor_name, recipient_key, recipient_name,
+             stddev_pop, day_diff, periodicity_score)
+            SELECT
+                contributor_key,
+                contributor_name,
+                recipient_key,
+                recipient_name,
+                SQRT(1.0 * (n * s2 - s1 * s1)) / n,
+                day_diff,
+                CASE
+                    WHEN n * s2 - s1 * s1 = 0 THEN CASE WHEN n = 1 THEN 0 ELSE 1 END
+                    ELSE n / SQRT(1.0 * (n * s2 - s1 * s1))
+                END
+            FROM (
+                SELECT
+                    contributor_key,
+                    COALESCE(MIN(contributor_name), '') AS contributor_name,
+                    recipient_key,
+                    COALESCE(MIN(recipient_name), '') AS recipient_name,
+                    SUM(dated_count) AS n,
+                    SUM(doy_sum) AS s1,
+                    SUM(doy_squares) AS s2,
+                    MAX(doy_max) - MIN(doy_min) AS day_diff
+                FROM pair_summary
+                WHERE contributor_key IS NOT NULL
+                    AND recipient_key IS NOT NULL
+                    AND dated_count > 0
+                GROUP BY contributor_key, recipient_key
+            ) day_stats
+        """
+        self.db.execute_sql(query)
+
+        # Normalize by the highest score
+        self.db.execute_sql("""
+            INSERT INTO cap_unnormalized_score (cap_unnormalized_score)
+            SELECT COALESCE(MAX(periodicity_score), 0) FROM unnormalized_periodicity_scores
+        """)
+        query = """
+            INSERT INTO periodicity_scores
+            (contributor_key, contributor_name, recipient_key, recipient_name, periodicity_score)
+            SELECT
+                u.contributor_key,
+                u.contributor_name,
+                u.recipient_key,
+                u.recipient_name,
+                CASE WHEN c.cap_unnormalized_score > 0
+                    THEN u.periodicity_score / c.cap_unnormalized_score
+                    ELSE 0 END
+            FROM unnormalized_periodicity_scores u
+            CROSS JOIN cap_unnormalized_score c
+        """
+        self.db.execute_sql(query)
+
+        count = PeriodicityScores.select().count()
+        logger.info(f"  Computed {count} periodicity scores")
 
     def compute_maxed_out_scores(self) -> None:
         """
         Compute maxed-out scores.
 
-        Measures how close donations come to legal contribution limits.
+        Measures how close donations come to legal contribution limits. Each
+        committee's contributor and recipient type is resolved once per cycle,
+        then per-pair, per-cycle totals are divided by the matching limit.
+        Within a cycle the limit is constant, so the sum of per-donation
+        shares equals the cycle total over the limit.
         """
         logger.info("Computing maxed out scores...")
 
+        score_tables = [
+            ContributorTypes,
+            RecipientTypes,
+            JoinedContrRecptTypes,
+            MaxedOutSubscores,
+            UnnormalizedMaxedOutScores,
+            MaxMaxedOutScore,
+            MaxedOutScores,
+        ]
+        self.db.drop_tables(score_tables, safe=True)
+        self.db.create_tables(score_tables)
+
         # Step 1: Load contribution limits from CSV
         logger.info("  Loading contribution limits...")
-        limits_path = Path("data/csv/limits.csv")
+        limits_path = self.csv_dir / "limits.csv"
 
         if not limits_path.exists():
             logger.warning(f"  Contribution limits file not found: {limits_path}")
@@ -290,40 +869,221 @@ class OverallCalculator(BaseCalculator):
 
         logger.info(f"  Loaded {len(limits_data)} contribution limits")
 
-        # For full implementation, would compare actual donations to limits
-        self.db.drop_tables([MaxedOutScores], safe=True)
-        self.db.create_tables([MaxedOutScores])
+        national_ids = ", ".join(f"'{fecid}'" for fecid in NATIONAL_PARTY_IDS)
+        # One committee type per FEC ID, however many cycles were loaded
+        committee_types = """
+            SELECT fecid, MAX(committee_type) AS committee_type
+            FROM fec_committees
+            GROUP BY fecid
+        """
+
+        # Step 2: Resolve contributor and recipient types once per committee and cycle
+        logger.info("  Classifying contributors and recipients...")
+        query = f"""
+            INSERT INTO contributor_types
+            (contributor_key, contributor_name, cycle, contributor_type)
+            SELECT
+                c.contributor_key,
+                c.contributor_name,
+                c.cycle,
+                CASE
+                    WHEN cm.committee_type IN ('X', 'Y') AND d.fecid IN ({national_ids})
+                        THEN 'national_party'
+                    WHEN cm.committee_type IN ('X', 'Y') THEN 'other_party'
+                    WHEN cm.committee_type = 'Q' THEN 'multi_pac'
+                    ELSE 'non_multi_pac'
+                END
+            FROM (
+                SELECT
+                    contributor_key,
+                    COALESCE(MIN(contributor_name), '') AS contributor_name,
+                    cycle
+                FROM pair_summary
+                WHERE contributor_key IS NOT NULL AND dated_count > 0
+                GROUP BY contributor_key, cycle
+            ) c
+            JOIN committee_dim d ON d.committee_key = c.contributor_key
+            JOIN ({committee_types}) cm ON cm.fecid = d.fecid
+            WHERE cm.committee_type IN ('X', 'Y', 'N', 'Q', 'F')
+        """
+        self.db.execute_sql(query)
+
+        query = f"""
+            INSERT INTO recipient_types (recipient_key, recipient_name, cycle, recipient_type)
+            SELECT
+                r.recipient_key,
+                r.recipient_name,
+                r.cycle,
+                CASE
+                    WHEN cm.committee_type IN ('H', 'S', 'P', 'A', 'B') THEN 'candidate'
+                    WHEN cm.committee_type IN ('X', 'Y') AND d.fecid IN ({national_ids})
+                        THEN 'national_party'
+                    WHEN cm.committee_type IN ('X', 'Y') THEN 'other_party'
+                    ELSE 'pac'
+                END
+            FROM (
+                SELECT
+                    recipient_key,
+                    COALESCE(MIN(recipient_name), '') AS recipient_name,
+                    cycle
+                FROM pair_summary
+                WHERE recipient_key IS NOT NULL AND dated_count > 0
+                GROUP BY recipient_key, cycle
+            ) r
+            JOIN committee_dim d ON d.committee_key = r.recipient_key
+            JOIN ({committee_types}) cm ON cm.fecid = d.fecid
+            WHERE cm.committee_type IN ('H', 'S', 'P', 'A', 'B', 'X', 'Y', 'N', 'Q', 'F', 'G')
+        """
+        self.db.execute_sql(query)
+
+        # Step 3: Per-pair, per-cycle totals tagged with both types
+        logger.info("  Totaling donations by pair and cycle...")
+        query = """
+            INSERT INTO joined_contr_recpt_types
+            (contributor_key, contributor_name, contributor_type, recipient_key, recipient_name,
+             recipient_type, cycle, date, amount)
+            SELECT
+                p.contributor_key,
+                ct.contributor_name,
+                ct.contributor_type,
+                p.recipient_key,
+                rt.recipient_name,
+                rt.recipient_type,
+                p.cycle,
+                p.date,
+                p.amount
+            FROM (
+                SELECT
+                    contributor_key,
+                    recipient_key,
+                    cycle,
+                    MAX(max_date) AS date,
+                    SUM(amount_cents) / 100.0 AS amount
+                FROM pair_summary
+                WHERE contributor_key IS NOT NULL
+                    AND recipient_key IS NOT NULL
+                    AND dated_count > 0
+                GROUP BY contributor_key, recipient_key, cycle
+            ) p
+            JOIN contributor_types ct
+                ON ct.contributor_key = p.contributor_key AND ct.cycle = p.cycle
+            JOIN recipient_types rt
+                ON rt.recipient_key = p.recipient_key AND rt.cycle = p.cycle
+        """
+        self.db.execute_sql(query)
+
+        # Step 4: Share of the contribution limit, one join against the limits table
+        query = """
+            INSERT INTO maxed_out_subscores
+            (contributor_key, contributor_name, contributor_type, recipient_key, recipient_name,
+             recipient_type, cycle, date, amount, contribution_limit, maxed_out_subscore)
+            SELECT
+                j.contributor_key,
+                j.contributor_name,
+                j.contributor_type,
+                j.recipient_key,
+                j.recipient_name,
+                j.recipient_type,
+                j.cycle,
+                j.date,
+                j.amount,
+                l.contribution_limit,
+                j.amount / l.contribution_limit
+            FROM joined_contr_recpt_types j
+            JOIN contribution_limits l
+                ON l.contributor_type = j.contributor_type
+                AND l.recipient_type = j.recipient_type
+                AND l.cycle = j.cycle
+            WHERE l.contribution_limit > 0
+        """
+        self.db.execute_sql(query)
+
+        # Step 5: Sum over cycles and normalize by the highest score
+        query = """
+            INSERT INTO unnormalized_maxed_out_scores
+            (contributor_key, contributor_name, contributor_type, recipient_key, recipient_name,
+             recipient_type, maxed_out_score)
+            SELECT
+                contributor_key,
+                MIN(contributor_name),
+                MIN(contributor_type),
+                recipient_key,
+                MIN(recipient_name),
+                MIN(recipient_type),
+                SUM(maxed_out_subscore)
+            FROM maxed_out_subscores
+            GROUP BY contributor_key, recipient_key
+        """
+        self.db.execute_sql(query)
+
+        self.db.execute_sql("""
+            INSERT INTO max_maxed_out_score (max_maxed_out_score)
+            SELECT COALESCE(MAX(maxed_out_score), 0) FROM unnormalized_maxed_out_scores
+        """)
+        query = """
+            INSERT INTO maxed_out_scores
+            (contributor_key, contributor_name, contributor_type, recipient_key, recipient_name,
+             recipient_type, maxed_out_score)
+            SELECT
+                u.contributor_key,
+                u.contributor_name,
+                u.contributor_type,
+                u.recipient_key,
+                u.recipient_name,
+                u.recipient_type,
+                CASE WHEN m.max_maxed_out_score > 0
+                    THEN u.maxed_out_score / m.max_maxed_out_score
+                    ELSE 0 END
+            FROM unnormalized_maxed_out_scores u
+            CROSS JOIN max_maxed_out_score m
+        """
+        self.db.execute_sql(query)
 
-        logger.info("  Maxed out scores computation completed (simplified)")
+        count = MaxedOutScores.select().count()
+        logger.info(f"  Computed {count} maxed out scores")
 
-    def compute_length_scores(self) -> None:
+    def compute_length_scores(self, incremental: bool = False) -> None:
         """
         Compute length scores.
 
         Measures duration of donor-recipient relationship (time between first and last donation).
+
+        Args:
+            incremental: Only recompute pairs in affected_pairs. If the longest
+                relationship changes, the other pairs' normalized scores are
+                rescaled in place and the factor kept in ``length_rescale``.
         """
         logger.info("Computing length scores...")
 
-        # Drop and recreate table
-        self.db.drop_tables([UnnormalizedLengthScores], safe=True)
-        self.db.create_tables([UnnormalizedLengthScores])
+        if incremental:
+            previous_max = self._max_length_score()
+            self.db.execute_sql(
+                f"DELETE FROM unnormalized_length_scores "
+                f"WHERE {self._affected_pair('unnormalized_length_scores')}"
+            )
+            where = f"AND {self._affected_pair('pair_summary')}"
+        else:
+            # Drop and recreate table
+            self.db.drop_tables([UnnormalizedLengthScores], safe=True)
+            self.db.create_tables([UnnormalizedLengthScores])
+            where = ""
 
         # Compute length as days between first and last donation
-        query = """
+        query = f"""
             INSERT INTO unnormalized_length_scores
-            (fec_committee_id, contributor_name, other_id, recipient_name, max_date, min_date, length_score)
+            (contributor_key, contributor_name, recipient_key, recipient_name, max_date, min_date, length_score)
             SELECT
-                fec_committee_id,
+                contributor_key,
                 contributor_name,
-                other_id,
+                recipient_key,
                 recipient_name,
-                MAX(date) as max_date,
-                MIN(date) as min_date,
-                DATEDIFF(MAX(date), MIN(date)) as length_score
-            FROM fec_contributions
-            WHERE date IS NOT NULL
-            GROUP BY fec_committee_id, other_id, contributor_name, recipient_name
-            HAVING COUNT(*) > 1
+                MAX(max_date) as max_date,
+                MIN(min_date) as min_date,
+                {self.dialect.days_between("MAX(max_date)", "MIN(min_date)")} as length_score
+            FROM pair_summary
+            WHERE dated_count > 0 {where}
+            GROUP BY contributor_key, recipient_key, contributor_name, recipient_name
+            HAVING SUM(dated_count) > 1
         """
 
         try:
@@ -339,129 +1099,286 @@ class OverallCalculator(BaseCalculator):
             self.db.create_tables([MaxLengthScore])
             MaxLengthScore.create(max_length_score=max_length)
 
-            # Normalize scores
-            self.db.drop_tables([LengthScores], safe=True)
-            self.db.create_tables([LengthScores])
-
             normalize_query = f"""
                 INSERT INTO length_scores
-                (fec_committee_id, contributor_name, other_id, recipient_name, max_date, min_date, length_score)
+                (contributor_key, contributor_name, recipient_key, recipient_name, max_date, min_date, length_score)
                 SELECT
-                    fec_committee_id,
+                    contributor_key,
                     contributor_name,
-                    other_id,
+                    recipient_key,
                     recipient_name,
                     max_date,
                     min_date,
                     length_score / {max_length} as normalized_score
                 FROM unnormalized_length_scores
             """
+
+            if incremental:
+                # Rescale everyone to the new maximum, then replace the affected pairs
+                self.length_rescale = previous_max / max_length
+                if self.length_rescale != 1:
+                    self.db.execute_sql(
+                        f"UPDATE length_scores SET length_score = length_score * {self.length_rescale}"
+                    )
+                self.db.execute_sql(
+                    f"DELETE FROM length_scores WHERE {self._affected_pair('length_scores')}"
+                )
+                normalize_query += f"WHERE {self._affected_pair('unnormalized_length_scores')}"
+            else:
+                # Normalize scores
+                self.db.drop_tables([LengthScores], safe=True)
+                self.db.create_tables([LengthScores])
+
             self.db.execute_sql(normalize_query)
 
             count = LengthScores.select().count()
             logger.info(f"  Computed {count} length scores")
 
         except Exception as e:
+            if incremental:
+                raise
             logger.error(f"  Error computing length scores: {e}")
             # Create empty tables for compatibility
             self.db.drop_tables([LengthScores], safe=True)
             self.db.create_tables([LengthScores])
 
+    def _max_length_score(self) -> float:
+        """Length normalizer of the previous run (1 if there was none)."""
+        row = MaxLengthScore.select().first()
+        return row.max_length_score if row and row.max_length_score else 1
+
+    @staticmethod
+    def _affected_pair(table: str) -> str:
+        """SQL condition: the table row's pair is in affected_pairs."""
+        return f"""EXISTS (
+                SELECT 1 FROM affected_pairs a
+                WHERE a.contributor_key = {table}.contributor_key
+                    AND a.recipient_key = {table}.recipient_key
+            )"""
+
     def compute_race_focus_scores(self) -> None:
         """
         Compute race focus scores.
 
-        Measures geographic concentration of support.
+        Measures how concentrated a contributor's giving is across races: the
+        score is 1 / number of distinct House, Senate and presidential races
+        the contributor gave to. A race is a (district, office_state, branch,
+        cycle) combination, keyed by an integer in the races table.
         """
         logger.info("Computing race focus scores...")
 
-        # This requires joining with candidate data and analyzing geographic patterns
-        # For now, create empty table structure
-        self.db.drop_tables([RaceFocusScores], safe=True)
-        self.db.create_tables([RaceFocusScores])
+        score_tables = [Races, RacesList, RaceFocusScores]
+        self.db.drop_tables(score_tables, safe=True)
+        self.db.create_tables(score_tables)
 
-        logger.info("  Race focus scores computation completed (simplified)")
-
-    def compute_final_scores(self) -> None:
+        # Step 1: Join each pair's cycles to the recipient committee's candidate once
+        query = """
+            INSERT INTO races_list
+            (contributor_key, contributor_name, recipient_key, recipient_name, fec_candidate_id,
+             candidate_name, district, office_state, branch, cycle)
+            SELECT
+                p.contributor_key,
+                p.contributor_name,
+                p.recipient_key,
+                p.recipient_name,
+                c.fecid,
+                c.name,
+                c.district,
+                c.office_state,
+                c.branch,
+                p.cycle
+            FROM (
+                SELECT
+                    contributor_key,
+                    COALESCE(MIN(contributor_name), '') AS contributor_name,
+                    recipient_key,
+                    COALESCE(MIN(recipient_name), '') AS recipient_name,
+                    cycle
+                FROM pair_summary
+                WHERE contributor_key IS NOT NULL
+                    AND recipient_key IS NOT NULL
+                    AND dated_count > 0
+                GROUP BY contributor_key, recipient_key, cycle
+            ) p
+            JOIN committee_dim d ON d.committee_key = p.recipient_key
+            JOIN (
+                SELECT
+                    fec_committee_id,
+                    fecid,
+                    COALESCE(MIN(name), '') AS name,
+                    COALESCE(district, '') AS district,
+                    COALESCE(office_state, '') AS office_state,
+                    branch
+                FROM fec_candidates
+                WHERE branch IN ('H', 'S', 'P')
+                    AND fec_committee_id IS NOT NULL
+                    AND fecid IS NOT NULL
+                GROUP BY fec_committee_id, fecid, district, office_state, branch
+            ) c ON c.fec_committee_id = d.fecid
         """
-        Compute final combined scores.
+        self.db.execute_sql(query)
 
-        Combines all individual scores using configured weights.
+        # Step 2: Integer key per race
+        self.db.execute_sql("""
+            INSERT INTO races (district, office_state, branch, cycle)
+            SELECT DISTINCT district, office_state, branch, cycle FROM races_list
+        """)
+        self.db.execute_sql("""
+            UPDATE races_list SET race_id = (
+                SELECT r.race_id FROM races r
+                WHERE r.district = races_list.district
+                    AND r.office_state = races_list.office_state
+                    AND r.branch = races_list.branch
+                    AND r.cycle = races_list.cycle
+            )
+        """)
+
+        # Step 3: Inverse of the number of races per contributor
+        query = """
+            INSERT INTO race_focus_scores (contributor_key, contributor_name, race_focus_score)
+            SELECT
+                contributor_key,
+                MIN(contributor_name),
+                1.0 / COUNT(DISTINCT race_id)
+            FROM races_list
+            GROUP BY contributor_key
         """
-        logger.info("Computing final scores...")
+        self.db.execute_sql(query)
 
-        # Load score weights from CSV
-        weights_path = Path("data/csv/score_weights.csv")
+        races = Races.select().count()
+        count = RaceFocusScores.select().count()
+        logger.info(f"  Computed {count} race focus scores across {races} races")
 
-        if not weights_path.exists():
-            logger.warning(f"  Score weights file not found: {weights_path}")
-            logger.info("  Using default weights (all 1.0)")
-            weights = self.weights
-        else:
-            # Drop and recreate table
-            self.db.drop_tables([ScoreWeights], safe=True)
-            self.db.create_tables([ScoreWeights])
-
-            # Load weights from CSV
-            import csv
-            with open(weights_path) as f:
-                reader = csv.DictReader(f)
-                weights_data = []
-                for row in reader:
-                    weights_data.append({
-                        'score_type': row.get('score_type', ''),
-                        'weight': float(row.get('weight', 1.0))
-                    })
+    def compute_final_scores(self, incremental: bool = False) -> None:
+        """
+        Compute final combined scores.
 
-                if weights_data:
-                    ScoreWeights.insert_many(weights_data).execute()
+        Combines all individual scores using the configured weights, with
+        any score types listed in score_weights.csv taking their weight from
+        the file.
 
-            logger.info(f"  Loaded {len(weights_data)} score weights")
+        Args:
+            incremental: Only recompute rows of contributors in
+                affected_contributors; other rows only pick up the length
+                rescale from ``compute_length_scores``
+        """
+        logger.info("Computing final scores...")
 
-        # Drop and recreate final scores table
-        self.db.drop_tables([FinalScores], safe=True)
-        self.db.create_tables([FinalScores])
+        # score_weights.csv overrides the configured weights for the types it lists
+        csv_weights = self.read_score_weights()
+        self.db.drop_tables([ScoreWeights], safe=True)
+        self.db.create_tables([ScoreWeights])
+        if csv_weights:
+            ScoreWeights.insert_many(
+                [{"score_type": name, "weight": weight} for name, weight in csv_weights.items()]
+            ).execute()
+        weights = {**self.weights, **csv_weights}
+
+        if incremental:
+            if self.length_rescale != 1:
+                # final_score is assigned first: MySQL applies SET clauses in order
+                w_len = weights.get("length", 1.0)
+                w_total = sum(weights.get(name, 1.0) for name in SCORE_TYPES)
+                self.db.execute_sql(f"""
+                    UPDATE final_scores SET
+                        final_score = final_score
+                            + length_score * ({self.length_rescale} - 1) * {w_len} / {w_total},
+                        length_score = length_score * {self.length_rescale}
+                """)
+            self.db.execute_sql("""
+                DELETE FROM final_scores WHERE fec_committee_id IN (
+                    SELECT d.fecid FROM affected_contributors a
+                    JOIN committee_dim d ON d.committee_key = a.contributor_key
+                )
+            """)
+            where = "AND contributor_key IN (SELECT contributor_key FROM affected_contributors)"
+        else:
+            # Drop and recreate final scores table
+            self.db.drop_tables([FinalScores], safe=True)
+            self.db.create_tables([FinalScores])
+            where = ""
 
         # Combine scores
-        # This is a simplified version combining only the scores we computed
-        query = """
+        components = [
+            "COALESCE(es.amount / es.total_by_pac, 0)",
+            "COALESCE(rt.report_type_score, 0)",
+            "COALESCE(ps.periodicity_score, 0)",
+            "COALESCE(ms.maxed_out_score, 0)",
+            "COALESCE(ls.length_score, 0)",
+            "COALESCE(rf.race_focus_score, 0)",
+        ]
+        final_score, params = self.weighted_average(components, weights)
+        self.analyze_tables([
+            "pair_summary",
+            "exclusivity_scores",
+            "report_type_scores",
+            "periodicity_scores",
+            "maxed_out_scores",
+            "length_scores",
+            "race_focus_scores",
+        ])
+        same = self.dialect.same
+        # One row per final_scores group (pair plus names) drives the joins,
+        # so each score table matches at most once and nothing fans out
+        query = f"""
             INSERT INTO final_scores
             (fec_committee_id, contributor_name, committee_name, other_id, recipient_name, count,
              exclusivity_score, report_type_score, periodicity_score,
              maxed_out_score, length_score, race_focus_score, final_score)
             SELECT
-                fc.fec_committee_id,
-                cm.name as contributor_name,
-                fc.contributor_name as committee_name,
-                fc.other_id,
-                fc.recipient_name,
-                COUNT(*) as count,
-                COALESCE(es.amount / es.total_by_pac, 0) as exclusivity_score,
-                0 as report_type_score,
-                0 as periodicity_score,
-                0 as maxed_out_score,
-                COALESCE(ls.length_score, 0) as length_score,
-                0 as race_focus_score,
-                (COALESCE(es.amount / es.total_by_pac, 0) * {w_excl} +
-                 COALESCE(ls.length_score, 0) * {w_len}) / ({w_excl} + {w_len}) as final_score
-            FROM fec_contributions fc
-            LEFT JOIN fec_committees cm
-                ON fc.fec_committee_id = cm.fecid
+                cd.fecid as fec_committee_id,
+                COALESCE(cm.name, g.contributor_name, '') as contributor_name,
+                g.contributor_name as committee_name,
+                rd.fecid as other_id,
+                COALESCE(g.recipient_name, '') as recipient_name,
+                g.count,
+                {components[0]} as exclusivity_score,
+                {components[1]} as report_type_score,
+                {components[2]} as periodicity_score,
+                {components[3]} as maxed_out_score,
+                {components[4]} as length_score,
+                {components[5]} as race_focus_score,
+                {final_score} as final_score
+            FROM (
+                SELECT contributor_key, recipient_key, contributor_name, recipient_name,
+                       SUM(count) as count
+                FROM pair_summary
+                WHERE contributor_key IS NOT NULL AND recipient_key IS NOT NULL {where}
+                GROUP BY contributor_key, recipient_key, contributor_name, recipient_name
+            ) g
+            JOIN committee_dim cd
+                ON g.contributor_key = cd.committee_key
+            JOIN committee_dim rd
+                ON g.recipient_key = rd.committee_key
+            LEFT JOIN (
+                SELECT fecid, MAX(name) as name FROM fec_committees GROUP BY fecid
+            ) cm
+                ON cd.fecid = cm.fecid
             LEFT JOIN exclusivity_scores es
-                ON fc.fec_committee_id = es.fec_committee_id
-                AND fc.other_id = es.other_id
+                ON g.contributor_key = es.contributor_key
+                AND g.recipient_key = es.recipient_key
+                AND {same("g.contributor_name", "es.contributor_name")}
+                AND {same("g.recipient_name", "es.recipient_name")}
+            LEFT JOIN report_type_scores rt
+                ON g.contributor_key = rt.contributor_key
+                AND g.recipient_key = rt.recipient_key
+            LEFT JOIN periodicity_scores ps
+                ON g.contributor_key = ps.contributor_key
+                AND g.recipient_key = ps.recipient_key
+            LEFT JOIN maxed_out_scores ms
+                ON g.contributor_key = ms.contributor_key
+                AND g.recipient_key = ms.recipient_key
             LEFT JOIN length_scores ls
-                ON fc.fec_committee_id = ls.fec_committee_id
-                AND fc.other_id = ls.other_id
-            GROUP BY fc.fec_committee_id, fc.other_id, fc.contributor_name, fc.recipient_name,
-                     cm.name, es.amount, es.total_by_pac, ls.length_score
-        """.format(
-            w_excl=self.weights.get('exclusivity', 1.0),
-            w_len=self.weights.get('length', 1.0)
-        )
+                ON g.contributor_key = ls.contributor_key
+                AND g.recipient_key = ls.recipient_key
+                AND {same("g.contributor_name", "ls.contributor_name")}
+                AND {same("g.recipient_name", "ls.recipient_name")}
+            LEFT JOIN race_focus_scores rf
+                ON g.contributor_key = rf.contributor_key
+        """
 
         try:
-            self.db.execute_sql(query)
+            self.db.execute_sql(query, params)
             count = FinalScores.select().count()
             logger.info(f"  Computed {count} final scores")
 
@@ -481,6 +1398,99 @@ class OverallCalculator(BaseCalculator):
             logger.error(f"  Error computing final scores: {e}")
             raise
 
+    def read_score_weights(self) -> Dict[str, float]:
+        """
+        Read score weights from score_weights.csv.
+
+        Returns:
+            Weight per score type listed in the file (empty if it's missing)
+        """
+        weights_path = self.csv_dir / "score_weights.csv"
+        if not weights_path.exists():
+            logger.warning(f"  Score weights file not found: {weights_path}")
+            logger.info("  Using configured weights")
+            return {}
+
+        import csv
+        weights = {}
+        with open(weights_path) as f:
+            for row in csv.DictReader(f):
+                weights[row.get("score_type", "")] = float(row.get("weight", 1.0))
+
+        unknown = set(weights) - set(SCORE_TYPES)
+        if unknown:
+            logger.warning(f"  Ignoring unknown score types: {', '.join(sorted(unknown))}")
+        weights = {name: weight for name, weight in weights.items() if name in SCORE_TYPES}
+        logger.info(f"  Loaded {len(weights)} score weights")
+        return weights
+
+    def weighted_average(
+        self, components: List[str], weights: Dict[str, float]
+    ) -> Tuple[str, List[float]]:
+        """
+        SQL for the weighted average of the six component scores.
+
+        Args:
+            components: SQL expressions for the components, in SCORE_TYPES order
+            weights: Weight per score type (missing types weigh 1.0)
+
+        Returns:
+            (SQL expression, parameters for its placeholders)
+        """
+        param = self.db.param
+        values = [float(weights.get(name, 1.0)) for name in SCORE_TYPES]
+        terms = " + ".join(f"{component} * {param}" for component in components)
+        return f"({terms}) / {param}", values + [sum(values)]
+
+    def reweight(self, weights: Dict[str, float], model=FinalScores) -> int:
+        """
+        Recombine stored component scores with new weights.
+
+        Every row of final_scores already holds its six normalized component
+        scores, so new weights only need one UPDATE over that table: no
+        score is recomputed and nothing is joined. The stage cache forgets
+        the final step, so the next ``compute`` rebuilds it with the
+        configured weights, and the incremental state is cleared so an
+        incremental run doesn't mix those weights into the reweighted rows.
+
+        Args:
+            weights: Weight per score type; types left out keep their current weight
+            model: Score table to update (FinalScores or CycleFinalScores)
+
+        Returns:
+            Number of rows updated
+
+        Raises:
+            ValueError: On unknown score types, negative weights or a zero total
+        """
+        unknown = set(weights) - set(SCORE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown score types: {', '.join(sorted(unknown))}")
+        weights = {**self.weights, **self.read_score_weights(), **weights}
+        if any(weights.get(name, 1.0) < 0 for name in SCORE_TYPES):
+            raise ValueError("Score weights can't be negative")
+        if sum(weights.get(name, 1.0) for name in SCORE_TYPES) <= 0:
+            raise ValueError("At least one score weight must be positive")
+
+        columns = [f"{name}_score" for name in SCORE_TYPES]
+        final_score, params = self.weighted_average(columns, weights)
+        table = model._meta.table_name
+        with self.timed_step("reweight"):
+            with self.db.atomic():
+                cursor = self.db.execute_sql(
+                    f"UPDATE {table} SET final_score = {final_score}", params
+                )
+            if model is FinalScores:
+                self.clear_fingerprints(["final"])
+                self.clear_state()
+
+        self.weights = weights
+        logger.info(
+            f"Reweighted {cursor.rowcount} {table} rows "
+            f"in {self.step_timings['reweight']:.2f}s"
+        )
+        return cursor.rowcount
+
     def get_results(self, limit: Optional[int] = None):
         """
         Get final scores.
@@ -19,6 +19,9 @@ from bedfellows.database import DatabaseManager, init_database
 from bedfellows.models import (
     init_models,
     create_all_tables,
+    FEC_CORE_MODELS,
+    ComputeState,
+    StageFingerprints,
     FecCandidates,
     FecCommittees,
     FecCommitteeContributions,
@@ -83,9 +86,23 @@ def init(ctx):
     # Initialize models
     init_models(db)
 
+    # Add columns newer versions need to existing data tables
+    added = db_manager.migrate_schema(FEC_CORE_MODELS)
+
     # Create tables
     create_all_tables()
 
+    if added:
+        console.print(f"[green]✓[/green] Added columns: {', '.join(added)}")
+        if "fec_contributions.source_id" in added:
+            # Copies without a source id can't be refreshed after incremental
+            # loads; the next compute copies the filtered rows again
+            FecContributions.delete().execute()
+        FecContributions.fill_derived_columns()
+        # Score tables from the old schema are rebuilt by the next full compute
+        ComputeState.delete().execute()
+        StageFingerprints.delete().execute()
+
     # Show database info
     stats = db_manager.get_stats()
     console.print(f"[green]✓[/green] Database initialized: {stats['type']}")
@@ -144,8 +161,13 @@ def fetch_committees(ctx, cycle, all_cycles):
 
 @fetch.command("contributions")
 @click.argument("cycle")
+@click.option(
+    "--extract/--no-extract",
+    default=True,
+    help="Extract the ZIP (use --no-extract to keep it for direct loading)",
+)
 @click.pass_context
-def fetch_contributions(ctx, cycle):
+def fetch_contributions(ctx, cycle, extract):
     """Download FEC committee contribution files (pas2) for a cycle."""
     config = ctx.obj["config"]
     data_dir = config["data_dir"]
@@ -153,7 +175,7 @@ def fetch_contributions(ctx, cycle):
     fetcher = ContributionFetcher(data_dir=data_dir)
 
     try:
-        files = fetcher.fetch_contributions(cycle)
+        files = fetcher.fetch_contributions(cycle, extract=extract)
         console.print(f"[green]✓[/green] Downloaded {len(files)} file(s)")
         for f in files:
             console.print(f"  {f}")
@@ -170,9 +192,13 @@ def load():
 
 @load.command("candidates")
 @click.argument("csv_file", type=click.Path(exists=True))
+@click.option("--batch-size", type=int, default=1000, help="Records per INSERT batch")
+@click.option(
+    "--commit-every", type=int, help="Commit every N batches (default: single transaction)"
+)
 @click.pass_context
-def load_candidates(ctx, csv_file):
-    """Load candidate data from CSV file."""
+def load_candidates(ctx, csv_file, batch_size, commit_every):
+    """Load candidate data from a pipe-delimited FEC file or its ZIP archive."""
     config = ctx.obj["config"]
 
     # Initialize database
@@ -181,7 +207,9 @@ def load_candidates(ctx, csv_file):
     init_models(db)
 
     try:
-        count = FecCandidates.load_from_csv(csv_file)
+        count = FecCandidates.load_from_csv(
+            csv_file, batch_size=batch_size, commit_every=commit_every
+        )
         console.print(f"[green]✓[/green] Loaded {count} candidate records")
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {e}", style="bold red")
@@ -190,9 +218,13 @@ def load_candidates(ctx, csv_file):
 
 @load.command("committees")
 @click.argument("csv_file", type=click.Path(exists=True))
+@click.option("--batch-size", type=int, default=1000, help="Records per INSERT batch")
+@click.option(
+    "--commit-every", type=int, help="Commit every N batches (default: single transaction)"
+)
 @click.pass_context
-def load_committees(ctx, csv_file):
-    """Load committee data from CSV file."""
+def load_committees(ctx, csv_file, batch_size, commit_every):
+    """Load committee data from a pipe-delimited FEC file or its ZIP archive."""
     config = ctx.obj["config"]
 
     # Initialize database
@@ -201,7 +233,9 @@ def load_committees(ctx, csv_file):
     init_models(db)
 
     try:
-        count = FecCommittees.load_from_csv(csv_file)
+        count = FecCommittees.load_from_csv(
+            csv_file, batch_size=batch_size, commit_every=commit_every
+        )
         console.print(f"[green]✓[/green] Loaded {count} committee records")
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {e}", style="bold red")
@@ -210,10 +244,46 @@ def load_committees(ctx, csv_file):
 
 @load.command("contributions")
 @click.argument("csv_file", type=click.Path(exists=True))
+@click.option(
+    "--batch-size",
+    type=int,
+    help="Records per INSERT batch (default: 1000, or 10000 per bulk batch with --fast)",
+)
+@click.option(
+    "--commit-every",
+    type=int,
+    help="Commit every N batches (default: single transaction; not with --fast)",
+)
+@click.option(
+    "--fast", is_flag=True, help="Use the backend's native bulk loader (COPY / LOAD DATA)"
+)
+@click.option(
+    "--workers", type=int, help="Parser processes (default: ingest_workers from config)"
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Upsert into existing rows instead of appending (for refreshed files)",
+)
+@click.option(
+    "--defer-indexes",
+    is_flag=True,
+    help="Drop secondary indexes during the load, then rebuild them and ANALYZE",
+)
 @click.pass_context
-def load_contributions(ctx, csv_file):
-    """Load contribution data from CSV file."""
+def load_contributions(
+    ctx, csv_file, batch_size, commit_every, fast, workers, incremental, defer_indexes
+):
+    """Load contribution data from a pipe-delimited FEC file or its ZIP archive."""
     config = ctx.obj["config"]
+    workers = workers or config.get("ingest_workers", 1)
+
+    if fast and commit_every:
+        # Bulk loaders write the whole file in one transaction
+        console.print(
+            "[red]✗[/red] --commit-every doesn't apply to --fast bulk loads", style="bold red"
+        )
+        sys.exit(1)
 
     # Initialize database
     db_manager = DatabaseManager(config)
@@ -221,8 +291,51 @@ def load_contributions(ctx, csv_file):
     init_models(db)
 
     try:
-        count = FecCommitteeContributions.load_from_csv(csv_file)
-        console.print(f"[green]✓[/green] Loaded {count} contribution records")
+        loader = db_manager.get_bulk_loader(batch_size=batch_size or 10000) if fast else None
+        batch_size = batch_size or 1000
+        if incremental:
+            stats = FecCommitteeContributions.upsert_from_csv(
+                csv_file,
+                batch_size=batch_size,
+                commit_every=commit_every,
+                loader=loader,
+                workers=workers,
+            )
+            console.print(
+                f"[green]✓[/green] Merged {stats.count} contribution records: "
+                f"{stats.inserted} inserted, {stats.updated} updated, "
+                f"{stats.unchanged} unchanged, {stats.superseded} superseded"
+            )
+            if stats.updated or stats.superseded:
+                console.print("  The next compute rescores the changed contributions")
+            return
+
+        if not defer_indexes:
+            count = FecCommitteeContributions.load_from_csv(
+                csv_file,
+                batch_size=batch_size,
+                commit_every=commit_every,
+                loader=loader,
+                workers=workers,
+            )
+            console.print(f"[green]✓[/green] Loaded {count} contribution records")
+            return
+
+        with db_manager.bulk_load([FecCommitteeContributions], workers=workers) as stats:
+            count = FecCommitteeContributions.load_from_csv(
+                csv_file,
+                batch_size=batch_size,
+                commit_every=commit_every,
+                loader=loader,
+                workers=workers,
+            )
+        console.print(
+            f"[green]✓[/green] Loaded {count} contribution records in {stats.load_seconds:.1f}s"
+        )
+        console.print(
+            f"  Built {stats.indexes} indexes in {stats.index_seconds:.1f}s, "
+            f"analyzed in {stats.analyze_seconds:.1f}s"
+        )
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {e}", style="bold red")
         sys.exit(1)
@@ -475,11 +588,38 @@ def info(ctx):
 
 @cli.command()
 @click.option("--mode", type=click.Choice(["overall", "by-cycle"]), default="overall", help="Computation mode")
+@click.option(
+    "--workers",
+    type=int,
+    help="Cycles (by-cycle) or independent score steps (overall) computed at once "
+    "(default: compute_workers from config)",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["sql", "numpy"]),
+    default="sql",
+    help="Compute in the database (sql) or in memory (numpy)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only rescore pairs with contributions added since the last run",
+)
+@click.option(
+    "--force", is_flag=True, help="Rebuild every stage, even those whose inputs haven't changed"
+)
 @click.pass_context
-def compute(ctx, mode):
+def compute(ctx, mode, workers, engine, incremental, force):
     """Compute relationship scores from loaded data."""
     config = ctx.obj["config"]
 
+    if incremental and (mode != "overall" or engine != "sql"):
+        console.print(
+            "[red]✗[/red] --incremental only works with overall mode and the sql engine",
+            style="bold red",
+        )
+        sys.exit(1)
+
     console.print(f"[bold]Computing {mode} relationship scores...[/bold]\n")
 
     # Initialize database
@@ -497,25 +637,52 @@ def compute(ctx, mode):
 
     console.print(f"Found {contrib_count:,} contribution records")
 
+    calc_config = {
+        "weights": config.get_score_weights(),
+        "csv_dir": config.get("csv_dir", "data/csv"),
+        "engine": engine,
+        "force": force,
+        "filters": config.get_contribution_filters(),
+    }
+    workers = workers or config.get("compute_workers", 1)
+
     try:
         if mode == "overall":
-            from bedfellows.calculators import OverallCalculator
+            from bedfellows.calculators import NumpyCalculator, OverallCalculator
 
-            calc_config = {
-                "weights": config.get_score_weights()
-            }
-            calculator = OverallCalculator(db, calc_config)
-            calculator.compute_scores()
+            calc_config["step_workers"] = workers
+            calculator_class = NumpyCalculator if engine == "numpy" else OverallCalculator
+            calculator = calculator_class(db, calc_config)
+            if incremental:
+                calculator.compute_incremental()
+            else:
+                calculator.compute_scores()
 
             # Show results summary
             from bedfellows.models import FinalScores
             total_scores = FinalScores.select().count()
             console.print(f"\n[green]✓[/green] Computed {total_scores:,} relationship scores")
 
+            if config.get("similarity_ann") and total_scores:
+                from bedfellows.ann import PairAnnIndex, ann_index_path
+
+                path = PairAnnIndex.from_database(db).save(ann_index_path(config))
+                console.print(f"[green]✓[/green] Saved approximate pair index to {path}")
+
         else:
-            console.print("[yellow]⚠[/yellow] By-cycle computation not yet implemented")
-            console.print("  Use 'overall' mode for now")
-            sys.exit(1)
+            from bedfellows.calculators import ByCycleCalculator
+            from bedfellows.models import CycleFinalScores
+
+            calc_config["workers"] = workers
+            calculator = ByCycleCalculator(db, calc_config)
+            calculator.compute_scores()
+
+            total_scores = CycleFinalScores.select().count()
+            cycles = CycleFinalScores.select(CycleFinalScores.cycle).distinct().count()
+            console.print(
+                f"\n[green]✓[/green] Computed {total_scores:,} relationship scores "
+                f"across {cycles} cycles"
+            )
 
     except Exception as e:
         console.print(f"[red]✗[/red] Error computing scores: {e}", style="bold red")
@@ -525,6 +692,67 @@ def compute(ctx, mode):
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--mode",
+    type=click.Choice(["overall", "by-cycle"]),
+    default="overall",
+    help="Reweight final_scores (overall) or cycle_final_scores (by-cycle)",
+)
+@click.option("--exclusivity", type=float, help="Exclusivity score weight")
+@click.option("--report-type", type=float, help="Report type score weight")
+@click.option("--periodicity", type=float, help="Periodicity score weight")
+@click.option("--maxed-out", type=float, help="Maxed out score weight")
+@click.option("--length", type=float, help="Length score weight")
+@click.option("--race-focus", type=float, help="Race focus score weight")
+@click.pass_context
+def reweight(ctx, mode, **weights):
+    """Recombine computed scores with new weights, without recomputing them.
+
+    Weights not given on the command line come from the configuration.
+    """
+    config = ctx.obj["config"]
+
+    db_manager = DatabaseManager(config)
+    db = db_manager.get_database()
+    init_models(db)
+
+    from bedfellows.calculators import OverallCalculator
+    from bedfellows.models import CycleFinalScores
+
+    model = CycleFinalScores if mode == "by-cycle" else FinalScores
+    if not model.table_exists() or model.select().count() == 0:
+        console.print("[red]✗[/red] No scores found!", style="bold red")
+        console.print("Please compute scores first using:")
+        console.print(f"  bedfellows compute --mode {mode}")
+        sys.exit(1)
+
+    weights = {name: value for name, value in weights.items() if value is not None}
+    calculator = OverallCalculator(
+        db,
+        {
+            "weights": config.get_score_weights(),
+            "csv_dir": config.get("csv_dir", "data/csv"),
+        },
+    )
+    try:
+        count = calculator.reweight(weights, model)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] {e}", style="bold red")
+        sys.exit(1)
+
+    table = Table(title="Score Weights")
+    table.add_column("Score", style="cyan")
+    table.add_column("Weight", justify="right")
+    for score_type, weight in calculator.weights.items():
+        table.add_row(score_type, f"{weight:g}")
+    console.print(table)
+    console.print(
+        f"\n[green]✓[/green] Reweighted {count:,} scores "
+        f"in {calculator.step_timings['reweight']:.2f}s"
+    )
+
+
 @cli.command()
 @click.argument("query", required=False)
 @click.option("--limit", "-l", type=int, default=20, help="Number of results")
@@ -598,6 +826,183 @@ def search(ctx, query, limit, donor, recipient, min_score):
     console.print(f"\nShowing {len(results)} of {score_count:,} total scores")
 
 
+@cli.command()
+@click.argument("kind", type=click.Choice(["contributor", "recipient", "pair"]), required=False)
+@click.argument("fecids", nargs=-1)
+@click.option(
+    "--limit",
+    "-l",
+    type=int,
+    help="Number of results (default: 10, or similarity_top_k from config with --all)",
+)
+@click.option(
+    "--all",
+    "all_committees",
+    is_flag=True,
+    help="Write every contributor's and recipient's most similar committees "
+    "to similar_committees",
+)
+@click.option(
+    "--workers", type=int, help="Processes for --all (default: similarity_workers from config)"
+)
+@click.option(
+    "--memory-mb",
+    type=int,
+    help="RAM budget for --all (default: similarity_memory_mb from config)",
+)
+@click.option(
+    "--approx",
+    is_flag=True,
+    help="Answer a pair query from the approximate index and report its recall",
+)
+@click.option(
+    "--probes",
+    type=int,
+    help="Index lists searched with --approx (default: similarity_ann_probes from config)",
+)
+@click.pass_context
+def similar(ctx, kind, fecids, limit, all_committees, workers, memory_mb, approx, probes):
+    """Find the contributors, recipients or pairs most like a given one.
+
+    Takes a committee's FEC ID, or a contributor's and a recipient's FEC ID
+    for pairs. Similarity is the cosine of the angle between score vectors.
+    With --all, precomputes the most similar committees for everyone instead.
+    With --approx, pair queries search the approximate index saved next to
+    the database and are checked against the exact answer.
+    """
+    import time
+
+    from bedfellows.similarity import Similarity, compute_similar_committees
+
+    config = ctx.obj["config"]
+
+    if all_committees:
+        if kind or fecids:
+            console.print("[red]✗[/red] --all takes no KIND or FEC IDs", style="bold red")
+            sys.exit(1)
+    elif kind is None:
+        console.print(
+            "[red]✗[/red] Give contributor, recipient or pair and FEC ID(s), or --all",
+            style="bold red",
+        )
+        sys.exit(1)
+    elif approx and kind != "pair":
+        console.print("[red]✗[/red] --approx only works with pair similarity", style="bold red")
+        sys.exit(1)
+    elif len(fecids) != (2 if kind == "pair" else 1):
+        console.print(
+            f"[red]✗[/red] {kind} similarity takes "
+            f"{'a contributor and a recipient FEC ID' if kind == 'pair' else 'one FEC ID'}",
+            style="bold red",
+        )
+        sys.exit(1)
+
+    db_manager = DatabaseManager(config)
+    db = db_manager.get_database()
+    init_models(db)
+
+    if not FinalScores.table_exists() or FinalScores.select().count() == 0:
+        console.print("[red]✗[/red] No scores found!", style="bold red")
+        console.print("Please compute scores first using:")
+        console.print("  bedfellows compute")
+        sys.exit(1)
+
+    if all_committees:
+        started = time.perf_counter()
+        try:
+            count = compute_similar_committees(
+                db,
+                k=limit if limit is not None else config.get("similarity_top_k", 10),
+                memory_mb=(
+                    memory_mb if memory_mb is not None else config.get("similarity_memory_mb", 512)
+                ),
+                workers=workers or config.get("similarity_workers", 1),
+            )
+        except ValueError as e:
+            console.print(f"[red]✗[/red] {e}", style="bold red")
+            sys.exit(1)
+        console.print(
+            f"[green]✓[/green] Wrote {count:,} similar committees "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return
+
+    limit = limit or 10
+    if approx:
+        _similar_approx(config, db, fecids, limit, probes)
+        return
+
+    key = tuple(fecids) if kind == "pair" else fecids[0]
+    similarity = Similarity.from_database(db)
+    started = time.perf_counter()
+    try:
+        results = similarity.most_similar(kind, key, limit)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] {e}", style="bold red")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    table = Table(title=f"{kind.title()}s Most Similar to {' → '.join(fecids)}")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("FEC ID", style="cyan")
+    table.add_column("Name", style="green", width=40)
+    table.add_column("Similarity", justify="right", style="bold yellow")
+    for i, (match, name, score) in enumerate(results, 1):
+        match = " → ".join(match) if kind == "pair" else match
+        table.add_row(str(i), match, (name or "N/A")[:40], f"{score:.4f}")
+
+    console.print(table)
+    console.print(
+        f"\nCompared against {len(similarity.indexes[kind]):,} {kind}s "
+        f"in {elapsed * 1000:.1f} ms"
+    )
+
+
+def _similar_approx(config, db, fecids, limit, probes):
+    """Answer a pair query from the approximate index and compare it to the exact one."""
+    import time
+
+    from bedfellows.ann import PairAnnIndex, ann_index_path, pair_names, recall
+
+    path = ann_index_path(config)
+    index = PairAnnIndex.load(path) if path.exists() else None
+    if index is None or not index.is_current(db):
+        console.print(
+            f"[yellow]Building approximate pair index "
+            f"({'missing' if index is None else 'scores changed'})...[/yellow]"
+        )
+        index = PairAnnIndex.from_database(db)
+        index.save(path)
+
+    n_probe = probes or config.get("similarity_ann_probes", 8)
+    try:
+        started = time.perf_counter()
+        results = index.search(*fecids, k=limit, n_probe=n_probe)
+        approx_elapsed = time.perf_counter() - started
+        started = time.perf_counter()
+        exact = index.exact(*fecids, k=limit)
+        exact_elapsed = time.perf_counter() - started
+    except ValueError as e:
+        console.print(f"[red]✗[/red] {e}", style="bold red")
+        sys.exit(1)
+
+    table = Table(title=f"Pairs Most Similar to {' → '.join(fecids)} (approximate)")
+    table.add_column("#", style="dim", width=4)
+    table.add_column("FEC ID", style="cyan")
+    table.add_column("Name", style="green", width=40)
+    table.add_column("Similarity", justify="right", style="bold yellow")
+    names = pair_names(db, [match for match, _ in results])
+    for i, ((match, score), name) in enumerate(zip(results, names, strict=True), 1):
+        table.add_row(str(i), " → ".join(match), name[:40], f"{score:.4f}")
+
+    console.print(table)
+    console.print(
+        f"\nrecall@{limit} vs exact: {recall(results, exact):.2f} "
+        f"({approx_elapsed * 1000:.1f} ms searching {n_probe} of {len(index.centroids):,} lists, "
+        f"{exact_elapsed * 1000:.1f} ms over all {len(index):,} pairs)"
+    )
+
+
 def main():
     """Main entry point."""
     cli(obj={})
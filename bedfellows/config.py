@@ -30,6 +30,7 @@ class Config:
         "mysql_user": "root",
         "mysql_password": "",
         "mysql_database": "fec",
+        "mysql_local_infile": False,
         "postgres_host": "localhost",
         "postgres_port": 5432,
         "postgres_user": "postgres",
@@ -38,6 +39,24 @@ class Config:
         # FEC Data
         "fec_bulk_data_url": "https://www.fec.gov/files/bulk-downloads/",
         "data_dir": "data",
+        "csv_dir": "data/csv",
+        # Ingest
+        "ingest_workers": 1,
+        # Compute
+        "compute_workers": 1,
+        # Batch similarity ('bedfellows similar --all')
+        "similarity_workers": 1,
+        "similarity_memory_mb": 512,
+        "similarity_top_k": 10,
+        # Approximate pair index ('bedfellows similar pair --approx')
+        "similarity_ann": False,
+        "similarity_ann_probes": 8,
+        # Contribution filters applied when building fec_contributions
+        # (comma-separated lists; empty disables a filter)
+        "filter_transaction_types": "24K",
+        "filter_entity_types": "PAC,CCM",
+        "filter_min_date": "2003-01-01",
+        "filter_exclude_super_pacs": True,
         # Scoring weights
         "weight_exclusivity": 1.0,
         "weight_report_type": 1.0,
@@ -112,6 +131,10 @@ class Config:
                 self.config["mysql_password"] = parser.get("database", "mysql_password")
             if parser.has_option("database", "mysql_database"):
                 self.config["mysql_database"] = parser.get("database", "mysql_database")
+            if parser.has_option("database", "mysql_local_infile"):
+                self.config["mysql_local_infile"] = parser.getboolean(
+                    "database", "mysql_local_infile"
+                )
             # PostgreSQL
             if parser.has_option("database", "postgres_host"):
                 self.config["postgres_host"] = parser.get("database", "postgres_host")
@@ -132,6 +155,37 @@ class Config:
             self.config["data_dir"] = parser.get(
                 "fec", "data_dir", fallback=self.config["data_dir"]
             )
+            self.config["csv_dir"] = parser.get(
+                "fec", "csv_dir", fallback=self.config["csv_dir"]
+            )
+
+        # Ingest section
+        if parser.has_section("ingest"):
+            if parser.has_option("ingest", "workers"):
+                self.config["ingest_workers"] = parser.getint("ingest", "workers")
+
+        # Compute section
+        if parser.has_section("compute"):
+            if parser.has_option("compute", "workers"):
+                self.config["compute_workers"] = parser.getint("compute", "workers")
+
+        # Similarity section
+        if parser.has_section("similarity"):
+            for option in ["workers", "memory_mb", "top_k", "ann_probes"]:
+                if parser.has_option("similarity", option):
+                    self.config[f"similarity_{option}"] = parser.getint("similarity", option)
+            if parser.has_option("similarity", "ann"):
+                self.config["similarity_ann"] = parser.getboolean("similarity", "ann")
+
+        # Filters section
+        if parser.has_section("filters"):
+            for option in ["transaction_types", "entity_types", "min_date"]:
+                if parser.has_option("filters", option):
+                    self.config[f"filter_{option}"] = parser.get("filters", option)
+            if parser.has_option("filters", "exclude_super_pacs"):
+                self.config["filter_exclude_super_pacs"] = parser.getboolean(
+                    "filters", "exclude_super_pacs"
+                )
 
         # Scoring section
         if parser.has_section("scoring"):
@@ -183,6 +237,12 @@ class Config:
             self.config["mysql_password"] = os.getenv("MYSQL_PASSWORD")
         if os.getenv("MYSQL_DATABASE"):
             self.config["mysql_database"] = os.getenv("MYSQL_DATABASE")
+        if os.getenv("MYSQL_LOCAL_INFILE"):
+            self.config["mysql_local_infile"] = os.getenv("MYSQL_LOCAL_INFILE").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
 
         # PostgreSQL
         if os.getenv("POSTGRES_HOST"):
@@ -201,6 +261,38 @@ class Config:
             self.config["fec_bulk_data_url"] = os.getenv("FEC_BULK_DATA_URL")
         if os.getenv("DATA_DIR"):
             self.config["data_dir"] = os.getenv("DATA_DIR")
+        if os.getenv("CSV_DIR"):
+            self.config["csv_dir"] = os.getenv("CSV_DIR")
+
+        # Ingest
+        if os.getenv("INGEST_WORKERS"):
+            self.config["ingest_workers"] = int(os.getenv("INGEST_WORKERS"))
+
+        # Compute
+        if os.getenv("COMPUTE_WORKERS"):
+            self.config["compute_workers"] = int(os.getenv("COMPUTE_WORKERS"))
+
+        # Batch similarity
+        for option in ["WORKERS", "MEMORY_MB", "TOP_K", "ANN_PROBES"]:
+            env_val = os.getenv(f"SIMILARITY_{option}")
+            if env_val:
+                self.config[f"similarity_{option.lower()}"] = int(env_val)
+        if os.getenv("SIMILARITY_ANN"):
+            self.config["similarity_ann"] = os.getenv("SIMILARITY_ANN").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+
+        # Contribution filters (set to an empty string to disable one)
+        for option in ["TRANSACTION_TYPES", "ENTITY_TYPES", "MIN_DATE"]:
+            env_val = os.getenv(f"FILTER_{option}")
+            if env_val is not None:
+                self.config[f"filter_{option.lower()}"] = env_val
+        if os.getenv("FILTER_EXCLUDE_SUPER_PACS"):
+            self.config["filter_exclude_super_pacs"] = os.getenv(
+                "FILTER_EXCLUDE_SUPER_PACS"
+            ).lower() in ("1", "true", "yes")
 
         # Scoring weights
         for weight in [
@@ -270,6 +362,7 @@ class Config:
                 "user": self.config["mysql_user"],
                 "password": self.config["mysql_password"],
                 "database": self.config["mysql_database"],
+                "local_infile": self.config["mysql_local_infile"],
             }
         elif db_type == "postgresql":
             return {
@@ -299,6 +392,28 @@ class Config:
             "race_focus": self.config["weight_race_focus"],
         }
 
+    def get_contribution_filters(self) -> Dict[str, Any]:
+        """
+        Get the filters applied when building fec_contributions.
+
+        Returns:
+            Dictionary of filters for FecContributions.load_from_committee_contributions,
+            with None for any filter that is disabled
+        """
+
+        def codes(value: Any) -> Optional[list]:
+            if isinstance(value, (list, tuple)):
+                return list(value) or None
+            parsed = [code.strip() for code in str(value or "").split(",") if code.strip()]
+            return parsed or None
+
+        return {
+            "transaction_types": codes(self.config["filter_transaction_types"]),
+            "entity_types": codes(self.config["filter_entity_types"]),
+            "min_date": self.config["filter_min_date"] or None,
+            "exclude_super_pacs": bool(self.config["filter_exclude_super_pacs"]),
+        }
+
     def setup_logging(self) -> None:
         """Configure logging based on settings."""
         log_level = getattr(logging, self.config["log_level"].upper())
@@ -6,7 +6,10 @@ using Peewee ORM.
 """
 
 import logging
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List
 from pathlib import Path
 
 from peewee import (
@@ -15,13 +18,51 @@ from peewee import (
     MySQLDatabase,
     PostgresqlDatabase,
     Model,
+    Index,
 )
+from playhouse.migrate import SchemaMigrator, migrate
 
 from bedfellows.config import Config
+from bedfellows.loaders.bulk import BulkLoader, bulk_loader_for
 
 logger = logging.getLogger(__name__)
 
 
+def _quote(db: Database, name: str) -> str:
+    """Quote an identifier with the backend's quote characters."""
+    return f"{db.quote[0]}{name}{db.quote[1]}"
+
+
+class IndexBuildStats:
+    """Timing of a deferred index build, reported apart from the load itself."""
+
+    def __init__(self, table_names: List[str]):
+        self.table_names = table_names
+        self.started = time.perf_counter()
+        self.load_seconds = 0.0
+        self.indexes = 0
+        self.index_seconds = 0.0
+        self.analyze_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the timings as a plain dict."""
+        return {
+            "tables": self.table_names,
+            "load_seconds": round(self.load_seconds, 2),
+            "indexes": self.indexes,
+            "index_seconds": round(self.index_seconds, 2),
+            "analyze_seconds": round(self.analyze_seconds, 2),
+        }
+
+    def summary(self) -> str:
+        """One-line human-readable summary."""
+        return (
+            f"Loaded {', '.join(self.table_names)} in {self.load_seconds:.1f}s, "
+            f"built {self.indexes} indexes in {self.index_seconds:.1f}s, "
+            f"analyzed in {self.analyze_seconds:.1f}s"
+        )
+
+
 class DatabaseManager:
     """Manages database connections and initialization."""
 
@@ -75,6 +116,11 @@ class DatabaseManager:
                 logger.info(f"Created new SQLite database: {db_config['database']}")
 
         elif db_type == "mysql":
+            connect_kwargs = {}
+            if db_config.get("local_infile"):
+                # Required by the LOAD DATA LOCAL INFILE bulk loader
+                connect_kwargs["local_infile"] = True
+
             self._database = MySQLDatabase(
                 db_config["database"],
                 host=db_config["host"],
@@ -82,6 +128,7 @@ class DatabaseManager:
                 user=db_config["user"],
                 password=db_config["password"],
                 charset="utf8mb4",
+                **connect_kwargs,
             )
             logger.info(
                 f"Initialized MySQL database: {db_config['user']}@{db_config['host']}/{db_config['database']}"
@@ -130,6 +177,191 @@ class DatabaseManager:
             if not db.is_closed():
                 db.close()
 
+    def migrate_schema(self, models: list) -> List[str]:
+        """
+        Add columns that newer model fields need to tables that already exist.
+
+        Only nullable columns are added (with their single-column indexes);
+        nothing is dropped or altered. Tables that don't exist yet are left
+        to ``init_tables`` / ``create_all_tables``.
+
+        Args:
+            models: List of Peewee model classes
+
+        Returns:
+            Added columns, as "table.column"
+        """
+        db = self.get_database()
+        migrator = SchemaMigrator.from_database(db)
+        operations = []
+        added = []
+
+        for model in models:
+            table = model._meta.table_name
+            if not db.table_exists(table):
+                continue
+            existing = {column.name for column in db.get_columns(table)}
+            for field in model._meta.sorted_fields:
+                if field.column_name in existing:
+                    continue
+                if not field.null:
+                    logger.warning(
+                        f"Can't add required column {table}.{field.column_name}; "
+                        f"drop the table to recreate it"
+                    )
+                    continue
+                operations.append(migrator.add_column(table, field.column_name, field))
+                added.append(f"{table}.{field.column_name}")
+
+        if operations:
+            with db.atomic():
+                migrate(*operations)
+            logger.info(f"Added columns: {', '.join(added)}")
+        return added
+
+    def _secondary_indexes(self, model: Model) -> List[Index]:
+        """Non-unique indexes of a model; unique ones stay since they enforce constraints."""
+        return [index for index in model._meta.fields_to_index() if not index._unique]
+
+    def drop_indexes(self, models: list) -> int:
+        """
+        Drop the non-unique indexes of the given models' tables.
+
+        Args:
+            models: List of Peewee model classes
+
+        Returns:
+            Number of indexes dropped
+        """
+        db = self.get_database()
+        mysql = isinstance(db, MySQLDatabase)
+        dropped = 0
+        for model in models:
+            table = model._meta.table_name
+            existing = {index.name for index in db.get_indexes(table)}
+            for index in self._secondary_indexes(model):
+                if index._name not in existing:
+                    continue
+                on_table = f" ON {_quote(db, table)}" if mysql else ""
+                db.execute_sql(f"DROP INDEX {_quote(db, index._name)}{on_table}")
+                dropped += 1
+        return dropped
+
+    def build_indexes(self, models: list, workers: int = 1) -> int:
+        """
+        Create the given models' indexes that don't exist yet.
+
+        On PostgreSQL each index builds on its own connection, up to
+        ``workers`` at once; SQLite and MySQL build them one after another
+        (MySQL serializes ALTERs on a table anyway).
+
+        Args:
+            models: List of Peewee model classes
+            workers: Concurrent index builds on PostgreSQL
+
+        Returns:
+            Number of indexes created
+        """
+        db = self.get_database()
+        statements = []
+        for model in models:
+            existing = {index.name for index in db.get_indexes(model._meta.table_name)}
+            for index in model._meta.fields_to_index():
+                if index._name not in existing:
+                    statements.append(model._schema._create_index(index, safe=False).query())
+
+        parallel = workers > 1 and isinstance(db, PostgresqlDatabase) and len(statements) > 1
+
+        def build(statement):
+            sql, params = statement
+            db.connect(reuse_if_open=True)
+            try:
+                db.execute_sql(sql, params)
+            finally:
+                if parallel:
+                    db.close()
+
+        if parallel:
+            # Peewee keeps one connection per thread, so each build gets its own
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(build, statements))
+        else:
+            for statement in statements:
+                build(statement)
+        return len(statements)
+
+    def analyze(self, models: list) -> None:
+        """
+        Refresh planner statistics for the given models' tables.
+
+        Args:
+            models: List of Peewee model classes
+        """
+        db = self.get_database()
+        for model in models:
+            table = _quote(db, model._meta.table_name)
+            if isinstance(db, PostgresqlDatabase):
+                db.execute_sql(f"VACUUM ANALYZE {table}")
+            elif isinstance(db, MySQLDatabase):
+                db.execute_sql(f"ANALYZE TABLE {table}").fetchall()
+            else:
+                db.execute_sql(f"ANALYZE {table}")
+
+    @contextmanager
+    def bulk_load(self, models: list, workers: int = 1) -> Iterator[IndexBuildStats]:
+        """
+        Load into tables without their secondary indexes, then rebuild and analyze.
+
+        Tables are created without indexes if missing and existing
+        non-unique indexes are dropped, so the load only appends rows.
+        Afterwards the indexes are rebuilt (even if the load failed) and,
+        on success, the tables are analyzed so the calculator queries get
+        good plans.
+
+        Args:
+            models: Peewee model classes about to be bulk loaded
+            workers: Concurrent index builds on PostgreSQL
+
+        Yields:
+            Stats whose index and analyze timings are filled in on exit
+        """
+        db = self.get_database()
+        db.connect(reuse_if_open=True)
+        for model in models:
+            model._schema.create_table(safe=True)
+        dropped = self.drop_indexes(models)
+        logger.info(f"Deferred {dropped} indexes until the load finishes")
+
+        stats = IndexBuildStats([model._meta.table_name for model in models])
+        try:
+            yield stats
+        finally:
+            stats.load_seconds = time.perf_counter() - stats.started
+            started = time.perf_counter()
+            stats.indexes = self.build_indexes(models, workers)
+            stats.index_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.analyze(models)
+        stats.analyze_seconds = time.perf_counter() - started
+        logger.info(stats.summary())
+
+    def get_bulk_loader(self, batch_size: int = 10000) -> BulkLoader:
+        """
+        Get the native bulk loader for the configured backend.
+
+        Args:
+            batch_size: Rows per executemany call / progress update
+
+        Returns:
+            Bulk loader instance (executemany on SQLite, COPY on PostgreSQL,
+            LOAD DATA LOCAL INFILE on MySQL)
+
+        Raises:
+            ValueError: If database type is unsupported
+        """
+        return bulk_loader_for(self.get_database(), batch_size)
+
     def drop_tables(self, models: list, safe: bool = True) -> None:
         """
         Drop database tables for given models.
@@ -112,7 +112,11 @@ class BaseFetcher:
         return extracted_files
 
     def download_and_extract(
-        self, url: str, output_dir: Optional[Path] = None, keep_zip: bool = False
+        self,
+        url: str,
+        output_dir: Optional[Path] = None,
+        keep_zip: bool = False,
+        extract: bool = True,
     ) -> List[Path]:
         """
         Download and extract a ZIP file.
@@ -121,13 +125,18 @@ class BaseFetcher:
             url: URL to download
             output_dir: Directory for extracted files
             keep_zip: Whether to keep the ZIP file after extraction
+            extract: Whether to extract at all; if False the ZIP is kept and
+                returned so loaders can stream it without a copy on disk
 
         Returns:
-            List of extracted file paths
+            List of extracted file paths (or the ZIP path if not extracting)
         """
         # Download
         zip_path = self.download_file(url)
 
+        if not extract:
+            return [zip_path]
+
         # Extract
         extracted = self.extract_zip(zip_path, output_dir or self.data_dir)
 
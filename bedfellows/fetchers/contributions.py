@@ -13,13 +13,15 @@ class ContributionFetcher(BaseFetcher):
     """Download FEC committee contribution files."""
 
     def fetch_contributions(
-        self, cycle: str
+        self, cycle: str, extract: bool = True
     ) -> List[Path]:
         """
         Download committee-to-committee contribution file (pas2) for a cycle.
 
         Args:
             cycle: Election cycle (e.g., "2024", "22")
+            extract: Whether to extract the ZIP (False keeps the archive for
+                direct loading)
 
         Returns:
             List of downloaded file paths
@@ -37,7 +39,9 @@ class ContributionFetcher(BaseFetcher):
         url = self.build_url(cycle_4digit, filename)
 
         try:
-            extracted = self.download_and_extract(url, output_dir=self.data_dir)
+            extracted = self.download_and_extract(
+                url, output_dir=self.data_dir, extract=extract
+            )
             logger.info(
                 f"Downloaded committee contributions for cycle {cycle}"
             )
@@ -49,7 +53,7 @@ class ContributionFetcher(BaseFetcher):
             raise
 
     def fetch_all_cycles(
-        self, start_cycle: str, end_cycle: Optional[str] = None
+        self, start_cycle: str, end_cycle: Optional[str] = None, extract: bool = True
     ) -> List[Path]:
         """
         Download committee contributions for multiple cycles.
@@ -57,6 +61,7 @@ class ContributionFetcher(BaseFetcher):
         Args:
             start_cycle: Starting cycle (e.g., "2004")
             end_cycle: Ending cycle (defaults to current cycle)
+            extract: Whether to extract each ZIP
 
         Returns:
             List of all downloaded file paths
@@ -77,7 +82,7 @@ class ContributionFetcher(BaseFetcher):
         for year in range(start_year, end_year + 1, 2):
             cycle = str(year)[2:]  # Get 2-digit year
             try:
-                files = self.fetch_contributions(cycle)
+                files = self.fetch_contributions(cycle, extract=extract)
                 all_files.extend(files)
             except Exception as e:
                 logger.warning(f"Skipping cycle {year}: {e}")
@@ -0,0 +1,53 @@
+"""
+Data loaders for ingesting FEC bulk files into the database.
+"""
+
+from bedfellows.loaders.base import (
+    IngestStats,
+    chunked,
+    election_cycle,
+    file_cycle,
+    format_fec_date,
+    parse_fec_amount,
+    parse_fec_date,
+    peak_memory_mb,
+    stream_insert,
+)
+from bedfellows.loaders.bulk import (
+    BulkLoader,
+    MySQLBulkLoader,
+    PostgresBulkLoader,
+    SqliteBulkLoader,
+    bulk_loader_for,
+)
+from bedfellows.loaders.parallel import (
+    iter_parsed_batches,
+    iter_parsed_rows,
+    split_byte_ranges,
+)
+from bedfellows.loaders.sources import is_zip_source, open_source
+from bedfellows.loaders.upsert import UpsertStats, incremental_load
+
+__all__ = [
+    "BulkLoader",
+    "MySQLBulkLoader",
+    "PostgresBulkLoader",
+    "SqliteBulkLoader",
+    "IngestStats",
+    "UpsertStats",
+    "bulk_loader_for",
+    "chunked",
+    "election_cycle",
+    "file_cycle",
+    "incremental_load",
+    "is_zip_source",
+    "iter_parsed_batches",
+    "iter_parsed_rows",
+    "open_source",
+    "format_fec_date",
+    "parse_fec_amount",
+    "parse_fec_date",
+    "peak_memory_mb",
+    "split_byte_ranges",
+    "stream_insert",
+]
@@ -0,0 +1,265 @@
+"""Streaming ingest helpers shared by the FEC file loaders."""
+
+import logging
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+
+def chunked(iterable, n):
+    """Yield successive n-sized chunks from iterable."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == n:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_fec_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an FEC MMDDYYYY date.
+
+    Slices the string instead of calling ``datetime.strptime``, which is
+    several times slower and dominates parse time on large files.
+
+    Args:
+        value: Raw date string from an FEC bulk file
+
+    Returns:
+        Parsed datetime, or None if the value is missing or invalid
+    """
+    if not value or len(value) != 8 or not value.isdigit():
+        return None
+    try:
+        return datetime(int(value[4:]), int(value[:2]), int(value[2:4]))
+    except ValueError:
+        return None
+
+
+def format_fec_date(value: Optional[str]) -> Optional[str]:
+    """
+    Convert an FEC MMDDYYYY date to the database's datetime text format.
+
+    Args:
+        value: Raw date string from an FEC bulk file
+
+    Returns:
+        Date as 'YYYY-MM-DD 00:00:00', or None if missing or invalid
+    """
+    parsed = parse_fec_date(value)
+    if parsed is None:
+        return None
+    return f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d} 00:00:00"
+
+
+def parse_fec_amount(value: Optional[str]) -> Optional[int]:
+    """
+    Parse an FEC whole-dollar transaction amount.
+
+    Args:
+        value: Raw amount string from an FEC bulk file
+
+    Returns:
+        Amount as an integer, or None if missing or not an integer
+    """
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def election_cycle(year: Optional[int]) -> Optional[str]:
+    """
+    Get the two-year election cycle a calendar year falls in.
+
+    Args:
+        year: Calendar year of a transaction
+
+    Returns:
+        Cycle as text (the even year ending it, e.g. '2024'), or None
+    """
+    if year is None:
+        return None
+    return str(year + year % 2)
+
+
+def file_cycle(path: Any) -> Optional[str]:
+    """
+    Get the cycle from an FEC bulk file name such as ``cm24.zip`` or ``pas224.zip``.
+
+    Args:
+        path: Path to the downloaded file
+
+    Returns:
+        Cycle as text, or None if the name doesn't end in a two-digit year
+    """
+    name = Path(path).name.split(".", 1)[0]
+    match = re.search(r"(\d{2})$", name)
+    if not match:
+        return None
+    year = int(match.group(1))
+    return election_cycle(year + (1900 if year >= 70 else 2000))
+
+
+def peak_memory_mb() -> Optional[float]:
+    """
+    Get the peak resident set size of the current process.
+
+    Returns:
+        Peak RSS in megabytes, or None if the platform doesn't report it
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+class IngestStats:
+    """Row count, throughput and memory figures for a single load."""
+
+    def __init__(self, table_name: str):
+        """
+        Initialize ingest statistics.
+
+        Args:
+            table_name: Name of the table being loaded
+        """
+        self.table_name = table_name
+        self.count = 0
+        self.batches = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.peak_memory_mb: Optional[float] = None
+
+    def finish(self) -> "IngestStats":
+        """Record elapsed time and peak memory at the end of a load."""
+        self.elapsed = time.perf_counter() - self.started
+        self.peak_memory_mb = peak_memory_mb()
+        return self
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows loaded per second of wall-clock time."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.count / self.elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get statistics as a dictionary.
+
+        Returns:
+            Dictionary of ingest statistics
+        """
+        return {
+            "table": self.table_name,
+            "rows": self.count,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "peak_memory_mb": (
+                round(self.peak_memory_mb, 1) if self.peak_memory_mb is not None else None
+            ),
+        }
+
+    def summary(self) -> str:
+        """Get a one-line human readable summary."""
+        memory = (
+            f"{self.peak_memory_mb:.1f} MB" if self.peak_memory_mb is not None else "n/a"
+        )
+        return (
+            f"Loaded {self.count:,} records into {self.table_name} in {self.elapsed:.1f}s "
+            f"({self.rows_per_second:,.0f} rows/sec, peak memory {memory})"
+        )
+
+
+class FilterStats(IngestStats):
+    """Source rows considered and kept when filtering one table into another."""
+
+    def __init__(self, table_name: str):
+        """
+        Initialize filter statistics.
+
+        Args:
+            table_name: Destination table name
+        """
+        super().__init__(table_name)
+        self.considered = 0
+
+    @property
+    def dropped(self) -> int:
+        """Source rows the filters removed."""
+        return self.considered - self.count
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return statistics as a dictionary."""
+        stats = super().as_dict()
+        stats.update(considered=self.considered, dropped=self.dropped)
+        return stats
+
+    def summary(self) -> str:
+        """Return a one-line human readable summary."""
+        return (
+            f"Filtered {self.considered:,} source rows into {self.count:,} "
+            f"{self.table_name} records ({self.dropped:,} dropped) in {self.elapsed:.1f}s"
+        )
+
+
+def stream_insert(
+    model,
+    rows: Iterable[Any],
+    batch_size: int = 1000,
+    commit_every: Optional[int] = None,
+    desc: str = "Loading batches",
+    fields: Optional[List[Any]] = None,
+) -> IngestStats:
+    """
+    Insert rows into a model's table without materializing the input.
+
+    Rows are pulled from the iterable one batch at a time, so memory use is
+    bounded by ``batch_size`` rather than by the size of the source file.
+
+    Args:
+        model: Peewee model class to insert into
+        rows: Iterable of row dictionaries (or tuples when ``fields`` is given)
+        batch_size: Number of records per INSERT
+        commit_every: Commit after this many batches (None = single transaction)
+        desc: Progress bar description
+        fields: Model fields in tuple order, for rows given as tuples
+
+    Returns:
+        Ingest statistics for the load
+    """
+    db = model._meta.database
+    stats = IngestStats(model._meta.table_name)
+
+    with db.atomic() as txn:
+        for batch in tqdm(chunked(rows, batch_size), desc=desc):
+            model.insert_many(batch, fields=fields).execute()
+            stats.count += len(batch)
+            stats.batches += 1
+
+            if commit_every and stats.batches % commit_every == 0:
+                txn.commit()
+
+    stats.finish()
+    logger.info(stats.summary())
+    return stats
@@ -0,0 +1,271 @@
+"""
+Backend-native bulk loaders.
+
+These bypass the ORM's per-batch INSERT statements and hand prepared row
+tuples to the fastest ingest path each database offers:
+
+- SQLite: ``executemany`` of a prepared INSERT
+- PostgreSQL: ``COPY ... FROM STDIN``
+- MySQL: ``LOAD DATA LOCAL INFILE``
+"""
+
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, List, Optional, Sequence
+
+from peewee import Database, MySQLDatabase, PostgresqlDatabase, SqliteDatabase
+from tqdm import tqdm
+
+from bedfellows.loaders.base import IngestStats, chunked
+
+logger = logging.getLogger(__name__)
+
+
+def escape_copy_value(value: Any) -> str:
+    """
+    Encode a value for PostgreSQL COPY / MySQL LOAD DATA text format.
+
+    Args:
+        value: Python value to encode
+
+    Returns:
+        Escaped text field (NULL is encoded as \\N)
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    text = str(value)
+    if "\\" in text or "\t" in text or "\n" in text or "\r" in text:
+        text = (
+            text.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    return text
+
+
+def format_copy_line(row: Sequence[Any]) -> str:
+    """Encode a row tuple as one tab-separated text-format line."""
+    return "\t".join(escape_copy_value(value) for value in row) + "\n"
+
+
+class RowStream:
+    """Read-only file object that renders row tuples as COPY text on demand."""
+
+    def __init__(self, rows: Iterable[Sequence[Any]], progress: Optional[tqdm] = None):
+        """
+        Initialize row stream.
+
+        Args:
+            rows: Iterable of row tuples
+            progress: Optional progress bar updated per row
+        """
+        self._rows = iter(rows)
+        self._buffer = ""
+        self._progress = progress
+        self.count = 0
+
+    def _next_line(self) -> str:
+        row = next(self._rows, None)
+        if row is None:
+            return ""
+        self.count += 1
+        if self._progress is not None:
+            self._progress.update(1)
+        return format_copy_line(row)
+
+    def readline(self, size: int = -1) -> str:
+        """Return the next encoded row."""
+        if self._buffer:
+            line, self._buffer = self._buffer, ""
+            return line
+        return self._next_line()
+
+    def read(self, size: int = -1) -> str:
+        """Return up to ``size`` characters of encoded rows."""
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = self._next_line()
+            if not line:
+                break
+            chunks.append(line)
+            length += len(line)
+
+        data = "".join(chunks)
+        if size >= 0 and len(data) > size:
+            data, self._buffer = data[:size], data[size:]
+        else:
+            self._buffer = ""
+        return data
+
+
+class BulkLoader(ABC):
+    """Base class for backend-native bulk loaders."""
+
+    def __init__(self, database: Database, batch_size: int = 10000):
+        """
+        Initialize bulk loader.
+
+        Args:
+            database: Peewee database instance
+            batch_size: Rows per executemany call / progress update granularity
+        """
+        self.db = database
+        self.batch_size = batch_size
+
+    @abstractmethod
+    def copy_rows(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Write prepared row tuples into a table.
+
+        Args:
+            table: Destination table name
+            columns: Destination column names, in tuple order
+            rows: Iterable of row tuples already converted to database values
+
+        Returns:
+            Number of rows written
+        """
+        pass
+
+    def load(
+        self, model, columns: List[str], rows: Iterable[Sequence[Any]]
+    ) -> IngestStats:
+        """
+        Bulk load prepared rows into a model's table in a single transaction.
+
+        Args:
+            model: Peewee model class to load into
+            columns: Column names, in tuple order
+            rows: Iterable of row tuples
+
+        Returns:
+            Ingest statistics for the load
+        """
+        table = model._meta.table_name
+        stats = IngestStats(table)
+        self.db.connect(reuse_if_open=True)
+
+        logger.info(f"Bulk loading {table} with {type(self).__name__}")
+        with self.db.atomic():
+            stats.count = self.copy_rows(table, columns, rows)
+
+        stats.finish()
+        logger.info(stats.summary())
+        return stats
+
+    def quote(self, name: str) -> str:
+        """Quote an identifier for this backend."""
+        open_quote, close_quote = self.db.quote
+        return f"{open_quote}{name}{close_quote}"
+
+
+class SqliteBulkLoader(BulkLoader):
+    """Bulk loader using a prepared INSERT and ``executemany`` on SQLite."""
+
+    def copy_rows(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> int:
+        placeholders = ", ".join(["?"] * len(columns))
+        sql = (
+            f"INSERT INTO {self.quote(table)} "
+            f"({', '.join(self.quote(c) for c in columns)}) VALUES ({placeholders})"
+        )
+
+        count = 0
+        cursor = self.db.cursor()
+        for batch in tqdm(chunked(rows, self.batch_size), desc="Loading batches"):
+            cursor.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+
+class PostgresBulkLoader(BulkLoader):
+    """Bulk loader streaming rows through ``COPY ... FROM STDIN`` on PostgreSQL."""
+
+    def copy_rows(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> int:
+        sql = (
+            f"COPY {self.quote(table)} ({', '.join(self.quote(c) for c in columns)}) "
+            f"FROM STDIN WITH (FORMAT text)"
+        )
+
+        with tqdm(desc="Copying rows", unit=" rows") as progress:
+            stream = RowStream(rows, progress)
+            cursor = self.db.cursor()
+            cursor.copy_expert(sql, stream, size=65536)
+        return stream.count
+
+
+class MySQLBulkLoader(BulkLoader):
+    """Bulk loader using ``LOAD DATA LOCAL INFILE`` on MySQL."""
+
+    def __init__(
+        self, database: Database, batch_size: int = 10000, rows_per_file: int = 500000
+    ):
+        """
+        Initialize MySQL bulk loader.
+
+        Args:
+            database: Peewee database instance
+            batch_size: Progress update granularity
+            rows_per_file: Rows spooled to each temporary file before loading
+        """
+        super().__init__(database, batch_size)
+        self.rows_per_file = rows_per_file
+
+    def copy_rows(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> int:
+        if not self.db.connect_params.get("local_infile"):
+            raise RuntimeError(
+                "MySQL bulk loading requires LOAD DATA LOCAL INFILE. "
+                "Set mysql_local_infile = true (or MYSQL_LOCAL_INFILE=1) and enable "
+                "local_infile on the server."
+            )
+
+        sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {self.quote(table)} "
+            f"CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            f"LINES TERMINATED BY '\\n' "
+            f"({', '.join(self.quote(c) for c in columns)})"
+        )
+
+        count = 0
+        cursor = self.db.cursor()
+        for spool in tqdm(chunked(rows, self.rows_per_file), desc="Loading files"):
+            # Spool a bounded slice of rows so disk use stays constant
+            fd, path = tempfile.mkstemp(suffix=".tsv", prefix=f"{table}_")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.writelines(format_copy_line(row) for row in spool)
+                cursor.execute(sql, (path,))
+                count += len(spool)
+            finally:
+                os.unlink(path)
+        return count
+
+
+def bulk_loader_for(database: Database, batch_size: int = 10000) -> BulkLoader:
+    """
+    Get the native bulk loader for a database instance.
+
+    Args:
+        database: Peewee database instance
+        batch_size: Rows per executemany call / progress update
+
+    Returns:
+        Bulk loader matching the database's backend
+
+    Raises:
+        ValueError: If the database backend is unsupported
+    """
+    if isinstance(database, SqliteDatabase):
+        return SqliteBulkLoader(database, batch_size=batch_size)
+    elif isinstance(database, PostgresqlDatabase):
+        return PostgresBulkLoader(database, batch_size=batch_size)
+    elif isinstance(database, MySQLDatabase):
+        return MySQLBulkLoader(database, batch_size=batch_size)
+    else:
+        raise ValueError(f"Unsupported database type: {type(database).__name__}")
@@ -0,0 +1,155 @@
+"""
+Multiprocess parsing pipeline for large pipe-delimited FEC files.
+
+The file is split into byte ranges that end on line boundaries, each range is
+parsed into ready-to-insert tuples in a worker process, and the parsed batches
+are handed back in file order to a single writer. At most ``max_pending``
+chunks are in flight at once, so memory stays bounded while the database
+writes one batch and the workers parse the next ones.
+"""
+
+import io
+import locale
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from csv import QUOTE_NONE, reader
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Default bytes of source text per parse task
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def split_byte_ranges(
+    path: Union[str, Path], chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path: Path to a text file
+        chunk_bytes: Target size of each range
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    with open(path, "rb") as f:
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                # Extend to the end of the line the cut falls in
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def parse_byte_range(
+    path: str,
+    start: int,
+    end: int,
+    parse_row: Callable[[List[str]], Sequence[Any]],
+    encoding: Optional[str] = None,
+) -> List[Sequence[Any]]:
+    """
+    Parse one byte range of a pipe-delimited file into row tuples.
+
+    Runs in a worker process, so ``parse_row`` must be a module-level function.
+
+    Args:
+        path: Path to the source file
+        start: First byte of the range
+        end: Byte just past the range
+        parse_row: Function converting split field values into an insert tuple
+        encoding: Text encoding (defaults to the locale encoding, like open())
+
+    Returns:
+        List of parsed row tuples
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    text = io.StringIO(data.decode(encoding or locale.getpreferredencoding(False)), newline=None)
+    return [parse_row(values) for values in reader(text, delimiter="|", quoting=QUOTE_NONE)]
+
+
+def iter_parsed_batches(
+    path: Union[str, Path],
+    parse_row: Callable[[List[str]], Sequence[Any]],
+    workers: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_pending: Optional[int] = None,
+) -> Iterator[List[Sequence[Any]]]:
+    """
+    Parse a file in a process pool and yield batches of row tuples in order.
+
+    Args:
+        path: Path to a plain (uncompressed) pipe-delimited file
+        parse_row: Module-level function converting split values into a tuple
+        workers: Number of parser processes
+        chunk_bytes: Target bytes per parse task
+        max_pending: Maximum parsed-or-parsing chunks held at once
+            (defaults to twice the worker count)
+
+    Yields:
+        Lists of row tuples, one per byte range
+    """
+    ranges = split_byte_ranges(path, chunk_bytes)
+    max_pending = max_pending or workers * 2
+    encoding = locale.getpreferredencoding(False)
+    logger.info(
+        f"Parsing {path} in {len(ranges)} chunks with {workers} worker processes"
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        remaining = iter(ranges)
+        pending = deque()
+
+        def submit_next() -> None:
+            byte_range = next(remaining, None)
+            if byte_range is not None:
+                pending.append(
+                    pool.submit(parse_byte_range, str(path), *byte_range, parse_row, encoding)
+                )
+
+        for _ in range(max_pending):
+            submit_next()
+
+        while pending:
+            batch = pending.popleft().result()
+            submit_next()
+            yield batch
+
+
+def iter_parsed_rows(
+    path: Union[str, Path],
+    parse_row: Callable[[List[str]], Sequence[Any]],
+    workers: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[Sequence[Any]]:
+    """
+    Flatten ``iter_parsed_batches`` into a stream of row tuples.
+
+    Args:
+        path: Path to a plain (uncompressed) pipe-delimited file
+        parse_row: Module-level function converting split values into a tuple
+        workers: Number of parser processes
+        chunk_bytes: Target bytes per parse task
+
+    Yields:
+        Row tuples in file order
+    """
+    for batch in iter_parsed_batches(path, parse_row, workers, chunk_bytes):
+        yield from batch
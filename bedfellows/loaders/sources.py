@@ -0,0 +1,89 @@
+"""Open FEC bulk files for reading, straight from ZIP archives when needed."""
+
+import io
+import logging
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, TextIO, Union
+
+logger = logging.getLogger(__name__)
+
+
+def is_zip_source(path: Union[str, Path]) -> bool:
+    """
+    Check whether a source path is a ZIP archive.
+
+    Args:
+        path: Path to a bulk data file
+
+    Returns:
+        True if the path names a ZIP archive
+    """
+    return Path(path).suffix.lower() == ".zip"
+
+
+def select_member(archive: zipfile.ZipFile, member: Optional[str] = None) -> str:
+    """
+    Pick the data file to read from an FEC bulk download archive.
+
+    FEC archives normally hold a single pipe-delimited text file. If there
+    are several, the largest .txt member is used.
+
+    Args:
+        archive: Open ZIP archive
+        member: Explicit member name to read
+
+    Returns:
+        Name of the member to read
+
+    Raises:
+        KeyError: If the requested member isn't in the archive
+        ValueError: If the archive contains no data files
+    """
+    if member is not None:
+        archive.getinfo(member)
+        return member
+
+    candidates = [info for info in archive.infolist() if not info.is_dir()]
+    text_files = [info for info in candidates if info.filename.lower().endswith(".txt")]
+    if text_files:
+        candidates = text_files
+    if not candidates:
+        raise ValueError(f"No data files found in {archive.filename}")
+
+    return max(candidates, key=lambda info: info.file_size).filename
+
+
+@contextmanager
+def open_source(path: Union[str, Path], member: Optional[str] = None) -> Iterator[TextIO]:
+    """
+    Open a bulk data file as text.
+
+    Plain files are opened directly. ZIP archives are decompressed on the fly
+    so the extracted file never has to be written to disk.
+
+    Args:
+        path: Path to a text file or ZIP archive
+        member: Member to read when path is a ZIP archive
+
+    Yields:
+        Text file object positioned at the start of the data
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist
+    """
+    source = Path(path)
+    if not source.exists():
+        raise FileNotFoundError(f"CSV file not found: {path}")
+
+    if not is_zip_source(source):
+        with open(source) as f:
+            yield f
+        return
+
+    with zipfile.ZipFile(source) as archive:
+        name = select_member(archive, member)
+        logger.info(f"Streaming {name} from {source}")
+        with archive.open(name) as raw, io.TextIOWrapper(raw) as f:
+            yield f
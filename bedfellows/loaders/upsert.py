@@ -0,0 +1,318 @@
+"""
+Incremental (upsert) loads keyed on a natural row identity.
+
+A refreshed FEC file is loaded into a staging copy of the target table, then
+merged with the backend's native upsert:
+
+- SQLite / PostgreSQL: ``INSERT ... SELECT ... ON CONFLICT DO UPDATE ... WHERE``
+- MySQL: ``INSERT ... SELECT ... ON DUPLICATE KEY UPDATE``
+
+Rows whose key is new are inserted, rows whose values changed are updated and
+identical rows are left untouched, so re-loading a newer file only writes the
+rows that differ. The ids of rows updated or deleted can be recorded in a
+change log table, so data derived from the target can be refreshed.
+"""
+
+import logging
+import operator
+from functools import reduce
+from typing import Any, Dict, List, Optional, Sequence
+
+from peewee import EXCLUDED, Expression, MySQLDatabase, PostgresqlDatabase, Select, fn
+
+from bedfellows.loaders.base import IngestStats
+
+logger = logging.getLogger(__name__)
+
+
+class UpsertStats(IngestStats):
+    """Statistics for an incremental load."""
+
+    def __init__(self, table_name: str):
+        """
+        Initialize upsert statistics.
+
+        Args:
+            table_name: Destination table name
+        """
+        super().__init__(table_name)
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.superseded = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return statistics as a dictionary."""
+        stats = super().as_dict()
+        stats.update(
+            inserted=self.inserted,
+            updated=self.updated,
+            unchanged=self.unchanged,
+            superseded=self.superseded,
+        )
+        return stats
+
+    def summary(self) -> str:
+        """Return a one-line human readable summary."""
+        return (
+            f"Merged {self.count:,} records into {self.table_name}: "
+            f"{self.inserted:,} inserted, {self.updated:,} updated, "
+            f"{self.unchanged:,} unchanged, {self.superseded:,} superseded by amendments "
+            f"in {self.elapsed:.1f}s"
+        )
+
+
+def staging_model(model):
+    """
+    Create a model class for a staging copy of a model's table.
+
+    Args:
+        model: Peewee model class
+
+    Returns:
+        Model subclass with the same fields bound to ``<table>_staging``
+    """
+
+    class Meta:
+        database = model._meta.database
+        table_name = f"{model._meta.table_name}_staging"
+        indexes = ()
+
+    attrs = {"Meta": Meta, "__module__": model.__module__}
+    return type(f"{model.__name__}Staging", (model,), attrs)
+
+
+def is_distinct(lhs, rhs, database):
+    """
+    Build a NULL-safe "values differ" comparison for the given backend.
+
+    Args:
+        lhs: Left-hand column or expression
+        rhs: Right-hand column or expression
+        database: Peewee database instance
+
+    Returns:
+        Peewee expression that is true when the values differ
+    """
+    if isinstance(database, PostgresqlDatabase):
+        return Expression(lhs, "IS DISTINCT FROM", rhs)
+    if isinstance(database, MySQLDatabase):
+        return ~Expression(lhs, "<=>", rhs)
+    return Expression(lhs, "IS NOT", rhs)
+
+
+def _any(expressions: List[Any]):
+    return reduce(operator.or_, expressions)
+
+
+def _all(expressions: List[Any]):
+    return reduce(operator.and_, expressions)
+
+
+def log_changes(change_log, ids: Select) -> None:
+    """
+    Record target row ids in a change log.
+
+    Args:
+        change_log: Model with a ``source_id`` column, or None to skip
+        ids: Query selecting the ids of rows about to change
+    """
+    if change_log is not None:
+        change_log.insert_from(ids, [change_log.source_id]).execute()
+
+
+def ensure_unique_key(model, key: Sequence[str], change_log=None) -> None:
+    """
+    Make sure a unique index exists on the key columns.
+
+    Existing duplicate rows (from earlier append-only loads) are removed
+    first, keeping the most recently loaded copy of each key.
+
+    Args:
+        model: Peewee model class
+        key: Column names forming the row identity
+        change_log: Model recording the ids of removed rows (see ``log_changes``)
+    """
+    db = model._meta.database
+    table = model._meta.table_name
+    name = f"{table}_{'_'.join(key)}_key"
+    if any(index.name == name for index in db.get_indexes(table)):
+        return
+
+    fields = [model._meta.columns[column] for column in key]
+    not_null = _all([field.is_null(False) for field in fields])
+
+    # Derived table so MySQL accepts a subquery on the table being deleted from
+    keep = (
+        model.select(fn.MAX(model._meta.primary_key).alias("id"))
+        .where(not_null)
+        .group_by(*fields)
+        .alias("keep")
+    )
+    duplicate = not_null & model._meta.primary_key.not_in(Select([keep], [keep.c.id]))
+    log_changes(change_log, model.select(model._meta.primary_key).where(duplicate))
+    removed = model.delete().where(duplicate).execute()
+    if removed:
+        logger.info(f"Removed {removed} duplicate rows from {table} before adding {name}")
+
+    logger.info(f"Creating unique index {name}")
+    db.execute(model.index(*fields, unique=True, name=name).safe(db.safe_create_index))
+
+
+def upsert_from_staging(
+    model,
+    staging,
+    key: Sequence[str],
+    amendment_key: Optional[Sequence[str]] = None,
+    change_log=None,
+) -> UpsertStats:
+    """
+    Merge a loaded staging table into its target table.
+
+    Args:
+        model: Target model class
+        staging: Staging model class created by ``staging_model``
+        key: Column names forming the row identity
+        amendment_key: Columns identifying one transaction across filings; when
+            given, target rows superseded by an amended filing in the staging
+            data are deleted
+        change_log: Model recording the ids of updated and deleted target rows
+            (see ``log_changes``)
+
+    Returns:
+        Merge statistics
+    """
+    db = model._meta.database
+    stats = UpsertStats(model._meta.table_name)
+    pk = model._meta.primary_key.column_name
+    columns = [column for column in model._meta.columns if column != pk]
+    values = [column for column in columns if column not in key]
+
+    with db.atomic():
+        # Last occurrence of a key in the file wins
+        spk = staging._meta.primary_key
+        staging_key = [staging._meta.columns[column] for column in key]
+        keep = staging.select(fn.MAX(spk).alias("id")).group_by(*staging_key).alias("keep")
+        staging.delete().where(spk.not_in(Select([keep], [keep.c.id]))).execute()
+        stats.count = staging.select().count()
+
+        same_key = _all([model._meta.columns[c] == staging._meta.columns[c] for c in key])
+        matched = staging.select().join(model, on=same_key)
+        changed = _any(
+            [is_distinct(model._meta.columns[c], staging._meta.columns[c], db) for c in values]
+        )
+        matched_count = matched.count()
+        stats.updated = matched.where(changed).count()
+        stats.unchanged = matched_count - stats.updated
+        stats.inserted = stats.count - matched_count
+        log_changes(
+            change_log,
+            staging.select(model._meta.primary_key).join(model, on=same_key).where(changed),
+        )
+
+        target_fields = [model._meta.columns[c] for c in columns]
+        source = staging.select(*[staging._meta.columns[c] for c in columns])
+        if isinstance(db, MySQLDatabase):
+            # MySQL skips the write when the new values equal the old ones
+            conflict = {"preserve": [model._meta.columns[c] for c in values]}
+        else:
+            # SQLite needs a WHERE on the SELECT to parse ON CONFLICT
+            source = source.where(spk.is_null(False))
+            conflict = {
+                "conflict_target": [model._meta.columns[c] for c in key],
+                "preserve": [model._meta.columns[c] for c in values],
+                "where": _any(
+                    [
+                        is_distinct(model._meta.columns[c], getattr(EXCLUDED, c), db)
+                        for c in values
+                    ]
+                ),
+            }
+        model.insert_from(source, target_fields).on_conflict(**conflict).execute()
+
+        if amendment_key:
+            stats.superseded = supersede_amendments(model, staging, amendment_key, change_log)
+
+    stats.finish()
+    logger.info(stats.summary())
+    return stats
+
+
+def supersede_amendments(
+    model, staging, amendment_key: Sequence[str], change_log=None
+) -> int:
+    """
+    Delete rows replaced by an amended filing of the same transaction.
+
+    FEC amendments (``amendment = 'A'``) re-report a transaction under a new,
+    numerically larger filing ID. Older copies of the transaction are removed
+    so each transaction is counted once.
+
+    Args:
+        model: Target model class
+        staging: Staging model class holding the newly loaded rows
+        amendment_key: Columns identifying one transaction across filings
+        change_log: Model recording the ids of deleted rows (see ``log_changes``)
+
+    Returns:
+        Number of rows deleted
+    """
+    newer = model._meta.columns["filing_id"]
+    amended = staging._meta.columns["filing_id"]
+    # Filing IDs are unpadded digit strings: longer, or equal length and
+    # greater, means numerically larger without a backend-specific CAST
+    is_newer = (fn.LENGTH(amended) > fn.LENGTH(newer)) | (
+        (fn.LENGTH(amended) == fn.LENGTH(newer)) & (amended > newer)
+    )
+    same_transaction = _all(
+        [model._meta.columns[c] == staging._meta.columns[c] for c in amendment_key]
+    )
+    superseding = staging.select(staging._meta.primary_key).where(
+        same_transaction
+        & (staging.amendment == "A")
+        & (staging.transaction_id != "")
+        & is_newer
+    )
+    log_changes(change_log, model.select(model._meta.primary_key).where(fn.EXISTS(superseding)))
+    return model.delete().where(fn.EXISTS(superseding)).execute()
+
+
+def incremental_load(
+    model,
+    csv_path: str,
+    key: Sequence[str],
+    amendment_key: Optional[Sequence[str]] = None,
+    change_log=None,
+    **load_options: Any,
+) -> UpsertStats:
+    """
+    Load a file into a model's table, updating rows that already exist.
+
+    Args:
+        model: Model class with a ``load_from_csv`` classmethod
+        csv_path: Path to the source file
+        key: Column names forming the row identity
+        amendment_key: Columns identifying one transaction across filings
+        change_log: Model recording the ids of updated and deleted rows
+            (see ``log_changes``)
+        **load_options: Passed through to ``load_from_csv`` for the staging load
+
+    Returns:
+        Merge statistics
+    """
+    db = model._meta.database
+    staging = staging_model(model)
+    db.connect(reuse_if_open=True)
+
+    if change_log is not None:
+        db.create_tables([change_log])
+    ensure_unique_key(model, key, change_log)
+    staging.drop_table(safe=True)
+    # Table only: the staging copy doesn't need the target's secondary indexes
+    staging._schema.create_table(safe=True)
+    try:
+        logger.info(f"Staging {csv_path} in {staging._meta.table_name}")
+        staging.load_from_csv(csv_path, **load_options)
+        return upsert_from_staging(model, staging, key, amendment_key, change_log)
+    finally:
+        staging.drop_table(safe=True)
@@ -4,42 +4,64 @@ Database models for Bedfellows FEC campaign finance analysis.
 All models use Peewee ORM with configurable database backend (SQLite, MySQL, PostgreSQL).
 """
 
+import hashlib
+import json
 import logging
-from csv import DictReader
+from csv import QUOTE_NONE, DictReader, reader
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from peewee import (
-    Model,
-    CharField,
-    IntegerField,
-    FloatField,
-    DateTimeField,
-    DateField,
+    SQL,
+    AutoField,
+    BigIntegerField,
     BooleanField,
+    CharField,
     Database,
+    DateField,
+    DateTimeField,
+    FloatField,
+    IntegerField,
+    Model,
+    fn,
 )
-from tqdm import tqdm
+
+from bedfellows.loaders.base import (
+    FilterStats,
+    election_cycle,
+    file_cycle,
+    format_fec_date,
+    parse_fec_amount,
+    parse_fec_date,
+    stream_insert,
+)
+from bedfellows.loaders.parallel import iter_parsed_rows
+from bedfellows.loaders.sources import is_zip_source, open_source
+from bedfellows.loaders.upsert import UpsertStats, incremental_load
+
+if TYPE_CHECKING:
+    from bedfellows.loaders.bulk import BulkLoader
 
 logger = logging.getLogger(__name__)
 
+# Filters that select the committee contributions scores are computed from
+# (see introduction.md): contributions to non-affiliated committees (24K) by
+# PACs and candidate committees, since the 2003 contribution limits, not
+# involving super PACs
+CONTRIBUTION_FILTERS: Dict[str, Any] = {
+    "transaction_types": ["24K"],
+    "entity_types": ["PAC", "CCM"],
+    "min_date": "2003-01-01",
+    "exclude_super_pacs": True,
+}
+
 # Global database instance - will be set by init_database()
 database_proxy: Optional[Database] = None
 
 
-def chunked(iterable, n):
-    """Yield successive n-sized chunks from iterable."""
-    chunk = []
-    for item in iterable:
-        chunk.append(item)
-        if len(chunk) == n:
-            yield chunk
-            chunk = []
-    if chunk:
-        yield chunk
-
-
 class BaseModel(Model):
     """Base model for all Bedfellows models."""
 
@@ -64,6 +86,75 @@ class BaseModel(Model):
 # ============================================================================
 
 
+# FEC committee contributions file column names
+CONTRIBUTION_FIELDNAMES = [
+    "fec_committee_id",
+    "amendment",
+    "report_type",
+    "pgi",
+    "microfilm",
+    "transaction_type",
+    "entity_type",
+    "contributor_name",
+    "city",
+    "state",
+    "zipcode",
+    "employer",
+    "occupation",
+    "date",
+    "amount",
+    "other_id",
+    "recipient_name",
+    "transaction_id",
+    "filing_id",
+    "memo_code",
+    "memo_text",
+    "fec_record_number",
+]
+
+# Columns written by the bulk load path, in prepared tuple order
+CONTRIBUTION_COLUMNS = CONTRIBUTION_FIELDNAMES + ["cycle", "recipient_state", "recipient_party"]
+
+# Identity of one reported transaction, used by incremental loads
+CONTRIBUTION_KEY = ["filing_id", "transaction_id", "fec_record_number"]
+
+# Identity of a transaction across original and amended filings
+CONTRIBUTION_AMENDMENT_KEY = ["fec_committee_id", "transaction_id"]
+
+_DATE_INDEX = CONTRIBUTION_FIELDNAMES.index("date")
+_AMOUNT_INDEX = CONTRIBUTION_FIELDNAMES.index("amount")
+
+
+def prepare_contribution_row(values: List[str], cycle: Optional[str] = None) -> tuple:
+    """
+    Convert one split line of an FEC contributions file into an insert tuple.
+
+    Applies the same rules as the ORM load path (invalid dates and amounts
+    become NULL, missing trailing fields are NULL, the cycle comes from the
+    date) but produces a plain tuple in CONTRIBUTION_COLUMNS order for the
+    bulk loaders.
+
+    Args:
+        values: Field values from csv.reader
+        cycle: Cycle of the source file, used when the date is invalid
+
+    Returns:
+        Tuple of database values
+    """
+    width = len(CONTRIBUTION_FIELDNAMES)
+    if len(values) < width:
+        values = values + [None] * (width - len(values))
+    elif len(values) > width:
+        values = values[:width]
+
+    raw_date = values[_DATE_INDEX]
+    values[_DATE_INDEX] = format_fec_date(raw_date)
+    if values[_DATE_INDEX] is not None:
+        cycle = election_cycle(int(raw_date[4:]))
+    values[_AMOUNT_INDEX] = parse_fec_amount(values[_AMOUNT_INDEX])
+    return (*values, cycle, None, None)
+
+
 class FecCommitteeContributions(BaseModel):
     """Raw FEC committee contribution data."""
 
@@ -108,84 +199,146 @@ class FecCommitteeContributions(BaseModel):
         )
 
     @classmethod
-    def load_from_csv(cls, csv_path: str, batch_size: int = 1000) -> int:
+    def load_from_csv(
+        cls,
+        csv_path: str,
+        batch_size: int = 1000,
+        commit_every: Optional[int] = None,
+        loader: Optional["BulkLoader"] = None,
+        workers: int = 1,
+    ) -> int:
         """
         Load data from pipe-delimited FEC file.
 
         Args:
-            csv_path: Path to FEC file
+            csv_path: Path to FEC file, or a ZIP archive containing it
             batch_size: Number of records per batch
+            commit_every: Commit after this many batches (None = single transaction)
+            loader: Backend bulk loader for the fast path (None = ORM inserts)
+            workers: Parser processes; above 1, byte ranges of a plain file are
+                parsed in parallel while this process writes
 
         Returns:
             Number of records loaded
         """
-        csv_file = Path(csv_path)
-        if not csv_file.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+        if workers > 1 and is_zip_source(csv_path):
+            # A compressed stream can't be split by byte offset
+            logger.warning("Parallel parsing needs an extracted file; parsing serially")
+            workers = 1
 
-        # FEC committee contributions file column names
-        fieldnames = [
-            "fec_committee_id",
-            "amendment",
-            "report_type",
-            "pgi",
-            "microfilm",
-            "transaction_type",
-            "entity_type",
-            "contributor_name",
-            "city",
-            "state",
-            "zipcode",
-            "employer",
-            "occupation",
-            "date",
-            "amount",
-            "other_id",
-            "recipient_name",
-            "transaction_id",
-            "filing_id",
-            "memo_code",
-            "memo_text",
-            "fec_record_number",
-        ]
+        source_cycle = file_cycle(csv_path)
+        prepare = partial(prepare_contribution_row, cycle=source_cycle)
 
-        count = 0
-        with open(csv_file) as f, cls._meta.database.atomic():
-            rows = DictReader(f, fieldnames=fieldnames, delimiter="|")
+        if workers > 1:
+            if not Path(csv_path).exists():
+                raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+            logger.info(f"Loading {cls._meta.table_name} from {csv_path}")
+            rows = iter_parsed_rows(csv_path, prepare, workers)
+            if loader is not None:
+                stats = loader.load(cls, CONTRIBUTION_COLUMNS, rows)
+            else:
+                fields = [cls._meta.columns[column] for column in CONTRIBUTION_COLUMNS]
+                stats = stream_insert(cls, rows, batch_size, commit_every, fields=fields)
+            return stats.count
+
+        if loader is not None:
+            with open_source(csv_path) as f:
+                logger.info(f"Bulk loading {cls._meta.table_name} from {csv_path}")
+                rows = (
+                    prepare(values)
+                    for values in reader(f, delimiter="|", quoting=QUOTE_NONE)
+                )
+                stats = loader.load(cls, CONTRIBUTION_COLUMNS, rows)
+            return stats.count
+
+        def parse(rows):
+            for row in rows:
+                # Parse date field (FEC format: MMDDYYYY)
+                row["date"] = parse_fec_date(row.get("date"))
+
+                # Parse amount field
+                row["amount"] = parse_fec_amount(row.get("amount"))
+
+                # Set fields not in FEC file; the cycle is the one the date falls in
+                row["cycle"] = (
+                    election_cycle(row["date"].year) if row["date"] else source_cycle
+                )
+                row["recipient_state"] = None
+                row["recipient_party"] = None
+
+                yield row
+
+        with open_source(csv_path) as f:
+            rows = DictReader(
+                f, fieldnames=CONTRIBUTION_FIELDNAMES, delimiter="|", quoting=QUOTE_NONE
+            )
             logger.info(f"Loading {cls._meta.table_name} from {csv_path}")
+            stats = stream_insert(cls, parse(rows), batch_size, commit_every)
 
-            for batch in tqdm(chunked(rows, batch_size), desc="Loading batches"):
-                src_data = []
-                for row in batch:
-                    # Parse date field (FEC format: MMDDYYYY)
-                    if row.get("date") and row["date"] != "" and len(row["date"]) == 8:
-                        try:
-                            row["date"] = datetime.strptime(row["date"], "%m%d%Y")
-                        except ValueError:
-                            row["date"] = None
-                    else:
-                        row["date"] = None
+        return stats.count
 
-                    # Parse amount field
-                    if row.get("amount"):
-                        try:
-                            row["amount"] = int(row["amount"])
-                        except (ValueError, TypeError):
-                            row["amount"] = None
+    @classmethod
+    def upsert_from_csv(
+        cls,
+        csv_path: str,
+        batch_size: int = 1000,
+        commit_every: Optional[int] = None,
+        loader: Optional["BulkLoader"] = None,
+        workers: int = 1,
+    ) -> UpsertStats:
+        """
+        Incrementally load a (newer) FEC file into the existing table.
 
-                    # Set fields not in FEC file
-                    row["cycle"] = None  # To be calculated from date or set externally
-                    row["recipient_state"] = None
-                    row["recipient_party"] = None
+        Rows are matched on CONTRIBUTION_KEY: new transactions are inserted,
+        changed ones updated and identical ones left alone. Rows superseded
+        by an amended filing of the same transaction are removed.
 
-                    src_data.append(row)
+        The ids of updated and removed rows are added to
+        contribution_changes; the next compute replaces their copies in
+        fec_contributions (see ``FecContributions.refresh_changed``).
 
-                if src_data:
-                    cls.insert_many(src_data).execute()
-                    count += len(src_data)
+        Args:
+            csv_path: Path to FEC file, or a ZIP archive containing it
+            batch_size: Number of records per batch
+            commit_every: Commit after this many batches while staging
+            loader: Backend bulk loader used to fill the staging table
+            workers: Parser processes used to fill the staging table
+
+        Returns:
+            Inserted / updated / unchanged / superseded counts
+        """
+        return incremental_load(
+            cls,
+            csv_path,
+            CONTRIBUTION_KEY,
+            amendment_key=CONTRIBUTION_AMENDMENT_KEY,
+            change_log=ContributionChanges,
+            batch_size=batch_size,
+            commit_every=commit_every,
+            loader=loader,
+            workers=workers,
+        )
+
+
+class ContributionChanges(BaseModel):
+    """
+    Committee contributions an incremental load updated or removed.
+
+    fec_contributions keeps its copies of these rows, with the old values,
+    until the next compute replaces them.
+    """
+
+    # fec_committee_contributions id
+    source_id = IntegerField(index=True)
 
-        logger.info(f"Loaded {count} records into {cls._meta.table_name}")
-        return count
+
+class ContributionFilterState(BaseModel):
+    """Fingerprint of the filters fec_contributions was last built with."""
+
+    # SHA-256 of the filter values and, when super PACs are excluded, their ids
+    fingerprint = CharField(max_length=64)
+    applied_at = DateTimeField(null=True)
 
 
 class FecCommittees(BaseModel):
@@ -214,12 +367,10 @@ class FecCommittees(BaseModel):
         indexes = ((("fec_candidate_id", "fecid"), False),)
 
     @classmethod
-    def load_from_csv(cls, csv_path: str, batch_size: int = 1000) -> int:
-        """Load committee data from pipe-delimited FEC file."""
-        csv_file = Path(csv_path)
-        if not csv_file.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
+    def load_from_csv(
+        cls, csv_path: str, batch_size: int = 1000, commit_every: Optional[int] = None
+    ) -> int:
+        """Load committee data from pipe-delimited FEC file (plain text or .zip)."""
         # FEC committee file column names
         fieldnames = [
             "fecid",
@@ -239,27 +390,23 @@ class FecCommittees(BaseModel):
             "fec_candidate_id",
         ]
 
-        count = 0
-        with open(csv_file) as f, cls._meta.database.atomic():
-            rows = DictReader(f, fieldnames=fieldnames, delimiter="|")
-            logger.info(f"Loading {cls._meta.table_name} from {csv_path}")
+        source_cycle = file_cycle(csv_path)
 
-            for batch in tqdm(chunked(rows, batch_size), desc="Loading batches"):
-                src_data = []
-                for row in batch:
-                    # Set default values for fields not in FEC file
-                    row["cycle"] = None  # To be set externally or calculated
-                    row["is_leadership"] = False
-                    # Detect Super PACs by committee type 'O' (independent expenditure-only)
-                    row["is_super_pac"] = row.get("committee_type") == "O"
-                    src_data.append(row)
+        def parse(rows):
+            for row in rows:
+                # Set default values for fields not in FEC file
+                row["cycle"] = source_cycle  # From the file name, e.g. cm24.zip
+                row["is_leadership"] = False
+                # Detect Super PACs by committee type 'O' (independent expenditure-only)
+                row["is_super_pac"] = row.get("committee_type") == "O"
+                yield row
 
-                if src_data:
-                    cls.insert_many(src_data).execute()
-                    count += len(src_data)
+        with open_source(csv_path) as f:
+            rows = DictReader(f, fieldnames=fieldnames, delimiter="|")
+            logger.info(f"Loading {cls._meta.table_name} from {csv_path}")
+            stats = stream_insert(cls, parse(rows), batch_size, commit_every)
 
-        logger.info(f"Loaded {count} records into {cls._meta.table_name}")
-        return count
+        return stats.count
 
 
 class FecCandidates(BaseModel):
@@ -284,15 +431,15 @@ class FecCandidates(BaseModel):
     class Meta:
         indexes = (
             (("fecid", "name", "district", "office_state", "branch", "cycle"), False),
+            # Covers the recipient committee -> race lookup for race focus scores
+            (("fec_committee_id", "branch", "fecid", "district", "office_state"), False),
         )
 
     @classmethod
-    def load_from_csv(cls, csv_path: str, batch_size: int = 1000) -> int:
-        """Load candidate data from pipe-delimited FEC file."""
-        csv_file = Path(csv_path)
-        if not csv_file.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_path}")
-
+    def load_from_csv(
+        cls, csv_path: str, batch_size: int = 1000, commit_every: Optional[int] = None
+    ) -> int:
+        """Load candidate data from pipe-delimited FEC file (plain text or .zip)."""
         # FEC candidate file column names
         fieldnames = [
             "fecid",
@@ -312,20 +459,19 @@ class FecCandidates(BaseModel):
             "zip",
         ]
 
-        count = 0
-        with open(csv_file) as f:
+        with open_source(csv_path) as f:
             rows = DictReader(f, fieldnames=fieldnames, delimiter="|")
-            src_data = list(rows)
+            logger.info(f"Loading {cls._meta.table_name} from {csv_path}")
+            stats = stream_insert(cls, rows, batch_size, commit_every)
 
-        logger.info(f"Loading {len(src_data)} records into {cls._meta.table_name}")
+        return stats.count
 
-        for batch in tqdm(chunked(src_data, batch_size), desc="Loading batches"):
-            if batch:
-                cls.insert_many(batch).execute()
-                count += len(batch)
 
-        logger.info(f"Loaded {count} records into {cls._meta.table_name}")
-        return count
+class CommitteeDim(BaseModel):
+    """Committee dimension: one integer key per FEC committee ID."""
+
+    committee_key = AutoField()
+    fecid = CharField(max_length=10, unique=True)
 
 
 class FecContributions(BaseModel):
@@ -336,68 +482,390 @@ class FecContributions(BaseModel):
     contributor_name = CharField(null=True)
     date = DateTimeField(null=True, index=True)
     amount = CharField(null=True)
+    # Amount in integer cents, which score queries aggregate
+    amount_cents = BigIntegerField(null=True)
     other_id = CharField(null=True, index=True, max_length=10)
     recipient_name = CharField(null=True)
     cycle = CharField(null=True, max_length=5, index=True)
+    # committee_dim keys of fec_committee_id and other_id, which score tables use
+    contributor_key = IntegerField(null=True, index=True)
+    recipient_key = IntegerField(null=True, index=True)
+    # fec_committee_contributions id the row was copied from
+    source_id = IntegerField(null=True, index=True)
 
     class Meta:
         indexes = (
-            (("fec_committee_id", "other_id", "report_type"), False),
-            (("cycle", "fec_committee_id", "other_id"), False),
+            (("contributor_key", "recipient_key", "report_type"), False),
+            (("cycle", "contributor_key", "recipient_key"), False),
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "cycle",
-                    "other_id",
+                    "recipient_key",
                     "contributor_name",
                     "recipient_name",
                     "date",
-                    "amount",
+                    "amount_cents",
                 ),
                 False,
             ),
         )
 
+    def save(self, *args, **kwargs):
+        """Save the row, deriving amount_cents and cycle when they aren't set."""
+        if self.amount_cents is None and self.amount not in (None, ""):
+            try:
+                self.amount_cents = int(round(Decimal(str(self.amount)) * 100))
+            except InvalidOperation:
+                pass
+        if self.cycle is None and isinstance(self.date, datetime):
+            self.cycle = election_cycle(self.date.year)
+        return super().save(*args, **kwargs)
+
     @classmethod
-    def load_from_committee_contributions(cls) -> int:
+    def load_from_committee_contributions(
+        cls,
+        min_id: int = 0,
+        filters: Optional[Dict[str, Any]] = None,
+        max_id: Optional[int] = None,
+        changed: bool = False,
+    ) -> int:
         """
         Load filtered contributions from FecCommitteeContributions.
 
-        Excludes Super PACs and applies filtering criteria.
+        The filters run entirely in the database as one INSERT ... SELECT;
+        super PACs are excluded with a NOT EXISTS anti-join against
+        fec_committees.
+
+        Args:
+            min_id: Only load source rows with a higher id (appends new rows)
+            filters: Overrides for CONTRIBUTION_FILTERS; a None or empty
+                value turns that filter off
+            max_id: Only load source rows up to this id
+            changed: Only load source rows listed in contribution_changes
 
         Returns:
             Number of records loaded
         """
-        # Get Super PAC IDs
-        super_pac_query = FecCommittees.select(FecCommittees.fecid).where(
-            FecCommittees.is_super_pac == True
-        )
-        super_pac_ids = [c.fecid for c in super_pac_query]
-
-        logger.info(f"Found {len(super_pac_ids)} Super PACs to exclude")
+        filters = {**CONTRIBUTION_FILTERS, **(filters or {})}
+        source = FecCommitteeContributions
+        stats = FilterStats(cls._meta.table_name)
+
+        selected = [source.id > min_id]
+        if max_id is not None:
+            selected.append(source.id <= max_id)
+        if changed:
+            changes = ContributionChanges.select(ContributionChanges.source_id)
+            selected.append(source.id.in_(changes))
+        conditions = selected + [
+            source.fec_committee_id.is_null(False),
+            source.other_id.is_null(False),
+        ]
+        stats.considered = source.select().where(*selected).count()
+
+        if filters["transaction_types"]:
+            conditions.append(source.transaction_type.in_(list(filters["transaction_types"])))
+        if filters["entity_types"]:
+            conditions.append(source.entity_type.in_(list(filters["entity_types"])))
+        if filters["min_date"]:
+            min_date = filters["min_date"]
+            if isinstance(min_date, str):
+                min_date = datetime.strptime(min_date, "%Y-%m-%d")
+            conditions.append(source.date >= min_date)
+        if filters["exclude_super_pacs"]:
+            for column in (source.fec_committee_id, source.other_id):
+                super_pac = FecCommittees.alias()
+                conditions.append(
+                    ~fn.EXISTS(
+                        super_pac.select(SQL("1")).where(
+                            (super_pac.fecid == column) & (super_pac.is_super_pac == True)
+                        )
+                    )
+                )
+
+        # Get field mapping (committee keys are assigned after the copy)
+        keys = [
+            name
+            for name in cls._meta.sorted_field_names
+            if name != cls._meta.primary_key.name
+            and name in source._meta.fields
+        ]
 
-        # Get field mapping
-        keys = cls._meta.sorted_field_names
-        keys.remove(cls._meta.primary_key.name)
+        from_fields = [source._meta.fields[k] for k in keys]
+        to_fields = [cls._meta.fields[k] for k in keys]
 
-        from_fields = [
-            v
-            for k, v in FecCommitteeContributions._meta.fields.items()
-            if k in keys
-        ]
-        to_fields = [v for k, v in cls._meta.fields.items() if k in keys]
+        # Source amounts are whole dollars
+        from_fields.extend([source.amount * 100, source.id])
+        to_fields.extend([cls.amount_cents, cls.source_id])
 
-        # Insert filtered data
+        # Insert filtered data (counting rows, not returning the last id)
         query = cls.insert_from(
-            FecCommitteeContributions.select(*from_fields)
-            .where(FecCommitteeContributions.fec_committee_id.not_in(super_pac_ids))
-            .where(FecCommitteeContributions.other_id.not_in(super_pac_ids)),
+            source.select(*from_fields).where(*conditions),
             fields=to_fields,
+        ).as_rowcount()
+
+        stats.count = query.execute()
+        logger.info(stats.finish().summary())
+        cls.fill_cycles()
+        cls.assign_committee_keys()
+        if min_id == 0 and max_id is None and not changed:
+            cls.record_filters(filters)
+        return stats.count
+
+    @classmethod
+    def filters_fingerprint(cls, filters: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Fingerprint the filters fec_contributions would be built with.
+
+        Besides the filter values this covers the committees fec_committees
+        marks as super PACs, since loading new designations changes which
+        rows the super PAC filter keeps.
+
+        Args:
+            filters: Overrides for CONTRIBUTION_FILTERS
+
+        Returns:
+            SHA-256 hex digest
+        """
+        filters = {**CONTRIBUTION_FILTERS, **(filters or {})}
+        min_date = filters["min_date"]
+        if isinstance(min_date, datetime):
+            min_date = min_date.strftime("%Y-%m-%d")
+        state: Dict[str, Any] = {
+            "transaction_types": sorted(filters["transaction_types"] or []),
+            "entity_types": sorted(filters["entity_types"] or []),
+            "min_date": min_date or None,
+            "exclude_super_pacs": bool(filters["exclude_super_pacs"]),
+        }
+        if state["exclude_super_pacs"]:
+            super_pacs = hashlib.sha256()
+            query = (
+                FecCommittees.select(FecCommittees.fecid)
+                .where(FecCommittees.is_super_pac == True)
+                .distinct()
+                .order_by(FecCommittees.fecid)
+            )
+            for (fecid,) in query.tuples():
+                super_pacs.update(f"{fecid}\n".encode())
+            state["super_pacs"] = super_pacs.hexdigest()
+
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
+    @classmethod
+    def record_filters(cls, filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record the filters fec_contributions was just built with.
+
+        Args:
+            filters: Overrides for CONTRIBUTION_FILTERS
+        """
+        fingerprint = cls.filters_fingerprint(filters)
+        db = cls._meta.database
+        db.create_tables([ContributionFilterState])
+        with db.atomic():
+            ContributionFilterState.delete().execute()
+            ContributionFilterState.create(fingerprint=fingerprint, applied_at=datetime.now())
+
+    @classmethod
+    def filters_changed(cls, filters: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether the filters differ from the ones fec_contributions was built with.
+
+        A table built before filters were recorded (or filled without the
+        loader) is taken to match, and the current filters are recorded.
+
+        Args:
+            filters: Overrides for CONTRIBUTION_FILTERS
+
+        Returns:
+            True if the table needs rebuilding
+        """
+        cls._meta.database.create_tables([ContributionFilterState])
+        stored = ContributionFilterState.select().first()
+        if stored is None:
+            cls.record_filters(filters)
+            return False
+        return stored.fingerprint != cls.filters_fingerprint(filters)
+
+    @classmethod
+    def rebuild(cls, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Copy every source row through the filters again, replacing all rows.
+
+        Args:
+            filters: Overrides for CONTRIBUTION_FILTERS
+
+        Returns:
+            Number of records loaded
+        """
+        db = cls._meta.database
+        db.create_tables([ContributionChanges])
+        with db.atomic():
+            cls.delete().execute()
+            # Every source row is copied with its current values
+            ContributionChanges.delete().execute()
+            return cls.load_from_committee_contributions(filters=filters)
+
+    @classmethod
+    def refresh_changed(
+        cls,
+        filters: Optional[Dict[str, Any]] = None,
+        max_source_id: Optional[int] = None,
+        clear: bool = True,
+    ) -> int:
+        """
+        Replace the copies of source rows an incremental load changed.
+
+        Copies of rows listed in contribution_changes are deleted, then the
+        rows that still exist are copied again through the filters.
+
+        Args:
+            filters: Overrides for CONTRIBUTION_FILTERS
+            max_source_id: Only copy source rows up to this id; newer ones are
+                left to the next append
+            clear: Empty contribution_changes afterwards (callers that still
+                need the list clear it themselves)
+
+        Returns:
+            Number of changed source rows
+        """
+        db = cls._meta.database
+        db.create_tables([ContributionChanges])
+        changed = ContributionChanges.select(ContributionChanges.source_id).distinct().count()
+        if not changed:
+            return 0
+
+        with db.atomic():
+            removed = (
+                cls.delete()
+                .where(cls.source_id.in_(ContributionChanges.select(ContributionChanges.source_id)))
+                .execute()
+            )
+            copied = cls.load_from_committee_contributions(
+                filters=filters, max_id=max_source_id, changed=True
+            )
+            if clear:
+                ContributionChanges.delete().execute()
+        logger.info(
+            f"Refreshed {changed} changed committee contributions: "
+            f"removed {removed} filtered copies, copied {copied}"
         )
+        return changed
+
+    @classmethod
+    def sync_from_committee_contributions(
+        cls, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, int, bool]:
+        """
+        Bring a populated table up to date with FecCommitteeContributions.
+
+        If the filters (or super PAC designations) changed since the table
+        was built, every row is copied again. Otherwise copies of rows an
+        incremental load changed are replaced, then source rows past the
+        last one copied are appended (source rows before it that have no
+        copy were filtered out).
+
+        Args:
+            filters: Overrides for CONTRIBUTION_FILTERS
+
+        Returns:
+            (changed source rows, appended rows, whether the table was rebuilt)
+        """
+        if cls.filters_changed(filters):
+            logger.info("Contribution filters changed, rebuilding fec_contributions")
+            return 0, cls.rebuild(filters), True
+
+        copied_up_to = cls.select(fn.MAX(cls.source_id)).scalar()
+        changed = cls.refresh_changed(filters, max_source_id=copied_up_to)
+        added = 0
+        if copied_up_to is not None:
+            added = cls.load_from_committee_contributions(min_id=copied_up_to, filters=filters)
+            if added:
+                logger.info(f"Appended {added} new filtered contributions")
+        return changed, added, False
+
+    @classmethod
+    def assign_committee_keys(cls) -> int:
+        """
+        Fill contributor_key and recipient_key on rows that don't have them.
+
+        FEC IDs not yet in committee_dim are added first, so existing keys
+        never change.
+
+        Returns:
+            Number of committees added to committee_dim
+        """
+        db = cls._meta.database
+        db.create_tables([CommitteeDim])
+        cursor = db.execute_sql("""
+            INSERT INTO committee_dim (fecid)
+            SELECT fecid FROM (
+                SELECT fec_committee_id AS fecid FROM fec_contributions
+                WHERE contributor_key IS NULL AND fec_committee_id IS NOT NULL
+                UNION
+                SELECT other_id AS fecid FROM fec_contributions
+                WHERE recipient_key IS NULL AND other_id IS NOT NULL
+            ) new_ids
+            WHERE NOT EXISTS (SELECT 1 FROM committee_dim d WHERE d.fecid = new_ids.fecid)
+            ORDER BY fecid
+        """)
+        added = cursor.rowcount
+
+        for key, fecid in (("contributor_key", "fec_committee_id"), ("recipient_key", "other_id")):
+            db.execute_sql(f"""
+                UPDATE fec_contributions SET {key} = (
+                    SELECT d.committee_key FROM committee_dim d
+                    WHERE d.fecid = fec_contributions.{fecid}
+                )
+                WHERE {key} IS NULL AND {fecid} IS NOT NULL
+            """)
+
+        logger.info(f"Added {added} committees to committee_dim")
+        return added
+
+    @classmethod
+    def fill_amount_cents(cls) -> int:
+        """
+        Fill amount_cents from the text amount on rows that don't have it.
+
+        Returns:
+            Number of rows filled
+        """
+        cursor = cls._meta.database.execute_sql("""
+            UPDATE fec_contributions
+            SET amount_cents = ROUND(CAST(amount AS DECIMAL(14,2)) * 100)
+            WHERE amount_cents IS NULL AND amount IS NOT NULL
+        """)
+        return cursor.rowcount
+
+    @classmethod
+    def fill_cycles(cls) -> int:
+        """
+        Fill the election cycle from the date on rows loaded without one.
+
+        Returns:
+            Number of rows filled
+        """
+        from bedfellows.calculators.dialect import get_dialect
+
+        cycle = get_dialect(cls._meta.database).cycle("date")
+        cursor = cls._meta.database.execute_sql(f"""
+            UPDATE fec_contributions
+            SET cycle = {cycle}
+            WHERE cycle IS NULL AND date IS NOT NULL
+        """)
+        return cursor.rowcount
 
-        count = query.execute()
-        logger.info(f"Loaded {count} filtered contributions")
-        return count
+    @classmethod
+    def fill_derived_columns(cls) -> None:
+        """Fill amount_cents, cycles and committee keys on rows written without the loader."""
+        filled = cls.fill_amount_cents()
+        if filled:
+            logger.info(f"Filled amount_cents on {filled} contributions")
+        filled = cls.fill_cycles()
+        if filled:
+            logger.info(f"Filled cycle on {filled} contributions")
+        cls.assign_committee_keys()
 
 
 # ============================================================================
@@ -405,31 +873,61 @@ class FecContributions(BaseModel):
 # ============================================================================
 
 
+class PairSummary(BaseModel):
+    """
+    Contribution aggregates per pair, name variant, cycle, report type and year parity.
+
+    Built in one scan of fec_contributions; every component score is
+    derived from this much smaller table. Day-of-year sums, dates and
+    dated_count only include rows with a date.
+    """
+
+    contributor_key = IntegerField(null=True)
+    contributor_name = CharField(null=True)
+    recipient_key = IntegerField(null=True)
+    recipient_name = CharField(null=True)
+    cycle = CharField(null=True, max_length=5)
+    report_type = CharField(null=True)
+    year_parity = CharField(null=True, max_length=5)
+    count = IntegerField()
+    dated_count = IntegerField()
+    amount_cents = BigIntegerField(null=True)
+    min_date = DateTimeField(null=True)
+    max_date = DateTimeField(null=True)
+    doy_sum = BigIntegerField(null=True)
+    doy_squares = BigIntegerField(null=True)
+    doy_min = IntegerField(null=True)
+    doy_max = IntegerField(null=True)
+
+    class Meta:
+        indexes = ((("contributor_key", "recipient_key", "cycle"), False),)
+
+
 class TotalDonatedByContributor(BaseModel):
     """Total donations by each contributor."""
 
-    fec_committee_id = CharField(null=True, max_length=9, index=True)
+    contributor_key = IntegerField(null=True, index=True)
     contributor_name = CharField(null=True, max_length=200)
     total_by_PAC = FloatField(null=True)
 
     class Meta:
         indexes = (
-            (("fec_committee_id", "contributor_name", "total_by_PAC"), False),
+            (("contributor_key", "contributor_name", "total_by_PAC"), False),
         )
 
 
 class ExclusivityScores(BaseModel):
     """Exclusivity scores for donor-recipient pairs."""
 
-    fec_committee_id = CharField(null=True, max_length=9, index=True)
+    contributor_key = IntegerField(null=True, index=True)
     contributor_name = CharField(null=True, max_length=200)
-    total_by_pac = CharField(null=True, max_length=10)
-    other_id = CharField(null=True, max_length=9, index=True)
+    total_by_pac = FloatField(null=True)
+    recipient_key = IntegerField(null=True, index=True)
     recipient_name = CharField(null=True, max_length=200)
-    amount = CharField(null=True, max_length=10)
+    amount = FloatField(null=True)
 
     class Meta:
-        indexes = ((("fec_committee_id", "other_id", "contributor_name"), False),)
+        indexes = ((("contributor_key", "recipient_key", "contributor_name"), False),)
 
 
 class ReportTypeWeights(BaseModel):
@@ -446,9 +944,9 @@ class ReportTypeWeights(BaseModel):
 class ReportTypeCountByPair(BaseModel):
     """Report type counts for each donor-recipient pair."""
 
-    fec_committee_id = CharField(null=True, max_length=9, index=True)
+    contributor_key = IntegerField(null=True, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     report_type = CharField(max_length=4)
     year_parity = CharField(max_length=5)
@@ -456,26 +954,26 @@ class ReportTypeCountByPair(BaseModel):
     count = IntegerField()
 
     class Meta:
-        indexes = ((("fec_committee_id", "other_id"), False),)
+        indexes = ((("contributor_key", "recipient_key"), False),)
 
 
 class PairsCount(BaseModel):
     """Total transaction count for each donor-recipient pair."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
-    other_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     count = IntegerField()
 
     class Meta:
-        indexes = ((("fec_committee_id", "other_id", "count"), False),)
+        indexes = ((("contributor_key", "recipient_key", "count"), False),)
 
 
 class ReportTypeFrequency(BaseModel):
     """Report type frequency for pairs."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     report_type = CharField(max_length=4)
     year_parity = CharField(max_length=5)
@@ -490,9 +988,9 @@ class ReportTypeFrequency(BaseModel):
                 (
                     "report_type",
                     "year_parity",
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "report_type_frequency",
                 ),
@@ -504,9 +1002,9 @@ class ReportTypeFrequency(BaseModel):
 class UnnormalizedReportTypeScores(BaseModel):
     """Unnormalized report type scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     report_type_score = FloatField()
 
@@ -514,9 +1012,9 @@ class UnnormalizedReportTypeScores(BaseModel):
         indexes = (
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "report_type_score",
                 ),
@@ -534,20 +1032,20 @@ class MaxReportTypeScore(BaseModel):
 class ReportTypeScores(BaseModel):
     """Normalized report type scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     report_type_score = FloatField()
 
     class Meta:
         indexes = (
-            (("fec_committee_id", "other_id"), False),
+            (("contributor_key", "recipient_key"), False),
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "report_type_score",
                 ),
@@ -559,9 +1057,9 @@ class ReportTypeScores(BaseModel):
 class UnnormalizedPeriodicityScores(BaseModel):
     """Unnormalized periodicity scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     stddev_pop = FloatField()
     day_diff = IntegerField()
@@ -571,9 +1069,9 @@ class UnnormalizedPeriodicityScores(BaseModel):
         indexes = (
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "periodicity_score",
                 ),
@@ -591,36 +1089,39 @@ class CapUnnormalizedScore(BaseModel):
 class PeriodicityScores(BaseModel):
     """Normalized periodicity scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     periodicity_score = FloatField()
 
     class Meta:
-        indexes = ((("fec_committee_id", "other_id"), False),)
+        indexes = ((("contributor_key", "recipient_key"), False),)
 
 
 class ContributorTypes(BaseModel):
     """Contributor type classification."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
     cycle = CharField(max_length=5, index=True)
     contributor_type = CharField(max_length=15)
 
     class Meta:
-        indexes = ((("fec_committee_id", "cycle"), False),)
+        indexes = ((("contributor_key", "cycle"), False),)
 
 
 class RecipientTypes(BaseModel):
     """Recipient type classification."""
 
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     cycle = CharField(max_length=5, index=True)
     recipient_type = CharField(max_length=15)
 
+    class Meta:
+        indexes = ((("recipient_key", "cycle"), False),)
+
 
 class ContributionLimits(BaseModel):
     """Contribution limits by type and cycle."""
@@ -647,10 +1148,10 @@ class ContributionLimits(BaseModel):
 class JoinedContrRecptTypes(BaseModel):
     """Joined contributor and recipient types with contributions."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
     contributor_type = CharField(max_length=15)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     recipient_type = CharField(max_length=15)
     cycle = CharField(max_length=5, index=True)
@@ -664,10 +1165,10 @@ class JoinedContrRecptTypes(BaseModel):
 class MaxedOutSubscores(BaseModel):
     """Maxed out subscores for individual contributions."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
     contributor_type = CharField(max_length=15)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     recipient_type = CharField(max_length=15)
     cycle = CharField(max_length=5, index=True)
@@ -677,7 +1178,7 @@ class MaxedOutSubscores(BaseModel):
     maxed_out_subscore = FloatField()
 
     class Meta:
-        indexes = ((("fec_committee_id", "other_id", "cycle"), False),)
+        indexes = ((("contributor_key", "recipient_key", "cycle"), False),)
 
 
 class InboundMaxedOutSubscores(MaxedOutSubscores):
@@ -689,10 +1190,10 @@ class InboundMaxedOutSubscores(MaxedOutSubscores):
 class UnnormalizedMaxedOutScores(BaseModel):
     """Unnormalized maxed out scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
     contributor_type = CharField(max_length=15)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     recipient_type = CharField(max_length=18)
     maxed_out_score = FloatField()
@@ -701,10 +1202,10 @@ class UnnormalizedMaxedOutScores(BaseModel):
         indexes = (
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
                     "contributor_type",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "recipient_type",
                     "maxed_out_score",
@@ -723,23 +1224,23 @@ class MaxMaxedOutScore(BaseModel):
 class MaxedOutScores(BaseModel):
     """Normalized maxed out scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
     contributor_type = CharField(max_length=15)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     recipient_type = CharField(max_length=18)
     maxed_out_score = FloatField()
 
     class Meta:
         indexes = (
-            (("fec_committee_id", "other_id"), False),
+            (("contributor_key", "recipient_key"), False),
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
                     "contributor_type",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "recipient_type",
                     "maxed_out_score",
@@ -752,9 +1253,9 @@ class MaxedOutScores(BaseModel):
 class UnnormalizedLengthScores(BaseModel):
     """Unnormalized length scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     max_date = DateTimeField()
     min_date = DateTimeField()
@@ -764,9 +1265,9 @@ class UnnormalizedLengthScores(BaseModel):
         indexes = (
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "max_date",
                     "min_date",
@@ -786,9 +1287,9 @@ class MaxLengthScore(BaseModel):
 class LengthScores(BaseModel):
     """Normalized length scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     max_date = DateTimeField()
     min_date = DateTimeField()
@@ -796,12 +1297,12 @@ class LengthScores(BaseModel):
 
     class Meta:
         indexes = (
-            (("fec_committee_id", "other_id"), False),
+            (("contributor_key", "recipient_key"), False),
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "contributor_name",
-                    "other_id",
+                    "recipient_key",
                     "recipient_name",
                     "max_date",
                     "min_date",
@@ -812,12 +1313,25 @@ class LengthScores(BaseModel):
         )
 
 
+class Races(BaseModel):
+    """Race dimension: one integer key per (district, office_state, branch, cycle)."""
+
+    race_id = AutoField()
+    district = CharField(max_length=3)
+    office_state = CharField(max_length=3)
+    branch = CharField(max_length=2)
+    cycle = CharField(max_length=5)
+
+    class Meta:
+        indexes = ((("district", "office_state", "branch", "cycle"), True),)
+
+
 class RacesList(BaseModel):
     """List of races for race focus calculation."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
-    other_id = CharField(max_length=9, null=False, index=True)
+    recipient_key = IntegerField(null=False, index=True)
     recipient_name = CharField(max_length=200)
     fec_candidate_id = CharField(max_length=9, null=False)
     candidate_name = CharField(max_length=200)
@@ -825,12 +1339,13 @@ class RacesList(BaseModel):
     office_state = CharField(max_length=3)
     branch = CharField(max_length=2)
     cycle = CharField(max_length=5, index=True)
+    race_id = IntegerField(null=True)
 
     class Meta:
         indexes = (
             (
                 (
-                    "fec_committee_id",
+                    "contributor_key",
                     "cycle",
                     "district",
                     "office_state",
@@ -839,18 +1354,19 @@ class RacesList(BaseModel):
                 ),
                 False,
             ),
+            (("contributor_key", "race_id"), False),
         )
 
 
 class RaceFocusScores(BaseModel):
     """Race focus scores."""
 
-    fec_committee_id = CharField(max_length=9, null=False, index=True)
+    contributor_key = IntegerField(null=False, index=True)
     contributor_name = CharField(max_length=200)
     race_focus_score = FloatField()
 
     class Meta:
-        indexes = ((("fec_committee_id", "race_focus_score"), False),)
+        indexes = ((("contributor_key", "race_focus_score"), False),)
 
 
 class ScoreWeights(BaseModel):
@@ -910,6 +1426,66 @@ class FinalScores(BaseModel):
         indexes = ((("fec_committee_id", "other_id"), False),)
 
 
+class CycleFinalScores(FinalScores):
+    """Final combined scores computed separately for each election cycle."""
+
+    cycle = CharField(max_length=5, index=True)
+
+    class Meta:
+        indexes = (
+            (("fec_committee_id", "other_id"), False),
+            (("cycle", "final_score"), False),
+        )
+
+
+class SimilarCommittees(BaseModel):
+    """Most similar contributors (or recipients) to each one, by cosine similarity."""
+
+    kind = CharField(max_length=11)
+    fec_committee_id = CharField(max_length=9)
+    rank = IntegerField()
+    similar_id = CharField(max_length=9)
+    similarity = FloatField()
+
+    class Meta:
+        indexes = ((("kind", "fec_committee_id", "rank"), True),)
+
+
+class AffectedContributors(BaseModel):
+    """Contributors with contributions added since the last score run."""
+
+    contributor_key = IntegerField(index=True)
+
+
+class AffectedPairs(BaseModel):
+    """Donor-recipient pairs with contributions added since the last score run."""
+
+    contributor_key = IntegerField()
+    recipient_key = IntegerField()
+
+    class Meta:
+        indexes = ((("contributor_key", "recipient_key"), True),)
+
+
+class ComputeState(BaseModel):
+    """High-water marks of the last score computation, for incremental runs."""
+
+    name = CharField(max_length=30, unique=True)
+    # Highest fec_committee_contributions id copied into fec_contributions
+    source_max_id = IntegerField(default=0)
+    # Highest fec_contributions id included in the scores
+    max_id = IntegerField(default=0)
+    computed_at = DateTimeField(null=True)
+
+
+class StageFingerprints(BaseModel):
+    """Input fingerprint each cached calculation stage was last computed from."""
+
+    stage = CharField(max_length=50, unique=True)
+    fingerprint = CharField(max_length=64)
+    computed_at = DateTimeField(null=True)
+
+
 class FiveSum(BaseModel):
     """Sum of five scores (for normalization)."""
 
@@ -967,10 +1543,14 @@ class FinalSum(BaseModel):
 ALL_MODELS = [
     # Core FEC data
     FecCommitteeContributions,
+    ContributionChanges,
+    ContributionFilterState,
     FecCommittees,
     FecCandidates,
+    CommitteeDim,
     FecContributions,
     # Score calculation
+    PairSummary,
     TotalDonatedByContributor,
     ExclusivityScores,
     ReportTypeWeights,
@@ -995,11 +1575,18 @@ ALL_MODELS = [
     UnnormalizedLengthScores,
     MaxLengthScore,
     LengthScores,
+    Races,
     RacesList,
     RaceFocusScores,
     ScoreWeights,
     FiveScores,
     FinalScores,
+    CycleFinalScores,
+    SimilarCommittees,
+    AffectedContributors,
+    AffectedPairs,
+    ComputeState,
+    StageFingerprints,
     FiveSum,
     FinalSum,
 ]
@@ -1007,8 +1594,11 @@ ALL_MODELS = [
 # Core FEC data models
 FEC_CORE_MODELS = [
     FecCommitteeContributions,
+    ContributionChanges,
+    ContributionFilterState,
     FecCommittees,
     FecCandidates,
+    CommitteeDim,
     FecContributions,
 ]
 
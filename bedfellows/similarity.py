@@ -0,0 +1,427 @@
+"""
+Cosine similarity between contributors, recipients and pairs.
+
+A contributor is its row of the contributor x recipient matrix of final
+scores and a recipient is its column; a pair is its vector of the six
+component scores. Vectors are scaled to unit length once when the index is
+built, so the cosine similarity of one vector with every other is a single
+(sparse) matrix-vector product, and the top k come from ``argpartition``
+instead of sorting every score.
+
+The batch job (``compute_similar_committees``) finds the neighbours of every
+contributor and recipient the same way, a block of query rows at a time:
+each block's similarities with every row form a dense block sized to fit a
+memory budget, and blocks run in a process pool.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from peewee import Database
+from scipy import sparse
+
+from bedfellows.loaders.base import chunked
+from bedfellows.models import SimilarCommittees
+
+logger = logging.getLogger(__name__)
+
+SCORE_COLUMNS = [
+    "exclusivity_score",
+    "report_type_score",
+    "periodicity_score",
+    "maxed_out_score",
+    "length_score",
+    "race_focus_score",
+]
+
+KINDS = ("contributor", "recipient", "pair")
+
+# Kinds the batch job writes to similar_committees
+BATCH_KINDS = ("contributor", "recipient")
+
+BYTES_PER_VALUE = 8
+# float64 value plus int32 index
+SPARSE_BYTES_PER_VALUE = 12
+
+# Score matrix of the batch worker processes, set once per process
+_matrix: Union[np.ndarray, sparse.csr_matrix, None] = None
+
+
+def normalize_rows(
+    matrix: Union[np.ndarray, sparse.csr_matrix],
+) -> Union[np.ndarray, sparse.csr_matrix]:
+    """
+    Scale each row to unit L2 norm; all-zero rows stay zero.
+
+    Args:
+        matrix: Dense array or CSR matrix
+
+    Returns:
+        Matrix of the same kind with unit-length rows
+    """
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix, dtype=np.float64, copy=True)
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        matrix.data *= np.repeat(scale, np.diff(matrix.indptr))
+        return matrix
+    matrix = np.asarray(matrix, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def top_k(scores: np.ndarray, k: int, exclude: Optional[int] = None) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first.
+
+    Args:
+        scores: Score per candidate (modified if ``exclude`` is given)
+        k: Number of positions to return
+        exclude: Position to leave out, such as the query itself
+
+    Returns:
+        Up to k positions ordered by descending score
+    """
+    if exclude is not None:
+        scores[exclude] = -np.inf
+    available = len(scores) - (exclude is not None)
+    k = min(k, available)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    # Only the k winners get sorted
+    best = np.argpartition(-scores, k - 1)[:k]
+    return best[np.argsort(-scores[best], kind="stable")]
+
+
+def matrix_bytes(matrix: Union[np.ndarray, sparse.csr_matrix]) -> int:
+    """Memory held by a dense array or CSR matrix."""
+    if sparse.issparse(matrix):
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return matrix.nbytes
+
+
+def block_rows(
+    shape: Tuple[int, int], held_bytes: int, memory_mb: float, workers: int = 1
+) -> int:
+    """
+    Query rows per block that keep the batch job within a memory budget.
+
+    The parent and every worker hold the score matrix. For each query row
+    a worker holds its similarity with every row as a dense column, plus
+    either the sparse product it came from (up to 12 bytes per entry, while
+    densifying) or the ``argpartition`` indices of the column (8 bytes).
+    Dense score matrices also need the query rows themselves.
+
+    Args:
+        shape: (rows, columns) of the score matrix
+        held_bytes: Memory of one copy of the score matrix
+        memory_mb: Budget for the whole job
+        workers: Worker processes
+
+    Returns:
+        Rows per block (at least 1, at most the number of rows)
+
+    Raises:
+        ValueError: If the matrices alone don't fit in the budget
+    """
+    n_rows, n_columns = shape
+    available = memory_mb * 2**20 - held_bytes * (workers + 1)
+    per_row = (BYTES_PER_VALUE + SPARSE_BYTES_PER_VALUE) * n_rows + BYTES_PER_VALUE * n_columns
+    rows = available // (per_row * workers) if available > 0 else 0
+    if rows < 1:
+        raise ValueError(
+            f"A {memory_mb} MB budget is too small for a {n_rows:,} x {n_columns:,} "
+            f"score matrix with {workers} worker(s)"
+        )
+    return int(min(rows, n_rows))
+
+
+def _set_matrix(matrix: Union[np.ndarray, sparse.csr_matrix]) -> None:
+    global _matrix
+    _matrix = matrix
+
+
+def _block_top_k(start: int, stop: int, k: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Top k neighbours of rows start..stop of the worker's matrix.
+
+    Returns:
+        (start, neighbour positions, similarities), both block rows x k,
+        most similar first
+    """
+    # Column j holds every row's similarity with query j. Query rows stay
+    # sparse: they are far emptier than the similarity block they produce
+    product = _matrix @ _matrix[start:stop].T
+    scores = product.toarray() if sparse.issparse(product) else np.asarray(product)
+    del product
+    queries = np.arange(stop - start)
+    scores[start + queries, queries] = -np.inf
+
+    n_rows = scores.shape[0]
+    best = np.argpartition(scores, n_rows - k, axis=0)[n_rows - k:].T
+    best_scores = np.take_along_axis(scores.T, best, axis=1)
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    return (
+        start,
+        np.take_along_axis(best, order, axis=1),
+        np.take_along_axis(best_scores, order, axis=1),
+    )
+
+
+class SimilarityIndex:
+    """Unit-length score vectors for one kind of entity, answering top-k cosine queries."""
+
+    def __init__(
+        self,
+        keys: Sequence[Hashable],
+        vectors: Union[np.ndarray, sparse.csr_matrix],
+        names: Optional[Sequence[Optional[str]]] = None,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            keys: Key of each row (an FEC id, or a (contributor, recipient) tuple)
+            vectors: One score vector per row, dense or CSR
+            names: Display name of each row
+        """
+        self.keys = pd.Index(keys, tupleize_cols=False)
+        self.vectors = normalize_rows(vectors)
+        self.names = list(names) if names is not None else [None] * len(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def position(self, key: Hashable) -> int:
+        """
+        Row of a key.
+
+        Raises:
+            ValueError: If the key has no scores
+        """
+        try:
+            return self.keys.get_loc(key)
+        except KeyError:
+            raise ValueError(f"No scores for {key}") from None
+
+    def scores(self, key: Hashable) -> np.ndarray:
+        """
+        Cosine similarity of a key's vector with every row.
+
+        Args:
+            key: Key to compare
+
+        Returns:
+            Similarity per row
+        """
+        row = self.vectors[self.position(key)]
+        if sparse.issparse(row):
+            row = row.toarray().ravel()
+        return np.asarray(self.vectors @ row).ravel()
+
+    def most_similar(self, key: Hashable, k: int = 10) -> List[Tuple[Hashable, str, float]]:
+        """
+        The k rows most similar to a key, excluding the key itself.
+
+        Args:
+            key: Key to compare
+            k: Number of results
+
+        Returns:
+            (key, name, similarity) tuples, most similar first
+        """
+        scores = self.scores(key)
+        best = top_k(scores, k, exclude=self.position(key))
+        return [(self.keys[i], self.names[i], float(scores[i])) for i in best]
+
+    def all_top_k(
+        self, k: int, memory_mb: int, workers: int = 1
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        The k most similar rows to every row, a block of rows at a time.
+
+        Args:
+            k: Neighbours per row (capped at the number of other rows)
+            memory_mb: Memory budget for the matrix copies and blocks
+            workers: Processes computing blocks (1 = in this process)
+
+        Yields:
+            (first row of the block, neighbour positions, similarities),
+            blocks in row order
+        """
+        k = min(k, len(self) - 1)
+        if k < 1:
+            return
+        size = block_rows(self.vectors.shape, matrix_bytes(self.vectors), memory_mb, workers)
+        starts = list(range(0, len(self), size))
+        stops = [min(start + size, len(self)) for start in starts]
+        logger.info(
+            f"  {len(self):,} rows in {len(starts)} blocks of {size:,} on {workers} worker(s)"
+        )
+
+        if workers <= 1:
+            _set_matrix(self.vectors)
+            try:
+                for start, stop in zip(starts, stops, strict=True):
+                    yield _block_top_k(start, stop, k)
+            finally:
+                _set_matrix(None)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_set_matrix, initargs=(self.vectors,)
+        ) as pool:
+            yield from pool.map(partial(_block_top_k, k=k), starts, stops)
+
+
+class Similarity:
+    """Contributor, recipient and pair similarity indexes built from final_scores."""
+
+    def __init__(
+        self,
+        contributors: SimilarityIndex,
+        recipients: SimilarityIndex,
+        pairs: Optional[SimilarityIndex] = None,
+    ):
+        self.indexes: Dict[str, SimilarityIndex] = {
+            "contributor": contributors,
+            "recipient": recipients,
+            "pair": pairs,
+        }
+
+    @classmethod
+    def from_database(
+        cls, db: Database, table: str = "final_scores", pairs: bool = True
+    ) -> "Similarity":
+        """
+        Build the indexes from a final scores table.
+
+        A pair filed under more than one name has several rows; it keeps the
+        highest of each score.
+
+        Args:
+            db: Database holding the table
+            table: final_scores, or another table with the same columns
+            pairs: Also build the pair index
+
+        Returns:
+            Similarity over every scored contributor, recipient and pair
+        """
+        columns = ", ".join(f"MAX({column})" for column in SCORE_COLUMNS)
+        cursor = db.execute_sql(f"""
+            SELECT fec_committee_id, other_id, MAX(contributor_name), MAX(recipient_name),
+                   MAX(final_score), {columns}
+            FROM {table}
+            GROUP BY fec_committee_id, other_id
+        """)
+        rows = cursor.fetchall()
+        if not rows:
+            raise ValueError(f"No scores in {table}")
+        contributor_ids, recipient_ids, contributor_names, recipient_names, *scores = zip(
+            *rows, strict=True
+        )
+        final = np.array(scores[0], dtype=np.float64)
+
+        contributor, contributors = pd.factorize(np.array(contributor_ids, dtype=object))
+        recipient, recipients = pd.factorize(np.array(recipient_ids, dtype=object))
+        adjacency = sparse.csr_matrix(
+            (final, (contributor, recipient)), shape=(len(contributors), len(recipients))
+        )
+        logger.info(
+            f"  Similarity over {len(contributors):,} contributors, "
+            f"{len(recipients):,} recipients and {len(rows):,} pairs"
+        )
+
+        return cls(
+            SimilarityIndex(contributors, adjacency, _first(contributor, contributor_names)),
+            SimilarityIndex(recipients, adjacency.T.tocsr(), _first(recipient, recipient_names)),
+            SimilarityIndex(
+                list(zip(contributor_ids, recipient_ids, strict=True)),
+                np.column_stack([np.array(s, dtype=np.float64) for s in scores[1:]]),
+                [
+                    f"{c or ''} → {r or ''}"
+                    for c, r in zip(contributor_names, recipient_names, strict=True)
+                ],
+            )
+            if pairs
+            else None,
+        )
+
+    def most_similar(
+        self, kind: str, key: Hashable, k: int = 10
+    ) -> List[Tuple[Hashable, str, float]]:
+        """
+        The k contributors, recipients or pairs most similar to one.
+
+        Args:
+            kind: contributor, recipient or pair
+            key: FEC id, or a (contributor id, recipient id) tuple for pairs
+            k: Number of results
+
+        Returns:
+            (key, name, similarity) tuples, most similar first
+        """
+        return self.indexes[kind].most_similar(key, k)
+
+
+def compute_similar_committees(
+    db: Database, k: int = 10, memory_mb: int = 512, workers: int = 1
+) -> int:
+    """
+    Rebuild similar_committees with every contributor's and recipient's top k.
+
+    Only neighbours with a positive similarity (at least one recipient, or
+    contributor, in common) are written.
+
+    Args:
+        db: Database holding final_scores
+        k: Neighbours per committee
+        memory_mb: Memory budget for the score matrices and blocks
+        workers: Processes computing blocks
+
+    Returns:
+        Number of rows written
+    """
+    similarity = Similarity.from_database(db, pairs=False)
+    db.drop_tables([SimilarCommittees], safe=True)
+    db.create_tables([SimilarCommittees])
+
+    written = 0
+    for kind in BATCH_KINDS:
+        index = similarity.indexes[kind]
+        logger.info(f"Finding the {k} most similar {kind}s")
+        for start, neighbours, scores in index.all_top_k(k, memory_mb, workers):
+            rows = (
+                (kind, index.keys[start + row], rank, index.keys[neighbour], float(score))
+                for row in range(len(neighbours))
+                for rank, (neighbour, score) in enumerate(
+                    zip(neighbours[row], scores[row], strict=True), 1
+                )
+                if score > 0
+            )
+            with db.atomic():
+                for batch in chunked(rows, 1000):
+                    written += len(batch)
+                    SimilarCommittees.insert_many(
+                        batch,
+                        fields=[
+                            SimilarCommittees.kind,
+                            SimilarCommittees.fec_committee_id,
+                            SimilarCommittees.rank,
+                            SimilarCommittees.similar_id,
+                            SimilarCommittees.similarity,
+                        ],
+                    ).execute()
+
+    logger.info(f"  Wrote {written:,} similar committees")
+    return written
+
+
+def _first(codes: np.ndarray, names: Sequence[Optional[str]]) -> List[Optional[str]]:
+    """Name from the first row of each code."""
+    _, first = np.unique(codes, return_index=True)
+    return [names[i] for i in first]
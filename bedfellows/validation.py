@@ -159,7 +159,9 @@ class DataValidator:
 
         if filtered_count > 0:
             # Check for null amounts
-            null_amount = FecContributions.select().where(FecContributions.amount.is_null()).count()
+            null_amount = (
+                FecContributions.select().where(FecContributions.amount_cents.is_null()).count()
+            )
             if null_amount > 0:
                 self.warnings.append(f"{null_amount} contributions missing amount")
 
@@ -169,18 +171,14 @@ class DataValidator:
                 self.warnings.append(f"{null_date} contributions missing date")
 
             # Check for invalid amounts
-            try:
-                # This works for databases that support CAST in WHERE clauses
-                negative_amount = (
-                    FecContributions
-                    .select()
-                    .where(FecContributions.amount < '0')
-                    .count()
-                )
-                if negative_amount > 0:
-                    self.warnings.append(f"{negative_amount} contributions with negative amounts")
-            except:
-                pass  # Skip if database doesn't support this check
+            negative_amount = (
+                FecContributions
+                .select()
+                .where(FecContributions.amount_cents < 0)
+                .count()
+            )
+            if negative_amount > 0:
+                self.warnings.append(f"{negative_amount} contributions with negative amounts")
 
             self.stats["contributions_valid"] = filtered_count - null_amount
 
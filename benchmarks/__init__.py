@@ -0,0 +1 @@
+"""Benchmarks for Bedfellows ingest and score computation."""
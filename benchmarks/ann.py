@@ -0,0 +1,109 @@
+"""
+Benchmark: approximate (IVF) versus exact pair similarity queries.
+
+Builds the approximate pair index from random six-score pair vectors and,
+for a sample of query pairs, times ``search`` against ``exact`` (which
+scores every pair) and reports the mean recall of the approximate results.
+
+Usage:
+    python -m benchmarks.ann --pairs 2000000 --probes 8
+"""
+
+import argparse
+
+import numpy as np
+
+from bedfellows.ann import PairAnnIndex, recall
+from bedfellows.similarity import SCORE_COLUMNS
+from benchmarks.synthetic import timed
+
+
+def pair_vectors(n_pairs: int, n_clusters: int = 200, seed: int = 0) -> tuple:
+    """
+    Random pairs with score vectors clustered around a few typical profiles.
+
+    Args:
+        n_pairs: Pairs to draw
+        n_clusters: Score profiles the vectors scatter around
+        seed: Random seed
+
+    Returns:
+        (contributor ids, recipient ids, n_pairs x 6 score vectors)
+    """
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(n_pairs * 2)))
+    keys = rng.choice(side * side, n_pairs, replace=False)
+    contributors = np.char.add("C", np.char.zfill((keys // side).astype(str), 8))
+    recipients = np.char.add("C", np.char.zfill((keys % side).astype(str), 8))
+    profiles = rng.random((n_clusters, len(SCORE_COLUMNS)))
+    vectors = profiles[rng.integers(0, n_clusters, n_pairs)]
+    vectors = np.clip(vectors + rng.normal(0, 0.1, vectors.shape), 0, 1)
+    return contributors, recipients, vectors
+
+
+def run(n_pairs: int, queries: int, k: int, n_probe: int, seed: int = 0) -> dict:
+    """
+    Time index construction and approximate and exact queries.
+
+    Args:
+        n_pairs: Pairs in the index
+        queries: Number of pairs to query
+        k: Results per query
+        n_probe: Lists searched per approximate query
+        seed: Random seed
+
+    Returns:
+        Build time in seconds, list count, per-query times in milliseconds
+        and per-query recall
+    """
+    contributors, recipients, vectors = pair_vectors(n_pairs, seed=seed)
+    with timed() as timing:
+        index = PairAnnIndex.build(contributors, recipients, vectors, seed=seed)
+    build = timing["elapsed"]
+
+    rng = np.random.default_rng(seed + 1)
+    approx_times, exact_times, recalls = [], [], []
+    for position in rng.integers(0, n_pairs, queries):
+        query = index.pair(position)
+        with timed() as timing:
+            approximate = index.search(*query, k=k, n_probe=n_probe)
+        approx_times.append(timing["elapsed"] * 1000)
+        with timed() as timing:
+            exact = index.exact(*query, k=k)
+        exact_times.append(timing["elapsed"] * 1000)
+        recalls.append(recall(approximate, exact))
+    return {
+        "build": build,
+        "lists": len(index.centroids),
+        "approx": np.array(approx_times),
+        "exact": np.array(exact_times),
+        "recall": np.array(recalls),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pairs", type=int, default=2000000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--probes", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = run(args.pairs, args.queries, args.k, args.probes, args.seed)
+    print(
+        f"{args.pairs:,} pairs in {result['lists']:,} lists; "
+        f"index built in {result['build']:.2f}s"
+    )
+    print(f"{'path':>8} {'median ms':>10} {'p95 ms':>8}")
+    for path in ("approx", "exact"):
+        times = result[path]
+        print(f"{path:>8} {np.median(times):>10.2f} {np.percentile(times, 95):>8.2f}")
+    print(
+        f"recall@{args.k} with {args.probes} probes: mean {result['recall'].mean():.3f}, "
+        f"min {result['recall'].min():.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
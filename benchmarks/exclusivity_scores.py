@@ -0,0 +1,94 @@
+"""
+Benchmark: exclusivity aggregates over text amounts vs. integer cents.
+
+Times the two grouped sums exclusivity scores need (per contributor and per
+pair), once casting the text ``amount`` column row by row as the calculator
+used to, and once summing ``amount_cents``. Then times the whole
+``OverallCalculator.compute_exclusivity_scores`` step with the pair summary
+it reads.
+
+Usage:
+    python -m benchmarks.exclusivity_scores --sizes 200000 400000 800000
+"""
+
+import argparse
+import tempfile
+
+from bedfellows.calculators import OverallCalculator
+from benchmarks.synthetic import open_database, populate_contributions, timed, write_reference_csvs
+
+TOTALS = """
+    SELECT COUNT(*) FROM (
+        SELECT contributor_key, contributor_name, {amount} AS total
+        FROM fec_contributions
+        GROUP BY contributor_key, contributor_name
+    ) totals
+"""
+
+PAIR_SUMS = """
+    SELECT COUNT(*) FROM (
+        SELECT contributor_key, recipient_key, contributor_name, recipient_name,
+               {amount} AS amount
+        FROM fec_contributions
+        GROUP BY contributor_key, recipient_key, contributor_name, recipient_name
+    ) pairs
+"""
+
+AMOUNTS = {
+    "cast text": "SUM(CAST(amount AS DECIMAL(10,2)))",
+    "cents": "SUM(amount_cents) / 100.0",
+}
+
+
+def run(sizes, seed: int = 0) -> list:
+    """
+    Time the exclusivity aggregates and step at each size.
+
+    Args:
+        sizes: Row counts to benchmark
+        seed: Random seed for the synthetic data
+
+    Returns:
+        List of (rows, {timing name: seconds}) tuples
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as csv_dir:
+        write_reference_csvs(csv_dir)
+        for size in sizes:
+            db = open_database()
+            populate_contributions(size, seed=seed)
+            timings = {}
+            for name, amount in AMOUNTS.items():
+                with timed() as timing:
+                    for query in (TOTALS, PAIR_SUMS):
+                        db.execute_sql(query.format(amount=amount)).fetchone()
+                timings[name] = timing["elapsed"]
+
+            calculator = OverallCalculator(db, {"csv_dir": csv_dir})
+            with timed() as timing:
+                calculator.compute_pair_summary()
+                calculator.compute_exclusivity_scores()
+            timings["step"] = timing["elapsed"]
+            results.append((size, timings))
+            db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200000, 400000, 800000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.seed)
+    print(f"{'rows':>12} {'cast text':>10} {'cents':>10} {'speedup':>9} {'step':>10}")
+    for rows, timings in results:
+        speedup = timings["cast text"] / timings["cents"]
+        print(
+            f"{rows:>12,} {timings['cast text']:>10.2f} {timings['cents']:>10.2f} "
+            f"{speedup:>8.2f}x {timings['step']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
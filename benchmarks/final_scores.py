@@ -0,0 +1,135 @@
+"""
+Benchmark: combining component scores into final_scores.
+
+Builds the pair summary and the six component score tables (untimed), then
+times ``OverallCalculator.compute_final_scores``, which joins the score
+tables to one row per pair and name. With ``--legacy`` it also times the
+row-level query the step used to run: every contribution joined to every
+score table and grouped back down, which fans out when a pair was filed
+under more than one contributor or recipient name.
+
+A share of contributions is filed under a second contributor name
+(``--variants``) so the synthetic data has the name variants real filings
+do.
+
+Usage:
+    python -m benchmarks.final_scores --sizes 10000000 --legacy
+"""
+
+import argparse
+import tempfile
+
+from bedfellows.calculators import OverallCalculator
+from bedfellows.models import FinalScores
+from benchmarks.synthetic import open_database, populate_contributions, timed, write_reference_csvs
+
+LEGACY = """
+    INSERT INTO final_scores
+    (fec_committee_id, contributor_name, committee_name, other_id, recipient_name, count,
+     exclusivity_score, report_type_score, periodicity_score,
+     maxed_out_score, length_score, race_focus_score, final_score)
+    SELECT
+        cd.fecid, cm.name, fc.contributor_name, rd.fecid, fc.recipient_name, COUNT(*),
+        COALESCE(es.amount / es.total_by_pac, 0),
+        COALESCE(rt.report_type_score, 0),
+        COALESCE(ps.periodicity_score, 0),
+        COALESCE(ms.maxed_out_score, 0),
+        COALESCE(ls.length_score, 0),
+        COALESCE(rf.race_focus_score, 0),
+        (COALESCE(es.amount / es.total_by_pac, 0) + COALESCE(rt.report_type_score, 0)
+         + COALESCE(ps.periodicity_score, 0) + COALESCE(ms.maxed_out_score, 0)
+         + COALESCE(ls.length_score, 0) + COALESCE(rf.race_focus_score, 0)) / 6
+    FROM fec_contributions fc
+    JOIN committee_dim cd ON fc.contributor_key = cd.committee_key
+    JOIN committee_dim rd ON fc.recipient_key = rd.committee_key
+    LEFT JOIN fec_committees cm ON cd.fecid = cm.fecid
+    LEFT JOIN exclusivity_scores es
+        ON fc.contributor_key = es.contributor_key AND fc.recipient_key = es.recipient_key
+    LEFT JOIN report_type_scores rt
+        ON fc.contributor_key = rt.contributor_key AND fc.recipient_key = rt.recipient_key
+    LEFT JOIN periodicity_scores ps
+        ON fc.contributor_key = ps.contributor_key AND fc.recipient_key = ps.recipient_key
+    LEFT JOIN maxed_out_scores ms
+        ON fc.contributor_key = ms.contributor_key AND fc.recipient_key = ms.recipient_key
+    LEFT JOIN length_scores ls
+        ON fc.contributor_key = ls.contributor_key AND fc.recipient_key = ls.recipient_key
+    LEFT JOIN race_focus_scores rf ON fc.contributor_key = rf.contributor_key
+    GROUP BY fc.contributor_key, fc.recipient_key, fc.contributor_name, fc.recipient_name,
+             cd.fecid, rd.fecid, cm.name, es.amount, es.total_by_pac, rt.report_type_score,
+             ps.periodicity_score, ms.maxed_out_score, ls.length_score, rf.race_focus_score
+"""
+
+
+def run(sizes, seed: int = 0, variants: float = 0.1, legacy: bool = False) -> list:
+    """
+    Time the final scores step at each size.
+
+    Args:
+        sizes: Row counts to benchmark
+        seed: Random seed for the synthetic data
+        variants: Share of contributions filed under a second contributor name
+        legacy: Also time the row-level query the step used to run
+
+    Returns:
+        List of (rows, {timing name: seconds or row count}) tuples
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as csv_dir:
+        write_reference_csvs(csv_dir)
+        for size in sizes:
+            db = open_database()
+            populate_contributions(size, seed=seed)
+            if variants:
+                db.execute_sql(
+                    "UPDATE fec_contributions SET contributor_name = contributor_name || ' INC' "
+                    f"WHERE id % {round(1 / variants)} = 0"
+                )
+
+            calculator = OverallCalculator(db, {"csv_dir": csv_dir})
+            calculator.compute_pair_summary()
+            calculator.compute_exclusivity_scores()
+            calculator.compute_report_type_scores()
+            calculator.compute_periodicity_scores()
+            calculator.compute_maxed_out_scores()
+            calculator.compute_length_scores()
+            calculator.compute_race_focus_scores()
+
+            timings = {}
+            with timed() as timing:
+                calculator.compute_final_scores()
+            timings["step"] = timing["elapsed"]
+            timings["rows"] = FinalScores.select().count()
+
+            if legacy:
+                db.drop_tables([FinalScores])
+                db.create_tables([FinalScores])
+                with timed() as timing:
+                    db.execute_sql(LEGACY)
+                timings["legacy"] = timing["elapsed"]
+                timings["legacy rows"] = FinalScores.select().count()
+            results.append((size, timings))
+            db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--variants", type=float, default=0.1)
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.seed, args.variants, args.legacy)
+    print(f"{'rows':>12} {'step':>10} {'scores':>12} {'legacy':>10} {'legacy rows':>12}")
+    for rows, timings in results:
+        legacy = (
+            f"{timings['legacy']:>10.2f} {timings['legacy rows']:>12,}"
+            if "legacy" in timings
+            else f"{'-':>10} {'-':>12}"
+        )
+        print(f"{rows:>12,} {timings['step']:>10.2f} {timings['rows']:>12,} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
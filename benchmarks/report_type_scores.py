@@ -0,0 +1,62 @@
+"""
+Benchmark: report type scores vs. fec_contributions row count.
+
+Runs ``OverallCalculator.compute_report_type_scores`` (plus the pair summary
+it reads) on synthetic tables of increasing size and prints the time per
+row. The set-based pipeline should scale linearly, so time per row stays
+roughly flat as the table grows.
+
+Usage:
+    python -m benchmarks.report_type_scores --sizes 100000 200000 400000
+"""
+
+import argparse
+import tempfile
+
+from bedfellows.calculators import OverallCalculator
+from benchmarks.synthetic import open_database, populate_contributions, timed, write_reference_csvs
+
+
+def run(sizes, seed: int = 0) -> list:
+    """
+    Time report type scores at each size.
+
+    Args:
+        sizes: Row counts to benchmark
+        seed: Random seed for the synthetic data
+
+    Returns:
+        List of (rows, seconds) tuples
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as csv_dir:
+        write_reference_csvs(csv_dir)
+        for size in sizes:
+            db = open_database()
+            populate_contributions(size, seed=seed)
+            calculator = OverallCalculator(db, {"csv_dir": csv_dir})
+            with timed() as timing:
+                calculator.compute_pair_summary()
+                calculator.compute_report_type_scores()
+            results.append((size, timing["elapsed"]))
+            db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 200000, 400000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.seed)
+    base_rows, base_seconds = results[0]
+    print(f"{'rows':>12} {'seconds':>10} {'us/row':>10} {'vs. smallest':>14}")
+    for rows, seconds in results:
+        per_row = seconds / rows * 1e6
+        ratio = per_row / (base_seconds / base_rows * 1e6)
+        print(f"{rows:>12,} {seconds:>10.2f} {per_row:>10.2f} {ratio:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark: top-k cosine similarity queries.
+
+Builds a contributor similarity index from a random sparse contributor x
+recipient score matrix (skewed like real giving: a few contributors give to
+thousands of recipients, most to a handful) and times ``most_similar`` for
+a sample of contributors. Each query compares against every contributor.
+
+With ``--batch`` it also times the all-pairs job (every contributor's top k,
+in blocks sized to ``--memory-mb``) and reports the most memory this
+process allocated while it ran (with ``--workers`` above 1 the blocks are
+computed in the workers, so this only covers the parent).
+
+Usage:
+    python -m benchmarks.similarity --contributors 20000 --recipients 50000 --pairs 2000000
+    python -m benchmarks.similarity --batch --memory-mb 256 --workers 2
+"""
+
+import argparse
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+from bedfellows.similarity import SimilarityIndex
+from benchmarks.synthetic import timed
+
+
+def score_matrix(
+    n_contributors: int, n_recipients: int, n_pairs: int, seed: int = 0
+) -> sparse.csr_matrix:
+    """
+    Random contributor x recipient final scores.
+
+    Args:
+        n_contributors: Rows
+        n_recipients: Columns
+        n_pairs: Scores to draw (repeated pairs merge into one)
+        seed: Random seed
+
+    Returns:
+        CSR matrix of scores in [0, 1)
+    """
+    rng = np.random.default_rng(seed)
+    contributors = np.minimum(rng.pareto(1.2, n_pairs).astype(np.int64), n_contributors - 1)
+    recipients = rng.integers(0, n_recipients, n_pairs)
+    scores = rng.random(n_pairs)
+    matrix = sparse.csr_matrix(
+        (scores, (contributors, recipients)), shape=(n_contributors, n_recipients)
+    )
+    matrix.sum_duplicates()
+    return matrix
+
+
+def run(
+    n_contributors: int,
+    n_recipients: int,
+    n_pairs: int,
+    queries: int,
+    k: int,
+    seed: int = 0,
+    batch_memory_mb: Optional[int] = None,
+    workers: int = 1,
+) -> dict:
+    """
+    Time index construction and top-k queries.
+
+    Args:
+        n_contributors: Contributors in the index
+        n_recipients: Recipients (vector length)
+        n_pairs: Scores to draw before repeated pairs merge
+        queries: Number of contributors to query
+        k: Results per query
+        seed: Random seed
+        batch_memory_mb: Also time the all-pairs job with this budget
+        workers: Processes for the all-pairs job
+
+    Returns:
+        Build time in seconds, per-query times in milliseconds and, with a
+        batch budget, the all-pairs time and peak allocated megabytes
+    """
+    matrix = score_matrix(n_contributors, n_recipients, n_pairs, seed)
+    with timed() as timing:
+        index = SimilarityIndex([f"C{i:08d}" for i in range(n_contributors)], matrix)
+    build = timing["elapsed"]
+
+    rng = np.random.default_rng(seed + 1)
+    times = []
+    for position in rng.integers(0, n_contributors, queries):
+        with timed() as timing:
+            index.most_similar(index.keys[position], k)
+        times.append(timing["elapsed"] * 1000)
+    result = {"build": build, "nonzero": matrix.nnz, "times": np.array(times)}
+
+    if batch_memory_mb:
+        tracemalloc.start()
+        with timed() as timing:
+            for _ in index.all_top_k(k, batch_memory_mb, workers):
+                pass
+        result["batch"] = timing["elapsed"]
+        result["batch_peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contributors", type=int, default=20000)
+    parser.add_argument("--recipients", type=int, default=50000)
+    parser.add_argument("--pairs", type=int, default=2000000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch", action="store_true")
+    parser.add_argument("--memory-mb", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    result = run(
+        args.contributors,
+        args.recipients,
+        args.pairs,
+        args.queries,
+        args.k,
+        args.seed,
+        args.memory_mb if args.batch else None,
+        args.workers,
+    )
+    times = result["times"]
+    print(
+        f"{args.contributors:,} contributors x {args.recipients:,} recipients, "
+        f"{result['nonzero']:,} scores; index built in {result['build']:.2f}s"
+    )
+    print(f"{'queries':>8} {'median ms':>10} {'p95 ms':>8} {'max ms':>8}")
+    print(
+        f"{len(times):>8} {np.median(times):>10.2f} {np.percentile(times, 95):>8.2f} "
+        f"{times.max():>8.2f}"
+    )
+    if "batch" in result:
+        print(
+            f"all-pairs top {args.k}: {result['batch']:.2f}s with {args.workers} worker(s); "
+            f"peak allocated {result['batch_peak_mb']:.0f} MB (budget {args.memory_mb} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
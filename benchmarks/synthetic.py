@@ -0,0 +1,151 @@
+"""
+Synthetic data for benchmarking score calculations.
+
+Generates a reproducible ``fec_contributions`` table of any size, with the
+skew real data shows (a few very active contributors, many small ones), plus
+the reference CSVs the calculators read. The CSV weights and limits are
+placeholders for timing only, not the editorial values.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from peewee import SqliteDatabase
+
+from bedfellows.loaders.base import chunked
+from bedfellows.models import (
+    FecCommittees,
+    FecContributions,
+    create_all_tables,
+    init_models,
+)
+
+REPORT_TYPES = ["Q1", "Q2", "Q3", "YE", "12G", "30G", "12P", "M3", "M6", "M10", "MY", "PRE"]
+
+COMMITTEE_TYPES = ["Q", "N", "X", "Y", "H", "S", "P"]
+
+CONTRIBUTOR_TYPES = ["national_party", "other_party", "multi_pac", "non_multi_pac"]
+RECIPIENT_TYPES = ["national_party", "other_party", "pac", "candidate"]
+
+START_DATE = datetime(2003, 1, 1)
+END_DATE = datetime(2024, 12, 31)
+
+
+def write_reference_csvs(directory: Union[str, Path]) -> Path:
+    """
+    Write placeholder reference CSVs used by the calculators.
+
+    Args:
+        directory: Directory to write into
+
+    Returns:
+        The directory path
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    lines = ["report_type,year_parity,weight"]
+    for i, report_type in enumerate(REPORT_TYPES):
+        lines.append(f"{report_type},odd,{4 - i % 4}")
+        lines.append(f"{report_type},even,{1 + i % 4}")
+    (directory / "report_types.csv").write_text("\n".join(lines) + "\n")
+
+    lines = ["contributor_type,recipient_type,cycle,contribution_limit"]
+    for cycle in range(START_DATE.year + 1, END_DATE.year + 1, 2):
+        for contributor_type in CONTRIBUTOR_TYPES:
+            for recipient_type in RECIPIENT_TYPES:
+                lines.append(f"{contributor_type},{recipient_type},{cycle},5000")
+    (directory / "limits.csv").write_text("\n".join(lines) + "\n")
+
+    return directory
+
+
+def open_database(path: Optional[str] = None) -> SqliteDatabase:
+    """
+    Open a SQLite database with all Bedfellows tables created.
+
+    Args:
+        path: Database file path (None = in-memory)
+
+    Returns:
+        Initialized database
+    """
+    db = SqliteDatabase(path or ":memory:", pragmas={"journal_mode": "off", "synchronous": 0})
+    init_models(db)
+    create_all_tables()
+    return db
+
+
+def populate_contributions(
+    n_rows: int,
+    n_committees: Optional[int] = None,
+    seed: int = 0,
+    batch_size: int = 2000,
+) -> int:
+    """
+    Fill fec_committees and fec_contributions with synthetic data.
+
+    Args:
+        n_rows: Number of contributions to generate
+        n_committees: Number of committees (defaults to scale with n_rows)
+        seed: Random seed
+        batch_size: Rows per INSERT
+
+    Returns:
+        Number of contributions inserted
+    """
+    rng = random.Random(seed)
+    n_committees = n_committees or max(50, n_rows // 50)
+    ids = [f"C{i:08d}" for i in range(n_committees)]
+    span = (END_DATE - START_DATE).days
+
+    committees = (
+        {
+            "fecid": fecid,
+            "name": f"COMMITTEE {fecid}",
+            "committee_type": rng.choice(COMMITTEE_TYPES),
+        }
+        for fecid in ids
+    )
+    for batch in chunked(committees, batch_size):
+        FecCommittees.insert_many(batch).execute()
+
+    def rows() -> Iterator[dict]:
+        for _ in range(n_rows):
+            # Pareto-ish skew so a few committees give (and get) most donations
+            contributor = ids[min(int(rng.paretovariate(1.2)) - 1, n_committees - 1)]
+            recipient = ids[rng.randrange(n_committees)]
+            date = START_DATE + timedelta(days=rng.randrange(span))
+            amount = rng.choice([250, 500, 1000, 2500, 5000])
+            yield {
+                "fec_committee_id": contributor,
+                "contributor_name": f"COMMITTEE {contributor}",
+                "other_id": recipient,
+                "recipient_name": f"COMMITTEE {recipient}",
+                "report_type": rng.choice(REPORT_TYPES),
+                "date": date,
+                "amount": str(amount),
+                "amount_cents": amount * 100,
+                "cycle": str(date.year + date.year % 2),
+            }
+
+    db = FecContributions._meta.database
+    with db.atomic():
+        for batch in chunked(rows(), batch_size):
+            FecContributions.insert_many(batch).execute()
+        FecContributions.fill_derived_columns()
+
+    return n_rows
+
+
+@contextmanager
+def timed() -> Iterator[dict]:
+    """Time a block; the yielded dict gets an ``elapsed`` key on exit."""
+    result = {}
+    started = time.perf_counter()
+    yield result
+    result["elapsed"] = time.perf_counter() - started
@@ -0,0 +1,805 @@
+"""Tests for score calculators."""
+
+import random
+import statistics
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from peewee import PostgresqlDatabase, SqliteDatabase, fn
+
+from bedfellows.calculators import ByCycleCalculator, NumpyCalculator, OverallCalculator
+from bedfellows.calculators.base import BaseCalculator, Step
+from bedfellows.models import (
+    AffectedPairs,
+    CommitteeDim,
+    ContributorTypes,
+    CycleFinalScores,
+    FecCandidates,
+    FecCommitteeContributions,
+    FecCommittees,
+    FecContributions,
+    FinalScores,
+    LengthScores,
+    MaxedOutScores,
+    PairSummary,
+    PeriodicityScores,
+    RaceFocusScores,
+    Races,
+    RacesList,
+    RecipientTypes,
+    ReportTypeScores,
+    UnnormalizedLengthScores,
+    UnnormalizedPeriodicityScores,
+    UnnormalizedReportTypeScores,
+    create_all_tables,
+    init_models,
+)
+
+REPORT_TYPES_CSV = """report_type,year_parity,weight
+Q1,odd,4
+Q1,even,3
+12G,odd,1
+12G,even,1
+"""
+
+LIMITS_CSV = """contributor_type,recipient_type,cycle,contribution_limit
+multi_pac,candidate,2024,5000
+multi_pac,pac,2024,5000
+non_multi_pac,candidate,2024,3300
+"""
+
+# (contributor, recipient, report type, date, amount)
+CONTRIBUTIONS = [
+    ("C00000001", "C00000100", "Q1", datetime(2023, 3, 1), "1000"),
+    ("C00000001", "C00000100", "Q1", datetime(2023, 3, 20), "1000"),
+    ("C00000001", "C00000100", "12G", datetime(2024, 10, 20), "2000"),
+    ("C00000002", "C00000100", "12G", datetime(2024, 10, 25), "500"),
+    ("C00000002", "C00000200", "XX", datetime(2024, 5, 1), "500"),
+]
+
+
+@pytest.fixture
+def test_db():
+    """Create an in-memory test database with a few contributions."""
+    db = SqliteDatabase(":memory:")
+    init_models(db)
+    create_all_tables()
+
+    for fecid in ("C00000001", "C00000002"):
+        FecCommittees.create(fecid=fecid, name=f"PAC {fecid}", committee_type="Q")
+
+    FecContributions.insert_many(
+        [
+            {
+                "fec_committee_id": contributor,
+                "contributor_name": f"PAC {contributor}",
+                "other_id": recipient,
+                "recipient_name": f"RECIPIENT {recipient}",
+                "report_type": report_type,
+                "date": date,
+                "amount": amount,
+            }
+            for contributor, recipient, report_type, date, amount in CONTRIBUTIONS
+        ]
+    ).execute()
+    FecContributions.fill_derived_columns()
+    return db
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """Write reference CSVs to a temporary directory."""
+    (tmp_path / "report_types.csv").write_text(REPORT_TYPES_CSV)
+    (tmp_path / "limits.csv").write_text(LIMITS_CSV)
+    return tmp_path
+
+
+def _scores(model, column):
+    if "contributor_key" not in model._meta.fields:
+        return {
+            (row.fec_committee_id, row.other_id): getattr(row, column)
+            for row in model.select()
+        }
+    fecids = _fecids()
+    return {
+        (fecids[row.contributor_key], fecids[row.recipient_key]): getattr(row, column)
+        for row in model.select()
+    }
+
+
+def _fecids():
+    return {row.committee_key: row.fecid for row in CommitteeDim.select()}
+
+
+def test_report_type_scores(test_db, csv_dir):
+    """Test report type frequencies are weighted by year parity and normalized."""
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_pair_summary()
+    calculator.compute_report_type_scores()
+
+    unnormalized = _scores(UnnormalizedReportTypeScores, "report_type_score")
+    # 2/3 Q1 in an odd year (weight 4) + 1/3 12G in an even year (weight 1)
+    assert unnormalized[("C00000001", "C00000100")] == pytest.approx(3.0)
+    assert unnormalized[("C00000002", "C00000100")] == pytest.approx(1.0)
+    # Report types without a weight contribute nothing
+    assert unnormalized[("C00000002", "C00000200")] == pytest.approx(0.0)
+
+    scores = _scores(ReportTypeScores, "report_type_score")
+    assert scores[("C00000001", "C00000100")] == pytest.approx(1.0)
+    assert scores[("C00000002", "C00000100")] == pytest.approx(1.0 / 3.0)
+
+
+def test_report_type_scores_without_weights(test_db, tmp_path):
+    """Test a missing report_types.csv leaves empty score tables behind."""
+    calculator = OverallCalculator(test_db, {"csv_dir": tmp_path})
+    calculator.compute_pair_summary()
+    calculator.compute_report_type_scores()
+
+    assert ReportTypeScores.select().count() == 0
+
+
+def test_final_scores_include_report_type(test_db, csv_dir):
+    """Test final scores pick up the report type score."""
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_pair_summary()
+    calculator.compute_exclusivity_scores()
+    calculator.compute_report_type_scores()
+    calculator.compute_length_scores()
+    calculator.compute_final_scores()
+
+    final = _scores(FinalScores, "report_type_score")
+    assert final[("C00000001", "C00000100")] == pytest.approx(1.0)
+    assert final[("C00000002", "C00000100")] == pytest.approx(1.0 / 3.0)
+
+
+def test_final_scores_do_not_fan_out(test_db, csv_dir):
+    """Test a pair filed under two names gets one final row per name with its own counts."""
+    FecContributions.insert_many(
+        [
+            {
+                "fec_committee_id": "C00000001",
+                "contributor_name": "PAC C00000001 INC",
+                "other_id": "C00000100",
+                "recipient_name": "RECIPIENT C00000100",
+                "date": date,
+                "amount": "1000",
+            }
+            for date in (datetime(2024, 1, 1), datetime(2024, 1, 11))
+        ]
+    ).execute()
+    FecContributions.fill_derived_columns()
+
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_pair_summary()
+    calculator.compute_exclusivity_scores()
+    calculator.compute_length_scores()
+    calculator.compute_final_scores()
+
+    rows = {
+        row.committee_name: row
+        for row in FinalScores.select().where(
+            FinalScores.fec_committee_id == "C00000001", FinalScores.other_id == "C00000100"
+        )
+    }
+    assert sorted(rows) == ["PAC C00000001", "PAC C00000001 INC"]
+    assert rows["PAC C00000001"].count == 3
+    assert rows["PAC C00000001 INC"].count == 2
+    # Each name's donations are all to this recipient
+    assert rows["PAC C00000001"].exclusivity_score == pytest.approx(1.0)
+    assert rows["PAC C00000001 INC"].exclusivity_score == pytest.approx(1.0)
+    # 599 days is the longest relationship; the second name spans 10
+    assert rows["PAC C00000001"].length_score == pytest.approx(1.0)
+    assert rows["PAC C00000001 INC"].length_score == pytest.approx(10 / 599)
+    assert FinalScores.select().count() == 4
+
+
+def test_periodicity_scores(test_db):
+    """Test periodicity is the inverse population stddev of day of year."""
+    # Same day of year in two different years: zero deviation, repeated donor
+    FecContributions.insert_many(
+        [
+            {"fec_committee_id": "C00000003", "other_id": "C00000100", "date": date}
+            for date in (datetime(2022, 5, 1), datetime(2023, 5, 1))
+        ]
+    ).execute()
+    FecContributions.fill_derived_columns()
+
+    calculator = OverallCalculator(test_db)
+    calculator.compute_pair_summary()
+    calculator.compute_periodicity_scores()
+
+    unnormalized = _scores(UnnormalizedPeriodicityScores, "periodicity_score")
+    expected = 1 / statistics.pstdev([60, 79, 294])
+    assert unnormalized[("C00000001", "C00000100")] == pytest.approx(expected)
+    assert unnormalized[("C00000002", "C00000100")] == 0
+    assert unnormalized[("C00000003", "C00000100")] == 1
+
+    scores = _scores(PeriodicityScores, "periodicity_score")
+    assert scores[("C00000003", "C00000100")] == pytest.approx(1.0)
+    assert scores[("C00000001", "C00000100")] == pytest.approx(expected)
+
+
+def test_maxed_out_scores(test_db, csv_dir):
+    """Test per-cycle totals are divided by the limit for the pair's types."""
+    FecCommittees.create(fecid="C00000100", name="CANDIDATE COMMITTEE", committee_type="H")
+    FecCommittees.create(fecid="C00000200", name="OTHER PAC", committee_type="N")
+
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_pair_summary()
+    calculator.compute_maxed_out_scores()
+
+    # Types are resolved once per committee and cycle (2023 donations fall in 2024)
+    assert ContributorTypes.select().count() == 2
+    assert {row.contributor_type for row in ContributorTypes.select()} == {"multi_pac"}
+    fecids = _fecids()
+    types = {fecids[row.recipient_key]: row.recipient_type for row in RecipientTypes.select()}
+    assert types == {"C00000100": "candidate", "C00000200": "pac"}
+
+    # 4000 / 5000 is the highest share; the others are 500 / 5000
+    scores = _scores(MaxedOutScores, "maxed_out_score")
+    assert scores[("C00000001", "C00000100")] == pytest.approx(1.0)
+    assert scores[("C00000002", "C00000100")] == pytest.approx(0.125)
+    assert scores[("C00000002", "C00000200")] == pytest.approx(0.125)
+
+
+def test_race_focus_scores(test_db):
+    """Test race focus is the inverse of distinct races per contributor."""
+    candidates = [
+        # Same House candidate loaded from two cycles' files
+        ("H0TX01234", "01", "TX", "H", "2022", "C00000100"),
+        ("H0TX01234", "01", "TX", "H", "2024", "C00000100"),
+        ("S4CA00001", "00", "CA", "S", "2024", "C00000200"),
+    ]
+    for fecid, district, state, branch, cycle, committee in candidates:
+        FecCandidates.create(
+            fecid=fecid,
+            name=f"CANDIDATE {fecid}",
+            district=district,
+            office_state=state,
+            branch=branch,
+            cycle=cycle,
+            fec_committee_id=committee,
+        )
+
+    calculator = OverallCalculator(test_db)
+    calculator.compute_pair_summary()
+    calculator.compute_race_focus_scores()
+
+    assert Races.select().count() == 2
+    assert RacesList.select().where(RacesList.race_id.is_null()).count() == 0
+    fecids = _fecids()
+    scores = {fecids[row.contributor_key]: row.race_focus_score for row in RaceFocusScores.select()}
+    assert scores == {"C00000001": pytest.approx(1.0), "C00000002": pytest.approx(0.5)}
+
+
+def test_compute_scores_records_step_timings(test_db, csv_dir):
+    """Test a full run times every step, race focus included."""
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_scores()
+
+    assert list(calculator.step_timings) == [
+        "setup",
+        "pair_summary",
+        "exclusivity",
+        "report_type",
+        "periodicity",
+        "maxed_out",
+        "length",
+        "race_focus",
+        "final",
+    ]
+    assert FinalScores.select().count() == 3
+    elapsed, path = calculator.critical_path
+    assert path[0] == "setup" and path[-1] == "final" and len(path) == 4
+    assert elapsed <= sum(calculator.step_timings.values())
+
+
+class StepCalculator(BaseCalculator):
+    """Calculator shell for exercising the step scheduler."""
+
+    def setup(self):
+        pass
+
+    def compute_scores(self):
+        pass
+
+
+def test_steps_wait_for_their_inputs():
+    """Test independent steps run concurrently and dependents wait for them."""
+    calculator = StepCalculator(PostgresqlDatabase("unused"))
+    # Both score steps must be running at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    finished = []
+
+    def step(name, wait=False):
+        def run():
+            if wait:
+                barrier.wait()
+            finished.append(name)
+        return run
+
+    calculator.run_steps(
+        [
+            Step("setup", step("setup"), outputs=["contributions"]),
+            Step("a", step("a", True), inputs=["contributions"], outputs=["a_scores"]),
+            Step("b", step("b", True), inputs=["contributions"], outputs=["b_scores"]),
+            Step("final", step("final"), inputs=["a_scores", "b_scores"], outputs=["final"]),
+        ],
+        workers=4,
+    )
+
+    assert finished[0] == "setup" and finished[-1] == "final"
+    assert list(calculator.step_timings) == ["setup", "a", "b", "final"]
+    elapsed, path = calculator.critical_path
+    assert path[0] == "setup" and path[-1] == "final" and len(path) == 3
+
+
+def test_steps_run_in_order_on_sqlite(test_db):
+    """Test SQLite runs steps one at a time even when workers are requested."""
+    calculator = StepCalculator(test_db)
+    threads = set()
+
+    def run():
+        threads.add(threading.get_ident())
+
+    calculator.run_steps(
+        [Step(name, run, outputs=[name]) for name in ("a", "b", "c")], workers=4
+    )
+    assert threads == {threading.get_ident()}
+    assert calculator.critical_path[1] in (["a"], ["b"], ["c"])
+
+
+def test_by_cycle_scores(test_db, csv_dir):
+    """Test each cycle is scored on its own contributions only."""
+    FecContributions.create(
+        fec_committee_id="C00000001",
+        contributor_name="PAC C00000001",
+        other_id="C00000300",
+        recipient_name="RECIPIENT C00000300",
+        report_type="Q1",
+        date=datetime(2021, 4, 1),
+        amount="100",
+    )
+
+    calculator = ByCycleCalculator(test_db, {"csv_dir": csv_dir})
+    assert calculator.get_cycles() == ["2022", "2024"]
+    calculator.compute_scores()
+
+    pairs = {(row.cycle, row.fec_committee_id, row.other_id) for row in CycleFinalScores.select()}
+    assert pairs == {
+        ("2022", "C00000001", "C00000300"),
+        ("2024", "C00000001", "C00000100"),
+        ("2024", "C00000002", "C00000100"),
+        ("2024", "C00000002", "C00000200"),
+    }
+    # The one 2022 pair is its donor's only recipient that cycle
+    score = CycleFinalScores.get(CycleFinalScores.cycle == "2022")
+    assert score.exclusivity_score == pytest.approx(1.0)
+
+
+def test_by_cycle_scores_in_worker_processes(tmp_path, csv_dir):
+    """Test cycles computed in a process pool match the in-process results."""
+    results = {}
+    for workers in (1, 2):
+        db = SqliteDatabase(str(tmp_path / f"workers_{workers}.db"))
+        init_models(db)
+        create_all_tables()
+        for fecid in ("C00000001", "C00000002"):
+            FecCommittees.create(fecid=fecid, name=f"PAC {fecid}", committee_type="Q")
+        FecContributions.insert_many(
+            [
+                {
+                    "fec_committee_id": contributor,
+                    "contributor_name": f"PAC {contributor}",
+                    "other_id": recipient,
+                    "recipient_name": f"RECIPIENT {recipient}",
+                    "report_type": report_type,
+                    "date": date.replace(year=date.year - offset),
+                    "amount": amount,
+                }
+                for offset in (0, 2, 4)
+                for contributor, recipient, report_type, date, amount in CONTRIBUTIONS
+            ]
+        ).execute()
+
+        ByCycleCalculator(db, {"csv_dir": csv_dir, "workers": workers}).compute_scores()
+        results[workers] = {
+            (row.cycle, row.fec_committee_id, row.other_id): row.final_score
+            for row in CycleFinalScores.select()
+        }
+        db.close()
+
+    assert {cycle for cycle, _, _ in results[2]} == {"2020", "2022", "2024"}
+    assert results[2] == pytest.approx(results[1])
+
+
+def test_pair_summary_rolls_up_contributions(test_db):
+    """Test the pair summary keeps every contribution's count, amount and dates."""
+    calculator = OverallCalculator(test_db)
+    calculator.compute_pair_summary()
+
+    totals = PairSummary.select(
+        fn.SUM(PairSummary.count), fn.SUM(PairSummary.amount_cents), fn.MIN(PairSummary.min_date)
+    ).tuples().get()
+    expected = FecContributions.select(
+        fn.COUNT(FecContributions.id),
+        fn.SUM(FecContributions.amount_cents),
+        fn.MIN(FecContributions.date),
+    ).tuples().get()
+    assert totals == expected
+    assert PairSummary.select().count() < FecContributions.select().count()
+
+
+def test_length_scores(test_db):
+    """Test length is whole days between a pair's first and last donation."""
+    calculator = OverallCalculator(test_db)
+    calculator.compute_pair_summary()
+    calculator.compute_length_scores()
+
+    # 2023-03-01 to 2024-10-20; single donations get no length score
+    scores = _scores(LengthScores, "length_score")
+    assert scores == {("C00000001", "C00000100"): pytest.approx(1.0)}
+    assert UnnormalizedLengthScores.get().length_score == 599
+
+
+def _random_contributions(seed=0):
+    """Committees, candidates and contributions covering every score's branches."""
+    rng = random.Random(seed)
+    committees = [(f"C{i:08d}", rng.choice("QNXYHSP")) for i in range(30)]
+    committees += [("C00003418", "Y"), ("C00000935", "Y")]
+    ids = [fecid for fecid, _ in committees]
+    for fecid, committee_type in committees:
+        FecCommittees.create(fecid=fecid, name=f"PAC {fecid}", committee_type=committee_type)
+
+    for fecid, committee_type in committees:
+        if committee_type in "HSP":
+            FecCandidates.create(
+                fecid=f"{committee_type}0{fecid[-4:]}",
+                name=f"CANDIDATE {fecid}",
+                district=rng.choice(["01", "02", None]),
+                office_state=rng.choice(["TX", "CA"]),
+                branch=committee_type,
+                cycle="2024",
+                fec_committee_id=fecid,
+            )
+
+    rows = []
+    for _ in range(400):
+        contributor, recipient = rng.choice(ids[:12]), rng.choice(ids)
+        date = datetime(2019, 1, 1) + timedelta(days=rng.randrange(6 * 365))
+        rows.append({
+            "fec_committee_id": contributor,
+            "contributor_name": f"PAC {contributor}",
+            "other_id": recipient,
+            "recipient_name": f"RECIPIENT {recipient}",
+            "report_type": rng.choice(["Q1", "12G", "XX", None]),
+            "date": date,
+            "amount": str(rng.choice([100, 500, 2500, 5000])),
+            "cycle": rng.choice([None, None, str(date.year + date.year % 2)]),
+        })
+    FecContributions.insert_many(rows).execute()
+    FecContributions.fill_derived_columns()
+
+
+def test_numpy_engine_matches_sql(csv_dir):
+    """Test the NumPy engine writes the same final scores as the SQL calculator."""
+    db = SqliteDatabase(":memory:")
+    init_models(db)
+    create_all_tables()
+    _random_contributions()
+    with open(csv_dir / "limits.csv", "a") as f:
+        for cycle in (2020, 2022):
+            f.write(f"multi_pac,candidate,{cycle},5000\n")
+            f.write(f"national_party,pac,{cycle},10000\n")
+
+    columns = [
+        "count",
+        "contributor_name",
+        "exclusivity_score",
+        "report_type_score",
+        "periodicity_score",
+        "maxed_out_score",
+        "length_score",
+        "race_focus_score",
+        "final_score",
+    ]
+    results = {}
+    for calculator_class in (OverallCalculator, NumpyCalculator):
+        calculator_class(db, {"csv_dir": csv_dir}).compute_scores()
+        results[calculator_class] = {
+            (row.fec_committee_id, row.other_id): [getattr(row, c) for c in columns]
+            for row in FinalScores.select()
+        }
+
+    sql, vectorized = results[OverallCalculator], results[NumpyCalculator]
+    assert len(sql) > 100
+    assert sql.keys() == vectorized.keys()
+    for pair, row in sql.items():
+        assert vectorized[pair][:2] == row[:2]
+        assert vectorized[pair][2:] == pytest.approx(row[2:]), pair
+
+    # Every component is exercised, not just zero on both sides
+    for index in range(2, len(columns)):
+        assert any(row[index] > 0 for row in sql.values()), columns[index]
+
+
+def test_incremental_compute_matches_full_run(test_db, csv_dir):
+    """Test rescoring only new contributions gives the same exclusivity and length."""
+    # Components an incremental run refreshes; the others keep last run's values
+    weights = {
+        "exclusivity": 1.0,
+        "length": 2.0,
+        "report_type": 0.0,
+        "periodicity": 0.0,
+        "maxed_out": 0.0,
+        "race_focus": 0.0,
+    }
+    config = {"csv_dir": csv_dir, "weights": weights}
+    OverallCalculator(test_db, config).compute_scores()
+    untouched = FinalScores.get(FinalScores.fec_committee_id == "C00000001")
+
+    # A longer relationship for C00000002 changes the length normalizer for everyone
+    FecContributions.insert_many(
+        [
+            {
+                "fec_committee_id": "C00000002",
+                "contributor_name": "PAC C00000002",
+                "other_id": "C00000200",
+                "recipient_name": "RECIPIENT C00000200",
+                "report_type": "Q1",
+                "date": datetime(2019, 1, 1),
+                "amount": "1500",
+            },
+        ]
+    ).execute()
+
+    calculator = OverallCalculator(test_db, config)
+    calculator.compute_incremental()
+    assert list(calculator.step_timings) == [
+        "setup",
+        "pair_summary",
+        "exclusivity",
+        "length",
+        "final",
+    ]
+    assert calculator.length_rescale < 1
+    incremental = {
+        (row.fec_committee_id, row.other_id): (
+            row.count, row.exclusivity_score, row.length_score, row.final_score
+        )
+        for row in FinalScores.select()
+    }
+    rescaled = incremental[("C00000001", "C00000100")]
+    assert rescaled[2] == pytest.approx(untouched.length_score * calculator.length_rescale)
+
+    OverallCalculator(test_db, config).compute_scores()
+    full = {
+        (row.fec_committee_id, row.other_id): (
+            row.count, row.exclusivity_score, row.length_score, row.final_score
+        )
+        for row in FinalScores.select()
+    }
+    assert incremental.keys() == full.keys()
+    for pair, values in full.items():
+        assert incremental[pair] == pytest.approx(values), pair
+
+    # Nothing new: nothing to do
+    calculator.compute_incremental()
+    assert list(calculator.step_timings) == ["setup"]
+
+    # New filings arrive through fec_committee_contributions
+    FecCommitteeContributions.create(
+        fec_committee_id="C00000001",
+        contributor_name="PAC C00000001",
+        other_id="C00000300",
+        recipient_name="RECIPIENT C00000300",
+        date=datetime(2024, 6, 1),
+        amount="250",
+        transaction_type="24K",
+        entity_type="PAC",
+    )
+    calculator.compute_incremental()
+    assert AffectedPairs.select().count() == 1
+    assert FinalScores.select().where(FinalScores.other_id == "C00000300").count() == 1
+
+
+def _contribution_file(path, rows):
+    """Write contributions as a pipe-delimited FEC file, one transaction per row."""
+    lines = [
+        f"{contributor}|{amendment}|{report_type}|P2024|1|24K|PAC|PAC {contributor}|DC|DC|"
+        f"20001|||{date:%m%d%Y}|{amount}|{recipient}|RECIPIENT {recipient}|SA{i}|{filing}|||{i}"
+        for i, (contributor, recipient, report_type, date, amount, amendment, filing) in rows
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def upserted_db(tmp_path):
+    """Score a loaded file with an upsert still to be picked up.
+
+    The upsert corrects one amount in place and supersedes another
+    contribution with an amended filing that moves it to a new recipient.
+    """
+    db = SqliteDatabase(":memory:")
+    init_models(db)
+    create_all_tables()
+    for fecid in ("C00000001", "C00000002"):
+        FecCommittees.create(fecid=fecid, name=f"PAC {fecid}", committee_type="Q")
+
+    rows = [(i, (*row, "N", "4001")) for i, row in enumerate(CONTRIBUTIONS)]
+    FecCommitteeContributions.load_from_csv(_contribution_file(tmp_path / "a.txt", rows))
+
+    def refreshed(csv_dir, config):
+        OverallCalculator(db, {"csv_dir": csv_dir, **config}).compute_scores()
+        corrected = CONTRIBUTIONS[2][:4] + ("20000", "N", "4001")
+        amended = ("C00000002", "C00000300") + CONTRIBUTIONS[4][2:4] + ("1500", "A", "4002")
+        FecCommitteeContributions.upsert_from_csv(
+            _contribution_file(tmp_path / "b.txt", [(2, corrected), (4, amended)])
+        )
+        return db
+
+    return refreshed
+
+
+def test_incremental_compute_after_upsert(upserted_db, csv_dir):
+    """Test amounts corrected and filings superseded by an upsert are rescored."""
+    weights = {
+        "exclusivity": 1.0,
+        "length": 2.0,
+        "report_type": 0.0,
+        "periodicity": 0.0,
+        "maxed_out": 0.0,
+        "race_focus": 0.0,
+    }
+    db = upserted_db(csv_dir, {"weights": weights})
+    before = _scores(FinalScores, "exclusivity_score")
+
+    calculator = OverallCalculator(db, {"csv_dir": csv_dir, "weights": weights})
+    calculator.compute_incremental()
+    assert sorted(row.amount_cents for row in FecContributions.select()) == [
+        50000, 100000, 100000, 150000, 2000000
+    ]
+    exclusivity = _scores(FinalScores, "exclusivity_score")
+    assert exclusivity[("C00000002", "C00000300")] == pytest.approx(0.75)
+    assert ("C00000002", "C00000200") in before
+    assert ("C00000002", "C00000200") not in exclusivity
+
+    columns = ("count", "exclusivity_score", "length_score", "final_score")
+    incremental = {
+        (row.fec_committee_id, row.other_id): [getattr(row, c) for c in columns]
+        for row in FinalScores.select()
+    }
+    OverallCalculator(db, {"csv_dir": csv_dir, "weights": weights, "force": True}).compute_scores()
+    full = {
+        (row.fec_committee_id, row.other_id): [getattr(row, c) for c in columns]
+        for row in FinalScores.select()
+    }
+    assert incremental.keys() == full.keys()
+    for pair, values in full.items():
+        assert incremental[pair] == pytest.approx(values), pair
+
+
+def test_full_compute_after_upsert(upserted_db, csv_dir):
+    """Test cached stages rebuild from rows an upsert changed in place."""
+    db = upserted_db(csv_dir, {})
+    before = _scores(FinalScores, "final_score")
+
+    calculator = OverallCalculator(db, {"csv_dir": csv_dir})
+    calculator.compute_scores()
+    assert calculator.skipped_steps == []
+    assert sorted(row.amount_cents for row in FecContributions.select()) == [
+        50000, 100000, 100000, 150000, 2000000
+    ]
+    after = _scores(FinalScores, "final_score")
+    assert ("C00000002", "C00000200") in before
+    assert sorted(after) == [
+        ("C00000001", "C00000100"),
+        ("C00000002", "C00000100"),
+        ("C00000002", "C00000300"),
+    ]
+
+    # Once refreshed, the stages are cached again
+    calculator = OverallCalculator(db, {"csv_dir": csv_dir})
+    calculator.compute_scores()
+    assert len(calculator.skipped_steps) == 8
+    assert _scores(FinalScores, "final_score") == after
+
+
+def test_changed_filters_rebuild_contributions(tmp_path, csv_dir):
+    """Test new filters or super PAC designations apply to rows already copied."""
+    db = SqliteDatabase(":memory:")
+    init_models(db)
+    create_all_tables()
+    for fecid in ("C00000001", "C00000002"):
+        FecCommittees.create(fecid=fecid, name=f"PAC {fecid}", committee_type="Q")
+    rows = [(i, (*row, "N", "4001")) for i, row in enumerate(CONTRIBUTIONS)]
+    FecCommitteeContributions.load_from_csv(_contribution_file(tmp_path / "a.txt", rows))
+    OverallCalculator(db, {"csv_dir": csv_dir}).compute_scores()
+    assert ("C00000002", "C00000200") in _scores(FinalScores, "final_score")
+
+    FecCommittees.update(is_super_pac=True).where(FecCommittees.fecid == "C00000002").execute()
+    calculator = OverallCalculator(db, {"csv_dir": csv_dir})
+    calculator.compute_incremental()
+    assert len(calculator.step_timings) == 9
+    assert sorted(_scores(FinalScores, "final_score")) == [("C00000001", "C00000100")]
+
+    filters = {"exclude_super_pacs": False}
+    calculator = OverallCalculator(db, {"csv_dir": csv_dir, "filters": filters})
+    calculator.compute_scores()
+    assert calculator.skipped_steps == []
+    assert len(_scores(FinalScores, "final_score")) == 3
+
+
+def test_unchanged_stages_are_skipped(test_db, csv_dir):
+    """Test cached stages rerun only when their inputs, files or weights change."""
+    OverallCalculator(test_db, {"csv_dir": csv_dir}).compute_scores()
+    before = _scores(FinalScores, "final_score")
+
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_scores()
+    assert list(calculator.step_timings) == ["setup"]
+    assert len(calculator.skipped_steps) == 8
+    assert _scores(FinalScores, "final_score") == before
+
+    # A new weight only recombines final scores
+    weights = dict(calculator.weights, exclusivity=3.0)
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir, "weights": weights})
+    calculator.compute_scores()
+    assert list(calculator.step_timings) == ["setup", "final"]
+    assert _scores(FinalScores, "final_score") != before
+
+    # New limits rebuild maxed-out scores, and so final scores
+    with open(csv_dir / "limits.csv", "a") as f:
+        f.write("multi_pac,pac,2022,5000\n")
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir, "weights": weights})
+    calculator.compute_scores()
+    assert list(calculator.step_timings) == ["setup", "maxed_out", "final"]
+
+    calculator = OverallCalculator(
+        test_db, {"csv_dir": csv_dir, "weights": weights, "force": True}
+    )
+    calculator.compute_scores()
+    assert len(calculator.step_timings) == 9
+    assert calculator.skipped_steps == []
+
+
+def test_score_weights_csv_overrides_configured_weights(test_db, csv_dir):
+    """Test score_weights.csv weights are applied and only recombine final scores."""
+    OverallCalculator(test_db, {"csv_dir": csv_dir}).compute_scores()
+
+    (csv_dir / "score_weights.csv").write_text("score_type,weight\nexclusivity,3.0\n")
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    calculator.compute_scores()
+    assert list(calculator.step_timings) == ["setup", "final"]
+    from_file = _scores(FinalScores, "final_score")
+
+    (csv_dir / "score_weights.csv").unlink()
+    weights = dict(calculator.weights, exclusivity=3.0)
+    OverallCalculator(test_db, {"csv_dir": csv_dir, "weights": weights}).compute_scores()
+    assert from_file == pytest.approx(_scores(FinalScores, "final_score"))
+
+
+def test_reweight_matches_recompute(test_db, csv_dir):
+    """Test reweighting stored components gives the scores a full compute would."""
+    OverallCalculator(test_db, {"csv_dir": csv_dir}).compute_scores()
+
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir})
+    assert calculator.reweight({"exclusivity": 3.0, "race_focus": 0.0}) == 3
+    reweighted = _scores(FinalScores, "final_score")
+    # An incremental run after reweighting rebuilds everything with one weighting
+    assert calculator.get_state() is None
+
+    # The final stage is no longer cached, so a compute with the same weights rebuilds it
+    weights = dict(calculator.weights)
+    calculator = OverallCalculator(test_db, {"csv_dir": csv_dir, "weights": weights})
+    calculator.compute_scores()
+    assert "final" in calculator.step_timings
+    recomputed = _scores(FinalScores, "final_score")
+    assert reweighted == pytest.approx(recomputed)
+
+    with pytest.raises(ValueError):
+        calculator.reweight({"popularity": 1.0})
+    with pytest.raises(ValueError):
+        calculator.reweight(dict.fromkeys(weights, 0.0))
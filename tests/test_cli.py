@@ -0,0 +1,68 @@
+"""Tests for the command-line interface."""
+
+import pytest
+from click.testing import CliRunner
+from peewee import SqliteDatabase
+
+from bedfellows.cli import cli
+from bedfellows.models import FinalScores, create_all_tables, init_models
+
+
+@pytest.fixture
+def scored_project(tmp_path, monkeypatch):
+    """Write a config, reference CSVs and a database with one final score."""
+    monkeypatch.chdir(tmp_path)
+    for name in ("DATABASE_TYPE", "SQLITE_PATH", "CSV_DIR"):
+        monkeypatch.delenv(name, raising=False)
+
+    csv_dir = tmp_path / "reference"
+    csv_dir.mkdir()
+    (csv_dir / "score_weights.csv").write_text("score_type,weight\nexclusivity,3.0\n")
+    db_path = tmp_path / "bedfellows.db"
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(
+        f"[database]\ntype = sqlite\nsqlite_path = {db_path}\n\n[fec]\ncsv_dir = {csv_dir}\n"
+    )
+
+    db = SqliteDatabase(str(db_path))
+    init_models(db)
+    create_all_tables()
+    # Final score with exclusivity weighted 3.0 by score_weights.csv: (2.7 + 0.1) / 8
+    FinalScores.create(
+        fec_committee_id="C00000001",
+        contributor_name="PAC C00000001",
+        other_id="C00000100",
+        recipient_name="RECIPIENT C00000100",
+        count=1,
+        exclusivity_score=0.9,
+        report_type_score=0.1,
+        periodicity_score=0.0,
+        maxed_out_score=0.0,
+        length_score=0.0,
+        race_focus_score=0.0,
+        final_score=0.35,
+    )
+    db.close()
+    return str(config_file), db
+
+
+def _final_score(db):
+    db.connect(reuse_if_open=True)
+    init_models(db)
+    score = FinalScores.get().final_score
+    db.close()
+    return score
+
+
+def test_reweight_keeps_score_weights_from_csv_dir(scored_project):
+    """Test reweight starts from the score_weights.csv in the configured csv_dir."""
+    config_file, db = scored_project
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["--config", config_file, "reweight"])
+    assert result.exit_code == 0, result.output
+    assert _final_score(db) == pytest.approx(0.35)
+
+    result = runner.invoke(cli, ["--config", config_file, "reweight", "--race-focus", "0"])
+    assert result.exit_code == 0, result.output
+    assert _final_score(db) == pytest.approx(2.8 / 7)
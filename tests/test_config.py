@@ -74,6 +74,10 @@ postgres_port = 5433
 
 [fec]
 data_dir = /tmp/data
+
+[similarity]
+memory_mb = 2048
+ann = yes
 """)
         config_file = f.name
 
@@ -84,5 +88,34 @@ data_dir = /tmp/data
         assert config["postgres_host"] == "pghost"
         assert config["postgres_port"] == 5433
         assert config["data_dir"] == "/tmp/data"
+        assert config["similarity_memory_mb"] == 2048
+        assert config["similarity_top_k"] == 10
+        assert config["similarity_ann"] is True
+        assert config["similarity_ann_probes"] == 8
+    finally:
+        os.unlink(config_file)
+
+
+def test_get_contribution_filters():
+    """Test contribution filters parse from file and can be disabled."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
+        f.write("""[filters]
+transaction_types = 24K, 24Z
+entity_types =
+exclude_super_pacs = false
+""")
+        config_file = f.name
+
+    try:
+        defaults = Config(load_env=False).get_contribution_filters()
+        assert defaults["transaction_types"] == ["24K"]
+        assert defaults["entity_types"] == ["PAC", "CCM"]
+        assert defaults["exclude_super_pacs"] is True
+
+        filters = Config(config_file=config_file, load_env=False).get_contribution_filters()
+        assert filters["transaction_types"] == ["24K", "24Z"]
+        assert filters["entity_types"] is None
+        assert filters["min_date"] == "2003-01-01"
+        assert filters["exclude_super_pacs"] is False
     finally:
         os.unlink(config_file)
@@ -0,0 +1,339 @@
+"""Tests for FEC data loaders."""
+
+import zipfile
+
+import pytest
+from peewee import SqliteDatabase
+
+from bedfellows.loaders import (
+    IngestStats,
+    SqliteBulkLoader,
+    iter_parsed_batches,
+    split_byte_ranges,
+    stream_insert,
+)
+from bedfellows.loaders.bulk import RowStream, format_copy_line
+from bedfellows.loaders.sources import open_source
+from bedfellows.models import (
+    ContributionChanges,
+    FecCandidates,
+    FecCommitteeContributions,
+    FecCommittees,
+    FecContributions,
+    create_all_tables,
+    init_models,
+    prepare_contribution_row,
+)
+
+CANDIDATE_LINES = [
+    "H0TX01234|SMITH, JANE|DEM|2024|TX|H|01|C|N|C00111111|1 MAIN ST||AUSTIN|TX|78701",
+    "S4CA00001|DOE, JOHN|REP|2024|CA|S|00|I|C|C00222222|2 OAK AVE||FRESNO|CA|93650",
+    "P40000001|ROE, ALEX|IND|2024|US|P|00|O|N|C00333333|3 ELM RD||DOVER|DE|19901",
+]
+
+CONTRIBUTION_LINES = [
+    "C00111111|N|Q1|P2024|123|24K|PAC|DONOR PAC|DC|DC|20001|||01152024|5000|"
+    "C00222222|RECIPIENT ONE|SA11|4001|||1001",
+    "C00111111|A|Q2|G2024|124|24K|PAC|DONOR PAC|DC|DC|20001|||04302024|2500|"
+    "C00333333|RECIPIENT TWO|SA12|4002|||1002",
+    "C00444444|N|YE|G2022|125|24K|CCM|OTHER PAC|NY|NY|10001|||13452022|abc|"
+    "C00222222|RECIPIENT ONE|SA13|4003|||1003",
+]
+
+
+@pytest.fixture
+def test_db():
+    """Create an in-memory test database."""
+    db = SqliteDatabase(":memory:")
+    init_models(db)
+    create_all_tables()
+    return db
+
+
+@pytest.fixture
+def candidate_file(tmp_path):
+    """Write a small pipe-delimited candidate master file."""
+    path = tmp_path / "cn.txt"
+    path.write_text("\n".join(CANDIDATE_LINES) + "\n")
+    return path
+
+
+@pytest.fixture
+def contribution_file(tmp_path):
+    """Write a small pipe-delimited committee contributions file."""
+    path = tmp_path / "itpas2.txt"
+    path.write_text("\n".join(CONTRIBUTION_LINES) + "\n")
+    return path
+
+
+def test_load_candidates_streaming(test_db, candidate_file):
+    """Test candidates load in small batches inside a transaction."""
+    count = FecCandidates.load_from_csv(str(candidate_file), batch_size=2)
+
+    assert count == 3
+    assert FecCandidates.select().count() == 3
+    jane = FecCandidates.get(FecCandidates.fecid == "H0TX01234")
+    assert jane.office_state == "TX"
+    assert jane.fec_committee_id == "C00111111"
+
+
+def test_load_contributions_parses_fields(test_db, contribution_file):
+    """Test contribution dates and amounts are parsed while streaming."""
+    count = FecCommitteeContributions.load_from_csv(
+        str(contribution_file), batch_size=1, commit_every=2
+    )
+
+    assert count == 3
+    first = FecCommitteeContributions.get(FecCommitteeContributions.transaction_id == "SA11")
+    assert first.amount == 5000
+    assert first.date.year == 2024 and first.date.month == 1 and first.date.day == 15
+
+    # Invalid month and amount become NULL rather than failing the load
+    bad = FecCommitteeContributions.get(FecCommitteeContributions.transaction_id == "SA13")
+    assert bad.date is None
+    assert bad.amount is None
+
+
+def test_cycle_derived_at_ingest(test_db, tmp_path):
+    """Test cycles come from the date, or the file name when the date is invalid."""
+    path = tmp_path / "pas222.txt"
+    path.write_text("\n".join(CONTRIBUTION_LINES) + "\n")
+
+    for loader in (None, SqliteBulkLoader(test_db)):
+        FecCommitteeContributions.delete().execute()
+        FecCommitteeContributions.load_from_csv(str(path), loader=loader)
+        cycles = {
+            row.transaction_id: row.cycle for row in FecCommitteeContributions.select()
+        }
+        assert cycles == {"SA11": "2024", "SA12": "2024", "SA13": "2022"}
+
+    committee_file = tmp_path / "cm24.txt"
+    committee_file.write_text("C00111111|DONOR PAC||||||||Q|||||\n")
+    FecCommittees.load_from_csv(str(committee_file))
+    assert FecCommittees.get().cycle == "2024"
+
+
+def test_stream_insert_stats(test_db):
+    """Test stream_insert reports rows, batches and throughput."""
+    rows = ({"fecid": f"C{i:08d}", "name": f"PAC {i}"} for i in range(25))
+    stats = stream_insert(FecCommittees, rows, batch_size=10, commit_every=1)
+
+    assert isinstance(stats, IngestStats)
+    assert stats.count == 25
+    assert stats.batches == 3
+    assert FecCommittees.select().count() == 25
+    assert stats.as_dict()["rows"] == 25
+    assert "fec_committees" in stats.summary()
+
+
+def _raw_rows(db):
+    """Fetch contribution rows as stored, excluding the primary key."""
+    cursor = db.execute_sql(
+        "SELECT * FROM fec_committee_contributions ORDER BY transaction_id"
+    )
+    return [row[1:] for row in cursor.fetchall()]
+
+
+def test_bulk_load_matches_orm_path(test_db, contribution_file):
+    """Test the SQLite executemany fast path stores the same rows as the ORM path."""
+    FecCommitteeContributions.load_from_csv(str(contribution_file))
+    orm_rows = _raw_rows(test_db)
+
+    FecCommitteeContributions.delete().execute()
+    count = FecCommitteeContributions.load_from_csv(
+        str(contribution_file), loader=SqliteBulkLoader(test_db, batch_size=2)
+    )
+
+    assert count == 3
+    assert _raw_rows(test_db) == orm_rows
+
+
+def test_copy_text_format():
+    """Test rows are escaped for COPY / LOAD DATA text format."""
+    line = format_copy_line(("A\tB", None, 5, "x\ty\nz"))
+    assert line == "A\\tB\t\\N\t5\tx\\ty\\nz\n"
+
+    stream = RowStream([("a", 1), ("b", None)])
+    assert stream.read(3) == "a\t1"
+    assert stream.read() == "\nb\t\\N\n"
+    assert stream.read() == ""
+    assert stream.count == 2
+
+
+def test_load_contributions_from_zip(test_db, tmp_path):
+    """Test contributions stream straight out of a pas2 ZIP archive."""
+    archive = tmp_path / "pas224.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("itpas2.txt", "\n".join(CONTRIBUTION_LINES) + "\n")
+
+    count = FecCommitteeContributions.load_from_csv(str(archive))
+    assert count == 3
+
+    FecCommitteeContributions.delete().execute()
+    count = FecCommitteeContributions.load_from_csv(
+        str(archive), loader=SqliteBulkLoader(test_db)
+    )
+    assert count == 3
+    assert not (tmp_path / "itpas2.txt").exists()
+
+
+def test_open_source_picks_largest_text_member(tmp_path):
+    """Test the data file is chosen over small companion files in an archive."""
+    archive = tmp_path / "cn24.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("readme.txt", "header")
+        zf.writestr("cn.txt", "\n".join(CANDIDATE_LINES))
+
+    with open_source(archive) as f:
+        assert f.readline().startswith("H0TX01234|")
+
+    with pytest.raises(FileNotFoundError):
+        with open_source(tmp_path / "missing.zip"):
+            pass
+
+
+def test_split_byte_ranges_on_line_boundaries(contribution_file):
+    """Test byte ranges cover the file and never cut a line."""
+    data = contribution_file.read_bytes()
+    ranges = split_byte_ranges(contribution_file, chunk_bytes=40)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges[:-1], ranges[1:], strict=True):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_parallel_load_matches_serial(test_db, contribution_file):
+    """Test the multiprocess parser stores the same rows as the serial path."""
+    FecCommitteeContributions.load_from_csv(str(contribution_file))
+    serial_rows = _raw_rows(test_db)
+
+    FecCommitteeContributions.delete().execute()
+    batches = list(
+        iter_parsed_batches(contribution_file, prepare_contribution_row, workers=2, chunk_bytes=40)
+    )
+    assert len(batches) == 3
+
+    count = FecCommitteeContributions.load_from_csv(str(contribution_file), workers=2)
+    assert count == 3
+    assert _raw_rows(test_db) == serial_rows
+
+    FecCommitteeContributions.delete().execute()
+    count = FecCommitteeContributions.load_from_csv(
+        str(contribution_file), loader=SqliteBulkLoader(test_db), workers=2
+    )
+    assert count == 3
+    assert _raw_rows(test_db) == serial_rows
+
+
+def test_incremental_load_upserts_changed_rows(test_db, contribution_file, tmp_path):
+    """Test re-loading a refreshed file only inserts new and updates changed rows."""
+    FecCommitteeContributions.load_from_csv(str(contribution_file))
+    FecCommitteeContributions.load_from_csv(str(contribution_file))
+    assert FecCommitteeContributions.select().count() == 6
+
+    refreshed = tmp_path / "itpas2_refreshed.txt"
+    refreshed.write_text(
+        "\n".join(
+            [
+                CONTRIBUTION_LINES[0],
+                # Same transaction identity, corrected amount
+                CONTRIBUTION_LINES[1].replace("|2500|", "|2700|"),
+                CONTRIBUTION_LINES[2],
+                "C00555555|N|Q3|G2024|126|24K|PAC|NEW PAC|VA|VA|22201|||07012024|1000|"
+                "C00222222|RECIPIENT ONE|SA14|4004|||1004",
+            ]
+        )
+        + "\n"
+    )
+
+    stats = FecCommitteeContributions.upsert_from_csv(str(refreshed), batch_size=2)
+
+    # Duplicates from the append-only loads are collapsed before merging
+    assert FecCommitteeContributions.select().count() == 4
+    assert (stats.inserted, stats.updated, stats.unchanged) == (1, 1, 2)
+    corrected = FecCommitteeContributions.get(FecCommitteeContributions.transaction_id == "SA12")
+    assert corrected.amount == 2700
+
+    again = FecCommitteeContributions.upsert_from_csv(str(refreshed))
+    assert (again.inserted, again.updated, again.unchanged) == (0, 0, 4)
+    assert "_staging" not in " ".join(test_db.get_tables())
+
+
+def test_incremental_load_supersedes_amendments(test_db, contribution_file, tmp_path):
+    """Test an amended filing replaces the earlier copy of the same transaction."""
+    FecCommitteeContributions.load_from_csv(str(contribution_file))
+
+    amended = tmp_path / "itpas2_amended.txt"
+    amended.write_text(
+        "C00111111|A|Q1|P2024|127|24K|PAC|DONOR PAC|DC|DC|20001|||01152024|5500|"
+        "C00222222|RECIPIENT ONE|SA11|10001|||2001\n"
+    )
+
+    stats = FecCommitteeContributions.upsert_from_csv(
+        str(amended), loader=SqliteBulkLoader(test_db)
+    )
+
+    assert stats.inserted == 1
+    assert stats.superseded == 1
+    rows = FecCommitteeContributions.select().where(
+        FecCommitteeContributions.transaction_id == "SA11"
+    )
+    assert [(row.filing_id, row.amount) for row in rows] == [("10001", 5500)]
+    assert FecCommitteeContributions.select().count() == 3
+
+
+def test_incremental_load_logs_changes_for_refresh(test_db, contribution_file, tmp_path):
+    """Test rows an upsert changes or supersedes are logged and their copies replaced."""
+    FecCommitteeContributions.load_from_csv(str(contribution_file))
+    FecContributions.load_from_committee_contributions()
+    assert sorted(row.amount_cents for row in FecContributions.select()) == [250000, 500000]
+
+    refreshed = tmp_path / "itpas2_refreshed.txt"
+    refreshed.write_text(
+        "\n".join(
+            [
+                # Amended copy of SA11 under a newer filing
+                "C00111111|A|Q1|P2024|127|24K|PAC|DONOR PAC|DC|DC|20001|||01152024|5500|"
+                "C00222222|RECIPIENT ONE|SA11|10001|||2001",
+                CONTRIBUTION_LINES[1].replace("|2500|", "|25000|"),
+            ]
+        )
+        + "\n"
+    )
+    FecCommitteeContributions.upsert_from_csv(str(refreshed))
+    assert sorted(row.source_id for row in ContributionChanges.select()) == [1, 2]
+
+    # The amended row (id 4) is new, so it is left to the next append
+    assert FecContributions.refresh_changed(max_source_id=3) == 2
+    assert [row.amount_cents for row in FecContributions.select()] == [2500000]
+    assert ContributionChanges.select().count() == 0
+    FecContributions.load_from_committee_contributions(min_id=3)
+    assert sorted(row.amount_cents for row in FecContributions.select()) == [550000, 2500000]
+
+
+def test_bulk_load_defers_indexes(tmp_path, contribution_file):
+    """Test bulk-load mode loads without secondary indexes and rebuilds them after."""
+    from bedfellows.config import Config
+    from bedfellows.database import DatabaseManager
+
+    config = Config(load_env=False)
+    config["sqlite_path"] = str(tmp_path / "bulk.db")
+    manager = DatabaseManager(config)
+    db = manager.get_database()
+    init_models(db)
+    create_all_tables()
+    indexes = {index.name for index in db.get_indexes("fec_committee_contributions")}
+
+    with manager.bulk_load([FecCommitteeContributions]) as stats:
+        assert db.get_indexes("fec_committee_contributions") == []
+        FecCommitteeContributions.load_from_csv(str(contribution_file))
+
+    assert {index.name for index in db.get_indexes("fec_committee_contributions")} == indexes
+    assert stats.indexes == len(indexes)
+    assert stats.as_dict()["index_seconds"] >= 0
+    # ANALYZE recorded planner statistics for the table
+    analyzed = db.execute_sql("SELECT DISTINCT tbl FROM sqlite_stat1").fetchall()
+    assert ("fec_committee_contributions",) in analyzed
+    manager.close()
@@ -6,7 +6,9 @@ from peewee import SqliteDatabase
 from bedfellows.models import (
     init_models,
     create_all_tables,
+    CommitteeDim,
     FecCandidates,
+    FecCommitteeContributions,
     FecCommittees,
     FecContributions,
     FinalScores,
@@ -100,3 +102,112 @@ def test_model_relationships(test_db):
     )
 
     assert contribs.count() == 3
+
+
+def test_committee_keys_assigned_at_load(test_db):
+    """Test loaded contributions get stable integer committee keys."""
+    from datetime import datetime
+
+    for contributor, recipient in [("C00111111", "C00222222"), ("C00222222", "C00333333")]:
+        FecCommitteeContributions.create(
+            fec_committee_id=contributor,
+            other_id=recipient,
+            amount=500,
+            date=datetime(2024, 1, 15),
+            transaction_type="24K",
+            entity_type="PAC",
+        )
+    assert FecContributions.load_from_committee_contributions() == 2
+    keys = {row.fecid: row.committee_key for row in CommitteeDim.select()}
+    assert sorted(keys) == ["C00111111", "C00222222", "C00333333"]
+
+    # A committee seen as donor and recipient has one key
+    second = FecContributions.get(FecContributions.fec_committee_id == "C00222222")
+    first = FecContributions.get(FecContributions.other_id == "C00222222")
+    assert second.contributor_key == first.recipient_key == keys["C00222222"]
+
+    # New committees get new keys; existing ones keep theirs
+    FecCommitteeContributions.create(
+        fec_committee_id="C00444444",
+        other_id="C00111111",
+        amount=100,
+        date=datetime(2024, 2, 1),
+        transaction_type="24K",
+        entity_type="PAC",
+    )
+    FecContributions.load_from_committee_contributions(min_id=2)
+    assert CommitteeDim.get(CommitteeDim.fecid == "C00111111").committee_key == keys["C00111111"]
+    assert CommitteeDim.select().count() == 4
+    assert FecContributions.select().where(FecContributions.recipient_key.is_null()).count() == 0
+
+
+def test_load_filters_pushed_down(test_db):
+    """Test source rows are filtered in the database before they are copied."""
+    from datetime import datetime
+
+    FecCommittees.create(fecid="C00999999", name="SUPER PAC", is_super_pac=True)
+    base = {
+        "amount": 100,
+        "date": datetime(2024, 1, 15),
+        "transaction_type": "24K",
+        "entity_type": "PAC",
+    }
+    rows = [
+        ("C00111111", "C00222222", {}),  # kept
+        ("C00111111", "C00333333", {"entity_type": "CCM"}),  # kept
+        ("C00111111", "C00222222", {"transaction_type": "24E"}),
+        ("C00111111", "C00222222", {"entity_type": "IND"}),
+        ("C00111111", "C00222222", {"date": datetime(2001, 5, 1)}),
+        ("C00999999", "C00222222", {}),
+        ("C00111111", "C00999999", {}),
+        ("C00111111", None, {}),
+    ]
+    for contributor, recipient, overrides in rows:
+        FecCommitteeContributions.create(
+            fec_committee_id=contributor, other_id=recipient, **{**base, **overrides}
+        )
+
+    assert FecContributions.load_from_committee_contributions() == 2
+    # Source rows without a cycle get the one their date falls in
+    assert {row.cycle for row in FecContributions.select()} == {"2024"}
+
+    # Disabled filters let those rows through; NULL committee ids never load
+    FecContributions.delete().execute()
+    filters = {
+        "transaction_types": None,
+        "entity_types": None,
+        "min_date": None,
+        "exclude_super_pacs": False,
+    }
+    assert FecContributions.load_from_committee_contributions(filters=filters) == 7
+
+
+def test_sync_rebuilds_when_filters_change(test_db):
+    """Test changed filters or super PAC designations rebuild every filtered row."""
+    from datetime import datetime
+
+    committee = FecCommittees.create(fecid="C00999999", name="NEW SUPER PAC")
+    for recipient, entity_type in [("C00222222", "PAC"), ("C00999999", "PAC"), ("C00333333", "IND")]:
+        FecCommitteeContributions.create(
+            fec_committee_id="C00111111",
+            other_id=recipient,
+            amount=100,
+            date=datetime(2024, 1, 15),
+            transaction_type="24K",
+            entity_type=entity_type,
+        )
+
+    assert FecContributions.load_from_committee_contributions() == 2
+    assert FecContributions.sync_from_committee_contributions() == (0, 0, False)
+
+    # Rows already copied are filtered again, not only the ones appended later
+    filters = {"entity_types": None}
+    assert FecContributions.sync_from_committee_contributions(filters) == (0, 3, True)
+    assert FecContributions.select().count() == 3
+    assert FecContributions.sync_from_committee_contributions(filters) == (0, 0, False)
+
+    committee.is_super_pac = True
+    committee.save()
+    assert FecContributions.filters_changed(filters)
+    assert FecContributions.sync_from_committee_contributions(filters) == (0, 2, True)
+    assert {row.other_id for row in FecContributions.select()} == {"C00222222", "C00333333"}
@@ -0,0 +1,205 @@
+"""Tests for cosine similarity."""
+
+import numpy as np
+import pytest
+from peewee import SqliteDatabase
+from scipy import sparse
+
+from bedfellows.ann import PairAnnIndex, pair_names, recall
+from bedfellows.models import FinalScores, SimilarCommittees, create_all_tables, init_models
+from bedfellows.similarity import (
+    Similarity,
+    SimilarityIndex,
+    block_rows,
+    compute_similar_committees,
+    matrix_bytes,
+    top_k,
+)
+
+# (contributor, recipient, final score, component scores)
+SCORES = [
+    ("C00000001", "C00000100", 0.9, [0.9, 0.1, 0.0, 0.0, 0.0, 0.0]),
+    ("C00000001", "C00000200", 0.3, [0.3, 0.1, 0.0, 0.0, 0.0, 0.0]),
+    ("C00000002", "C00000100", 0.8, [0.8, 0.2, 0.0, 0.0, 0.0, 0.0]),
+    ("C00000002", "C00000200", 0.4, [0.0, 0.0, 0.4, 0.0, 0.0, 0.0]),
+    ("C00000003", "C00000300", 0.5, [0.0, 0.0, 0.0, 0.5, 0.5, 0.0]),
+]
+
+
+@pytest.fixture
+def scores_db():
+    """Create an in-memory database with a few final scores."""
+    db = SqliteDatabase(":memory:")
+    init_models(db)
+    create_all_tables()
+    for contributor, recipient, final, components in SCORES:
+        exclusivity, report_type, periodicity, maxed_out, length, race_focus = components
+        FinalScores.create(
+            fec_committee_id=contributor,
+            contributor_name=f"PAC {contributor}",
+            other_id=recipient,
+            recipient_name=f"RECIPIENT {recipient}",
+            count=1,
+            exclusivity_score=exclusivity,
+            report_type_score=report_type,
+            periodicity_score=periodicity,
+            maxed_out_score=maxed_out,
+            length_score=length,
+            race_focus_score=race_focus,
+            final_score=final,
+        )
+    return db
+
+
+def test_top_k_orders_best_first():
+    """Test top_k returns the highest scores in order and skips the excluded one."""
+    scores = np.array([0.2, 0.9, 0.5, 1.0, 0.1])
+    assert top_k(scores.copy(), 3).tolist() == [3, 1, 2]
+    assert top_k(scores.copy(), 3, exclude=3).tolist() == [1, 2, 0]
+    assert top_k(scores.copy(), 10, exclude=0).tolist() == [3, 1, 2, 4]
+
+
+def test_index_matches_brute_force_cosine():
+    """Test sparse top-k queries agree with cosines computed pair by pair."""
+    rng = np.random.default_rng(0)
+    matrix = sparse.random(200, 50, density=0.1, format="csr", random_state=1)
+    index = SimilarityIndex([f"C{i:08d}" for i in range(200)], matrix)
+
+    dense = matrix.toarray()
+    query = int(rng.integers(200))
+    expected = []
+    for i in range(200):
+        norms = np.linalg.norm(dense[query]) * np.linalg.norm(dense[i])
+        expected.append(dense[query] @ dense[i] / norms if norms else 0.0)
+    expected = np.array(expected)
+
+    assert index.scores(f"C{query:08d}") == pytest.approx(expected)
+    results = index.most_similar(f"C{query:08d}", 5)
+    assert [score for _, _, score in results] == pytest.approx(
+        sorted(np.delete(expected, query), reverse=True)[:5]
+    )
+
+
+def test_similarity_from_final_scores(scores_db):
+    """Test contributors, recipients and pairs are compared by their score vectors."""
+    similarity = Similarity.from_database(scores_db)
+
+    # Both give mostly to C00000100; C00000003 shares no recipient
+    contributors = similarity.most_similar("contributor", "C00000001")
+    assert [key for key, _, _ in contributors] == ["C00000002", "C00000003"]
+    assert contributors[0][1] == "PAC C00000002"
+    assert contributors[0][2] == pytest.approx(
+        (0.9 * 0.8 + 0.3 * 0.4) / (np.hypot(0.9, 0.3) * np.hypot(0.8, 0.4))
+    )
+    assert contributors[1][2] == 0
+
+    recipients = similarity.most_similar("recipient", "C00000100", 1)
+    assert recipients[0][0] == "C00000200"
+
+    pairs = similarity.most_similar("pair", ("C00000001", "C00000100"), 2)
+    assert [key for key, _, _ in pairs] == [
+        ("C00000002", "C00000100"),
+        ("C00000001", "C00000200"),
+    ]
+
+    with pytest.raises(ValueError):
+        similarity.most_similar("contributor", "C99999999")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_all_top_k_matches_single_queries(workers):
+    """Test blocked all-pairs neighbours agree with one query per row."""
+    matrix = sparse.random(300, 40, density=0.1, format="csr", random_state=2)
+    index = SimilarityIndex([f"C{i:08d}" for i in range(300)], matrix)
+    # Room for the matrix copies plus a few dozen query rows per block
+    held = matrix_bytes(index.vectors) * (workers + 1)
+    memory_mb = (held + 40 * workers * (20 * 300 + 8 * 40)) / 2**20
+    assert block_rows(index.vectors.shape, matrix_bytes(index.vectors), memory_mb, workers) == 40
+
+    blocks = list(index.all_top_k(5, memory_mb, workers))
+    assert [start for start, _, _ in blocks] == list(range(0, 300, 40))
+    for start, neighbours, scores in blocks:
+        for row in range(len(neighbours)):
+            expected = index.most_similar(index.keys[start + row], 5)
+            assert scores[row] == pytest.approx([score for _, _, score in expected])
+
+
+def test_block_rows_rejects_small_budget():
+    """Test a budget that can't hold the score matrix is an error."""
+    with pytest.raises(ValueError):
+        block_rows((1000, 1000), 2**20, memory_mb=1, workers=1)
+
+
+def test_compute_similar_committees(scores_db):
+    """Test the batch job writes ranked neighbours with positive similarity."""
+    written = compute_similar_committees(scores_db, k=5, memory_mb=16)
+
+    rows = {
+        (row.kind, row.fec_committee_id, row.rank): (row.similar_id, row.similarity)
+        for row in SimilarCommittees.select()
+    }
+    assert written == len(rows)
+    assert rows[("contributor", "C00000001", 1)][0] == "C00000002"
+    # C00000003 shares no recipient with anyone
+    assert ("contributor", "C00000001", 2) not in rows
+    assert not any(key[1] == "C00000003" for key in rows)
+    assert rows[("recipient", "C00000100", 1)][0] == "C00000200"
+
+
+def test_pair_ann_index_agrees_with_exact_search(tmp_path):
+    """Test the approximate index finds the exact neighbours and survives a round trip."""
+    rng = np.random.default_rng(3)
+    pairs = rng.choice(60 * 60, 2000, replace=False)
+    contributors = np.array([f"C{i:08d}" for i in pairs // 60])
+    recipients = np.array([f"C{i:08d}" for i in 100 + pairs % 60])
+    vectors = rng.random((len(pairs), 6))
+    index = PairAnnIndex.build(contributors, recipients, vectors, n_lists=20)
+
+    query = (contributors[0], recipients[0])
+    exact = index.exact(*query, k=10)
+    # Searching every list is an exact search
+    assert index.search(*query, k=10, n_probe=20) == exact
+    assert recall(index.search(*query, k=10, n_probe=8), exact) >= 0.8
+
+    loaded = PairAnnIndex.load(index.save(tmp_path / "scores.ann.npz"))
+    assert loaded.search(*query, k=10) == index.search(*query, k=10)
+    with pytest.raises(ValueError):
+        index.position("C99999999", recipients[0])
+
+
+def test_pair_ann_index_from_final_scores(scores_db):
+    """Test the index reads final_scores and notices when they change."""
+    index = PairAnnIndex.from_database(scores_db)
+    assert len(index) == len(SCORES)
+    assert index.is_current(scores_db)
+    assert [pair for pair, _ in index.search("C00000001", "C00000100", 2)] == [
+        ("C00000002", "C00000100"),
+        ("C00000001", "C00000200"),
+    ]
+
+    FinalScores.create(
+        fec_committee_id="C00000004",
+        contributor_name="PAC C00000004",
+        other_id="C00000300",
+        recipient_name="RECIPIENT C00000300",
+        count=1,
+        exclusivity_score=1.0,
+        report_type_score=0.0,
+        periodicity_score=0.0,
+        maxed_out_score=0.0,
+        length_score=0.0,
+        race_focus_score=0.0,
+        final_score=0.2,
+    )
+    assert not index.is_current(scores_db)
+
+
+def test_pair_names_in_result_order(scores_db):
+    """Test pair names come back in the order the pairs were given."""
+    pairs = [("C00000002", "C00000100"), ("C00000001", "C00000200"), ("C00000009", "C00000100")]
+    assert pair_names(scores_db, pairs) == [
+        "PAC C00000002 → RECIPIENT C00000100",
+        "PAC C00000001 → RECIPIENT C00000200",
+        " → ",
+    ]
+    assert pair_names(scores_db, []) == []
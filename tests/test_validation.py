@@ -102,9 +102,21 @@ def test_validate_contributions(test_db):
         cycle="2024"
     )
 
+    FecContributions.create(
+        fec_committee_id="C00111111",
+        contributor_name="DONOR",
+        other_id="C00222222",
+        recipient_name="RECIPIENT",
+        amount="-250",  # Refund
+        date=datetime(2024, 2, 1),
+        cycle="2024"
+    )
+
     validator = DataValidator(test_db)
     results = validator.validate_all()
 
     # Should have warnings about missing data
     assert any("missing amount" in str(w) for w in results["warnings"])
     assert any("missing date" in str(w) for w in results["warnings"])
+    assert any("1 contributions with negative amounts" in str(w) for w in results["warnings"])
+    assert results["stats"]["contributions_valid"] == 2